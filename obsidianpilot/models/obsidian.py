@@ -2,7 +2,12 @@
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+try:
+    import orjson
+except ImportError:  # Optional: properties text falls back to a Python join
+    orjson = None
 
 
 class NoteMetadata(BaseModel):
@@ -13,6 +18,43 @@ class NoteMetadata(BaseModel):
     tags: List[str] = Field(default_factory=list, description="List of tags")
     aliases: List[str] = Field(default_factory=list, description="Alternative names for the note")
     frontmatter: Dict[str, Any] = Field(default_factory=dict, description="Raw frontmatter data")
+    
+    _fts_properties: Optional[str] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        # A new frontmatter invalidates the memoized search text
+        if name == "frontmatter":
+            self._fts_properties = None
+        super().__setattr__(name, value)
+    
+    def fts_properties(self) -> str:
+        """
+        Frontmatter (except tags) as text for the search index.
+        
+        Serialized as JSON by orjson when it is installed, otherwise as
+        space-separated key:value pairs; the FTS tokenizer drops the
+        punctuation either way. Computed on first use and memoized until
+        frontmatter is reassigned.
+        """
+        if self._fts_properties is None and orjson is not None:
+            try:
+                self._fts_properties = orjson.dumps(
+                    {key: value for key, value in self.frontmatter.items() if key != 'tags'},
+                    default=str,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                ).decode('utf-8')
+            except TypeError:
+                pass  # Not serializable; use the join below
+        if self._fts_properties is None:
+            properties = []
+            for key, value in self.frontmatter.items():
+                if key != 'tags':  # Tags are indexed separately
+                    if isinstance(value, list):
+                        properties.append(f"{key}:{' '.join(str(v) for v in value)}")
+                    else:
+                        properties.append(f"{key}:{value}")
+            self._fts_properties = ' '.join(properties)
+        return self._fts_properties
 
 
 class Note(BaseModel):
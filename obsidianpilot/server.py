@@ -2,7 +2,7 @@
 
 import os
 import logging
-from typing import Annotated, Optional, List, Literal
+from typing import Annotated, Optional, List, Literal, Dict
 from pydantic import Field
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
@@ -27,6 +27,7 @@ from .tools import (
     search_by_date,
     search_by_regex,
     search_by_property,
+    search_by_properties,
     list_notes,
     list_folders,
     move_note,
@@ -42,6 +43,9 @@ from .tools import (
     find_broken_links,
     read_image,
     view_note_images,
+    read_notes_batch,
+    update_notes_batch,
+    add_tags_batch,
 )
 
 # Import fast search tools
@@ -148,6 +152,47 @@ async def read_note_tool(
     except Exception as e:
         raise ToolError(f"Failed to read note: {str(e)}")
 
+@mcp.tool()
+async def read_notes_batch_tool(
+    paths: Annotated[List[str], Field(
+        description="Notes to read, each a path within your vault (e.g., 'Projects/AI Research.md')",
+        min_length=1,
+        max_length=100,
+        examples=[["Daily/2024-01-15.md", "Daily/2024-01-16.md"]]
+    )],
+    include_outgoing_links: Annotated[bool, Field(
+        description="Include all links from each note with resolved file paths",
+        default=False
+    )] = False,
+    include_backlinks: Annotated[bool, Field(
+        description="Include all notes that link to each note",
+        default=False
+    )] = False,
+    ctx=None
+):
+    """
+    Read the content and metadata of several notes in one call.
+    
+    When to use:
+    - Reading a known set of notes (e.g., from search results) at once
+    - Any workflow that would otherwise call read_note repeatedly
+    
+    When NOT to use:
+    - Reading a single note (use read_note)
+    - Finding notes by content (use search_notes)
+    
+    Returns:
+        One result per path, in order, each shaped like read_note's result.
+        A note that can't be read gets {"success": false, "path", "error"}
+        instead of failing the whole batch; summary counts the failures.
+    """
+    try:
+        return await read_notes_batch(paths, include_outgoing_links, include_backlinks, ctx)
+    except ValueError as e:
+        raise ToolError(str(e))
+    except Exception as e:
+        raise ToolError(f"Failed to read notes: {str(e)}")
+
 @mcp.tool()
 async def create_note_tool(
     path: Annotated[str, Field(
@@ -243,6 +288,48 @@ async def update_note_tool(
     except Exception as e:
         raise ToolError(f"Failed to update note: {str(e)}")
 
+@mcp.tool()
+async def update_notes_batch_tool(
+    items: Annotated[List[Dict], Field(
+        description=(
+            "One update per note: {'path': ..., 'content': ...} plus optional "
+            "'create_if_not_exists' (default false) and 'merge_strategy' ('replace' default, or 'append'). "
+            "Each note may appear only once."
+        ),
+        min_length=1,
+        max_length=100,
+        examples=[[
+            {"path": "Daily/2024-01-15.md", "content": "- Follow up with team", "merge_strategy": "append"},
+            {"path": "Ideas/New Idea.md", "content": "# New Idea", "create_if_not_exists": True}
+        ]]
+    )],
+    ctx=None
+):
+    """
+    Update several notes in one call, as update_note does for each.
+    
+    ⚠️ IMPORTANT: Items REPLACE their note's content unless merge_strategy is 'append'.
+    
+    When to use:
+    - Applying changes to many notes at once
+    - Appending the same kind of entry to several notes
+    
+    When NOT to use:
+    - Updating a single note (use update_note)
+    - Small in-place edits (use edit_note_content or edit_note_section)
+    
+    Returns:
+        One result per item, in order, each shaped like update_note's result.
+        A failed item gets {"success": false, "path", "error"} without
+        stopping the others; summary counts the failures.
+    """
+    try:
+        return await update_notes_batch(items, ctx)
+    except ValueError as e:
+        raise ToolError(str(e))
+    except Exception as e:
+        raise ToolError(f"Failed to update notes: {str(e)}")
+
 @mcp.tool()
 async def delete_note_tool(path: str, ctx=None):
     """
@@ -453,7 +540,10 @@ async def search_notes_tool(
     which may take 1-3 minutes for large vaults but dramatically speeds up all subsequent searches.
     
     Returns:
-        Fast search results with matched notes, relevance scores, and highlighted context
+        Fast search results with matched notes, relevance scores, and highlighted context.
+        Plain-text results are columnar: parallel "paths", "filenames", "contexts" and
+        "scores" lists in rank order (query type "fts5_full_text_v2"); tag: and path:
+        searches return the field-search shape (a list of result objects).
     """
     try:
         return await search_notes(query, max_results, context_length, ctx)
@@ -636,6 +726,46 @@ async def search_by_property_tool(
     except Exception as e:
         raise ToolError(f"Property search failed: {str(e)}")
 
+@mcp.tool()
+async def search_by_properties_tool(
+    filters: Annotated[List[Dict[str, str]], Field(
+        description="Property filters that must ALL match. Each is {\"property\": name, \"operator\": op, \"value\": value}; operator defaults to '=' and uses the same operators as search_by_property_tool.",
+        min_length=1,
+        examples=[[{"property": "status", "value": "active"}, {"property": "priority", "operator": ">", "value": "3"}]]
+    )],
+    context_length: Annotated[int, Field(
+        description="Characters of note content to include",
+        default=100,
+        ge=0,
+        le=500
+    )] = 100,
+    ctx=None
+):
+    """
+    Search for notes matching several frontmatter properties at once (AND).
+    
+    When to use:
+    - Combining property conditions (status = active AND priority > 3)
+    - Any time you would otherwise call search_by_property_tool several
+      times and intersect the results
+    
+    Each note's frontmatter is read once and checked against every filter,
+    so this is one pass over the vault instead of one per property.
+    
+    Examples:
+    - Active high-priority work: [{"property": "status", "value": "active"}, {"property": "priority", "operator": ">", "value": "3"}]
+    - Drafts with a deadline: [{"property": "status", "value": "draft"}, {"property": "deadline", "operator": "exists"}]
+    
+    Returns:
+        Notes matching all filters, with each matched property's value
+    """
+    try:
+        return await search_by_properties(filters, context_length, ctx)
+    except ValueError as e:
+        raise ToolError(str(e))
+    except Exception as e:
+        raise ToolError(f"Property search failed: {str(e)}")
+
 @mcp.tool()
 async def list_notes_tool(directory: str = None, recursive: bool = True, ctx=None):
     """
@@ -837,6 +967,45 @@ async def add_tags_tool(
     except Exception as e:
         raise ToolError(f"Failed to add tags: {str(e)}")
 
+@mcp.tool()
+async def add_tags_batch_tool(
+    paths: Annotated[List[str], Field(
+        description="Notes to tag; each note may appear only once",
+        min_length=1,
+        max_length=100,
+        examples=[["Projects/AI.md", "Projects/Web.md"]]
+    )],
+    tags: Annotated[List[str], Field(
+        description="Tags to add to every note. Don't include the # symbol. Supports hierarchical tags with forward slashes.",
+        min_length=1,
+        max_length=50,
+        examples=[["project", "urgent"], ["project/web"]]
+    )],
+    ctx=None
+):
+    """
+    Add the same tags to several notes' frontmatter in one call.
+    
+    When to use:
+    - Bulk tagging a set of related notes
+    - Applying a tag to every result of a search
+    
+    When NOT to use:
+    - Tagging a single note (use add_tags)
+    - Different tags per note (use add_tags for each)
+    
+    Returns:
+        One result per path, in order, each shaped like add_tags' result.
+        A failed note gets {"success": false, "path", "error"} without
+        stopping the others; summary counts the failures.
+    """
+    try:
+        return await add_tags_batch(paths, tags, ctx)
+    except ValueError as e:
+        raise ToolError(str(e))
+    except Exception as e:
+        raise ToolError(f"Failed to add tags: {str(e)}")
+
 @mcp.tool()
 async def update_tags_tool(
     path: Annotated[str, Field(
@@ -12,6 +12,7 @@ from .search_discovery import (
     search_by_date,
     search_by_regex,
     search_by_property,
+    search_by_properties,
     list_notes,
     list_folders,
 )
@@ -39,6 +40,11 @@ from .view_note_images import (
 from .fast_search import (
     search_notes,
 )
+from .batch_operations import (
+    read_notes_batch,
+    update_notes_batch,
+    add_tags_batch,
+)
 
 __all__ = [
     # Note management
@@ -53,6 +59,7 @@ __all__ = [
     "search_by_date",
     "search_by_regex",
     "search_by_property",
+    "search_by_properties",
     "list_notes",
     "list_folders",
     # Organization
@@ -71,4 +78,8 @@ __all__ = [
     # Image management
     "read_image",
     "view_note_images",
+    # Batch operations
+    "read_notes_batch",
+    "update_notes_batch",
+    "add_tags_batch",
 ]
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""Batch tools for Obsidian MCP server: one call operating on many notes."""
+
+import asyncio
+from typing import List, Dict, Any, Optional, Callable, Awaitable
+from fastmcp import Context
+from ..utils import sanitize_path
+from .note_management import read_note, update_note
+from .organization import add_tags
+
+# Maximum notes a batch processes at once
+BATCH_CONCURRENCY = 16
+
+# Maximum items one batch call accepts
+MAX_BATCH_SIZE = 100
+
+
+async def _run_batch(
+    paths: List[str],
+    operation: Callable[[int], Awaitable[dict]],
+    name: str
+) -> dict:
+    """
+    Run operation(i) for every item concurrently and collect per-item results.
+    
+    A failing item is reported as {"success": False, "path": ..., "error": ...}
+    in its position instead of aborting the rest of the batch.
+    """
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    async def run(i: int) -> dict:
+        async with semaphore:
+            return await operation(i)
+    
+    outcomes = await asyncio.gather(*(run(i) for i in range(len(paths))), return_exceptions=True)
+    
+    results = []
+    for path, outcome in zip(paths, outcomes):
+        if isinstance(outcome, Exception):
+            results.append({"success": False, "path": path, "error": str(outcome)})
+        else:
+            results.append(outcome)
+    failed = sum(1 for result in results if not result.get("success"))
+    
+    return {
+        "success": failed == 0,
+        "operation": name,
+        "results": results,
+        "summary": {
+            "total": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed
+        }
+    }
+
+
+def _check_batch_size(items: list, name: str) -> None:
+    """Reject empty batches and batches over MAX_BATCH_SIZE items."""
+    if not items:
+        raise ValueError(f"At least one {name} is required")
+    if len(items) > MAX_BATCH_SIZE:
+        raise ValueError(f"Too many {name}s in one batch: {len(items)} (max: {MAX_BATCH_SIZE})")
+
+
+def _check_unique_paths(paths: List[str]) -> None:
+    """Reject batches that would write the same note twice concurrently."""
+    seen = set()
+    for path in paths:
+        # "Note" and "Note.md" name the same file
+        note = sanitize_path(path)
+        if note in seen:
+            raise ValueError(f"Note appears more than once in the batch: {path}")
+        seen.add(note)
+
+
+async def read_notes_batch(
+    paths: List[str],
+    include_outgoing_links: bool = False,
+    include_backlinks: bool = False,
+    ctx: Optional[Context] = None
+) -> dict:
+    """
+    Read several notes in one call.
+    
+    Args:
+        paths: Paths to the notes relative to vault root (at most MAX_BATCH_SIZE)
+        include_outgoing_links: Include all links from each note (default: False)
+        include_backlinks: Include all notes that link to each note (default: False)
+        ctx: MCP context for progress reporting
+    
+    Returns:
+        Dictionary with one read_note result (or error) per path, in order
+    
+    Example:
+        >>> await read_notes_batch(["Daily/2024-01-15.md", "Missing.md"], ctx=ctx)
+        {
+            "success": false,
+            "operation": "batch_read",
+            "results": [
+                {"success": true, "path": "Daily/2024-01-15.md", "operation": "read", "details": {...}},
+                {"success": false, "path": "Missing.md", "error": "Note not found at path: 'Missing.md'. ..."}
+            ],
+            "summary": {"total": 2, "succeeded": 1, "failed": 1}
+        }
+    """
+    _check_batch_size(paths, "path")
+    
+    if ctx:
+        ctx.info(f"Reading {len(paths)} notes")
+    
+    return await _run_batch(
+        paths,
+        lambda i: read_note(paths[i], include_outgoing_links, include_backlinks),
+        "batch_read"
+    )
+
+
+async def update_notes_batch(
+    items: List[Dict[str, Any]],
+    ctx: Optional[Context] = None
+) -> dict:
+    """
+    Update several notes in one call.
+    
+    Each item takes the arguments of update_note: "path" and "content", plus
+    optional "create_if_not_exists" (default False) and "merge_strategy"
+    ("replace" by default, or "append").
+    
+    Args:
+        items: One update per note (at most MAX_BATCH_SIZE); a note may appear only once
+        ctx: MCP context for progress reporting
+    
+    Returns:
+        Dictionary with one update_note result (or error) per item, in order
+    """
+    _check_batch_size(items, "item")
+    
+    paths = []
+    for item in items:
+        if not isinstance(item, dict) or "path" not in item or "content" not in item:
+            raise ValueError("Each item needs a 'path' and 'content'")
+        paths.append(item["path"])
+    _check_unique_paths(paths)
+    
+    if ctx:
+        ctx.info(f"Updating {len(items)} notes")
+    
+    return await _run_batch(
+        paths,
+        lambda i: update_note(
+            items[i]["path"],
+            items[i]["content"],
+            items[i].get("create_if_not_exists", False),
+            items[i].get("merge_strategy", "replace")
+        ),
+        "batch_update"
+    )
+
+
+async def add_tags_batch(
+    paths: List[str],
+    tags: List[str],
+    ctx: Optional[Context] = None
+) -> dict:
+    """
+    Add the same tags to several notes in one call.
+    
+    Args:
+        paths: Paths to the notes (at most MAX_BATCH_SIZE); a note may appear only once
+        tags: Tags to add to every note (without # prefix)
+        ctx: MCP context for progress reporting
+    
+    Returns:
+        Dictionary with one add_tags result (or error) per path, in order
+    """
+    _check_batch_size(paths, "path")
+    _check_unique_paths(paths)
+    
+    if ctx:
+        ctx.info(f"Adding tags to {len(paths)} notes: {tags}")
+    
+    return await _run_batch(paths, lambda i: add_tags(paths[i], tags), "batch_add_tags")
@@ -1,13 +1,31 @@
 """Fast search tools using FTS5 full-text search."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, List, Tuple
 from ..utils.fts_search import get_fts_search, rebuild_fts_index, QueryParser
-from ..utils.filesystem import get_vault
 from ..utils.validation import validate_context_length
+from .search_discovery import search_by_property
 
 logger = logging.getLogger(__name__)
 
+# server.py imports this module, so its hook can't be imported at load time;
+# it is resolved once on first search and cached here
+_start_background_index = None
+
+# Keep a reference to the running rebuild so the task isn't garbage collected
+_rebuild_task: Optional[asyncio.Task] = None
+
+
+async def _ensure_background_index():
+    """Start background indexing via the server hook, resolving it on first use."""
+    global _start_background_index
+    if _start_background_index is None:
+        from ..server import start_background_index
+        _start_background_index = start_background_index
+    await _start_background_index()
+
 
 async def search_notes(
     query: str,
@@ -43,7 +61,9 @@ async def search_notes(
         ctx: MCP context for progress reporting
         
     Returns:
-        Dictionary containing fast search results with ranking and context
+        Dictionary containing fast search results with ranking and context.
+        Results are columnar: "results" holds parallel lists "paths",
+        "filenames", "contexts" and "scores", in rank order.
         
     Examples:
         >>> # Simple phrase search
@@ -88,7 +108,6 @@ async def search_notes(
         if len(parts) >= 2:
             property_name = parts[1]
             value = parts[2] if len(parts) > 2 else None
-            from .search_discovery import search_by_property
             return await search_by_property(property_name, value, "=", context_length, ctx)
         else:
             raise ValueError("Invalid property search format. Use 'property:name:value'")
@@ -110,8 +129,7 @@ async def search_notes(
     
     try:
         # Start background indexing on first use
-        from ..server import start_background_index
-        await start_background_index()
+        await _ensure_background_index()
         
         # Get FTS search engine
         fts = await get_fts_search()
@@ -121,13 +139,13 @@ async def search_notes(
         if stats["total_files"] == 0:
             # No index yet - return helpful message instead of hanging
             return {
-                "results": [],
+                "results": {"paths": [], "filenames": [], "contexts": [], "scores": []},
                 "total_count": 0,
                 "max_results": max_results,
                 "query": {
                     "text": query,
                     "context_length": context_length,
-                    "type": "fts5_full_text"
+                    "type": "fts5_full_text_v2"
                 },
                 "performance": {
                     "search_engine": "SQLite FTS5",
@@ -138,8 +156,8 @@ async def search_notes(
                 "truncated": False
             }
         
-        # Perform fast search
-        results = await fts.search(
+        # Perform fast search (columnar: one list per field instead of a dict per hit)
+        results = await fts.search_columns(
             query=query,
             limit=max_results,
             snippet_length=context_length // 3  # FTS5 snippet length is in tokens
@@ -148,21 +166,23 @@ async def search_notes(
         # Get search statistics
         stats = await fts.get_stats()
         
+        total_count = len(results["paths"])
+        
         return {
             "results": results,
-            "total_count": len(results),
+            "total_count": total_count,
             "max_results": max_results,
             "query": {
                 "text": query,
                 "context_length": context_length,
-                "type": "fts5_full_text"
+                "type": "fts5_full_text_v2"
             },
             "performance": {
                 "search_engine": "SQLite FTS5",
                 "indexed_files": stats["total_files"],
                 "index_age_seconds": stats["index_age_seconds"]
             },
-            "truncated": len(results) >= max_results
+            "truncated": total_count >= max_results
         }
         
     except Exception as e:
@@ -207,52 +227,99 @@ async def search_by_field(
     - properties: Search frontmatter properties
     - content: Search note content (same as search_notes)
     """
+    result = await search_by_fields([(field, value)], max_results, ctx)
+    bucket = result["results"][0]
+    
+    return {
+        "results": bucket["results"],
+        "total_count": bucket["total_count"],
+        "max_results": max_results,
+        "query": {
+            "field": field,
+            "value": value,
+            "type": "field_search"
+        },
+        "truncated": bucket["truncated"]
+    }
+
+
+async def search_by_fields(
+    pairs: List[Tuple[str, str]],
+    max_results: int = 50,
+    ctx=None
+) -> Dict[str, Any]:
+    """
+    Search several field/value pairs in a single index round-trip.
+    
+    Equivalent to calling search_by_field once per pair, but all pairs are
+    answered by one SQL statement. Results are grouped per pair, in order.
+    
+    Args:
+        pairs: List of (field, value) tuples, fields as in search_by_field
+        max_results: Maximum number of results per pair (1-200, default: 50)
+        ctx: MCP context for progress reporting
+        
+    Returns:
+        Dictionary with one result bucket per pair
+        
+    Examples:
+        >>> # Look up two tags at once
+        >>> await search_by_fields([("tags", "project"), ("tags", "meeting")], ctx=ctx)
+    """
     # Validate inputs
-    valid_fields = ['filename', 'tags', 'properties', 'content']
-    if field not in valid_fields:
-        raise ValueError(f"Field must be one of: {', '.join(valid_fields)}")
+    if not pairs:
+        raise ValueError("At least one field/value pair is required")
         
-    is_valid, error = QueryParser.validate_query(value)
-    if not is_valid:
-        raise ValueError(error)
+    valid_fields = ['filename', 'tags', 'properties', 'content']
+    for field, value in pairs:
+        if field not in valid_fields:
+            raise ValueError(f"Field must be one of: {', '.join(valid_fields)}")
+            
+        is_valid, error = QueryParser.validate_query(value)
+        if not is_valid:
+            raise ValueError(error)
         
     if max_results < 1 or max_results > 200:
         raise ValueError("max_results must be between 1 and 200")
     
     if ctx:
-        ctx.info(f"Searching field '{field}' for: {value}")
+        ctx.info(f"Searching {len(pairs)} field(s): {', '.join(f'{f}={v}' for f, v in pairs)}")
     
     try:
         # Get FTS search engine
         fts = await get_fts_search()
         
-        # Create field-specific query
-        if field == 'content':
-            fts_query = value
-        else:
-            # Search within specific field
-            fts_query = f'{field}:"{value}"'
+        # Create field-specific queries
+        fts_queries = [
+            value if field == 'content' else f'{field}:"{value}"'
+            for field, value in pairs
+        ]
         
-        # Perform search
-        results = await fts.search(
-            query=fts_query,
-            limit=max_results
-        )
+        # Perform all searches in one statement
+        buckets = await fts.search_many(fts_queries, limit=max_results)
         
         return {
-            "results": results,
-            "total_count": len(results),
+            "results": [
+                {
+                    "field": field,
+                    "value": value,
+                    "results": results,
+                    "total_count": len(results),
+                    "truncated": len(results) >= max_results
+                }
+                for (field, value), results in zip(pairs, buckets)
+            ],
+            "total_count": sum(len(results) for results in buckets),
             "max_results": max_results,
             "query": {
-                "field": field,
-                "value": value,
-                "type": "field_search"
+                "pairs": [{"field": field, "value": value} for field, value in pairs],
+                "type": "multi_field_search"
             },
-            "truncated": len(results) >= max_results
+            "truncated": any(len(results) >= max_results for results in buckets)
         }
         
     except Exception as e:
-        logger.error(f"Field search failed for {field}='{value}': {e}")
+        logger.error(f"Field search failed for {pairs}: {e}")
         raise ValueError(f"Field search failed: {str(e)}")
 
 
@@ -269,6 +336,11 @@ async def rebuild_search_index(ctx=None) -> Dict[str, Any]:
     This starts the index rebuild in the background and returns immediately.
     The rebuild happens asynchronously without blocking the AI assistant.
     
+    After bulk insert the index is merged (FTS5 'optimize') so every term has
+    a single posting list. Very common words are deliberately kept rather than
+    dropped as stopwords: unicode61 has no stopword option, and stripping them
+    before insert would break phrase queries and the content snippets.
+    
     Args:
         ctx: MCP context for progress reporting
         
@@ -283,16 +355,32 @@ async def rebuild_search_index(ctx=None) -> Dict[str, Any]:
         ctx.info("Starting background search index rebuild...")
     
     try:
-        # Get vault info for estimation
-        from ..utils.filesystem import get_vault as get_vault_instance
-        vault = get_vault_instance()
-        all_notes = await vault.list_notes(recursive=True)
-        total_notes = len(all_notes)
-        estimated_time = max(1, (total_notes / 1000) * 2)  # 2 min per 1000 notes, min 1 min
+        # Estimate from the previous index size - walking the vault here would
+        # block the tool on large vaults; the rebuild task counts notes itself
+        fts = await get_fts_search()
+        stats = await fts.get_stats()
+        total_notes = stats["total_files"] or None
         
         # Start rebuild in background (fire and forget)
-        import asyncio
-        asyncio.create_task(rebuild_fts_index())
+        global _rebuild_task
+        _rebuild_task = asyncio.create_task(rebuild_fts_index(), name=f"fts-rebuild-{int(time.time())}")
+        
+        if total_notes is None:
+            if ctx:
+                ctx.info("Background rebuild started")
+            
+            return {
+                "success": True,
+                "status": "rebuild_started",
+                "task_id": _rebuild_task.get_name(),
+                "total_notes": None,
+                "estimated_time_minutes": None,
+                "message": "Index rebuild started in background. You can continue using other tools while the rebuild happens.",
+                "background_process": True,
+                "next_steps": "The search index will be updated automatically. You can use 'get_search_stats_tool' to check progress."
+            }
+        
+        estimated_time = max(1, (total_notes / 1000) * 2)  # 2 min per 1000 notes, min 1 min
         
         if ctx:
             ctx.info(f"Background rebuild started for {total_notes} notes")
@@ -300,6 +388,7 @@ async def rebuild_search_index(ctx=None) -> Dict[str, Any]:
         return {
             "success": True,
             "status": "rebuild_started",
+            "task_id": _rebuild_task.get_name(),
             "total_notes": total_notes,
             "estimated_time_minutes": round(estimated_time, 1),
             "message": f"Index rebuild started in background for {total_notes} notes. This will take approximately {round(estimated_time, 1)} minutes. You can continue using other tools while the rebuild happens.",
@@ -1,14 +1,44 @@
 """Note management tools for Obsidian MCP server."""
 
 import asyncio
+import os
 import re
 from typing import Optional, List, Dict, Any, Tuple, Literal
 from fastmcp import Context
-from ..utils.filesystem import get_vault
+from ..utils.filesystem import get_vault, MAX_NOTE_SIZE
+from ..utils.index_updater import update_index_for_file
 from ..utils import validate_note_path, sanitize_path
 from ..utils.validation import validate_content
 from ..models import Note
 from ..constants import ERROR_MESSAGES
+from .link_management import get_outgoing_links, get_backlinks
+
+# Image embeds, wiki-style ![[image.png]] (group 1) or markdown ![alt](image.png) (group 2),
+# matched in a single pass over the note. Inline data: URLs are rejected up front and
+# targets can't span lines, so large base64 embeds are skipped in linear time.
+IMAGE_EMBED_PATTERN = re.compile(
+    r'!\[\[([^]\n]+\.(?:png|jpg|jpeg|gif|webp|svg|bmp|ico))\]\]'
+    r'|!\[[^\]\n]*\]\((?!data:)([^)\n]+\.(?:png|jpg|jpeg|gif|webp|svg|bmp|ico))\)',
+    re.IGNORECASE
+)
+
+# Maximum embedded images loaded at once per note, so notes with hundreds of
+# embeds don't flood the thread pool with file reads
+IMAGE_LOAD_CONCURRENCY = int(os.getenv("OBSIDIAN_IMAGE_LOAD_CONCURRENCY", "16"))
+
+# Markdown headings: captures level and text
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*$')
+
+# Heading markers indexed by level
+HEADING_PREFIXES = ('', '#', '##', '###', '####', '#####', '######')
+
+# Notes at least this many characters long have section edits applied in a worker
+# thread; below it the thread hand-off costs more than the edit itself
+SECTION_EDIT_THREAD_THRESHOLD = 8 * 1024
+
+# Notes larger than this have edit_note_content replacements streamed through a
+# temp file instead of loading, rewriting and writing back the whole note
+STREAMING_EDIT_THRESHOLD = 1024 * 1024
 
 
 async def read_note(
@@ -78,8 +108,6 @@ async def read_note(
     
     # Include links if requested
     if include_outgoing_links or include_backlinks:
-        from ..tools.link_management import get_outgoing_links, get_backlinks
-        
         # Run link fetching in parallel if both are requested
         if include_outgoing_links and include_backlinks:
             outgoing_task = asyncio.create_task(get_outgoing_links(path, check_validity=True, ctx=ctx))
@@ -170,26 +198,31 @@ async def _extract_and_load_images(
     
     Supports both Obsidian wiki-style (![[image.png]]) and standard markdown (![alt](image.png)) formats.
     """
-    # Pattern for wiki-style embeds: ![[image.png]]
-    wiki_pattern = r'!\[\[([^]]+\.(?:png|jpg|jpeg|gif|webp|svg|bmp|ico))\]\]'
-    # Pattern for standard markdown: ![alt text](image.png)
-    markdown_pattern = r'!\[[^\]]*\]\(([^)]+\.(?:png|jpg|jpeg|gif|webp|svg|bmp|ico))\)'
-    
-    # Find all image references
-    image_paths = set()
+    # Every embed starts with "![" - most notes have none, so skip the regex scan
+    if '![' not in content:
+        return []
     
-    for match in re.finditer(wiki_pattern, content, re.IGNORECASE):
-        image_paths.add(match.group(1))
+    # Find all image references, deduplicated by normalized case so refs that
+    # differ only in case don't load the same file twice on case-insensitive
+    # filesystems (keeps the first spelling seen)
+    image_paths: Dict[str, str] = {}
     
-    for match in re.finditer(markdown_pattern, content, re.IGNORECASE):
-        image_paths.add(match.group(1))
+    for match in IMAGE_EMBED_PATTERN.finditer(content):
+        image_ref = match.group(1) or match.group(2)
+        image_paths.setdefault(os.path.normcase(image_ref), image_ref)
     
     # Load all images concurrently for better performance
     if not image_paths:
         return []
     
-    # Create tasks for all images
-    tasks = [_search_and_load_image(image_ref, vault, ctx) for image_ref in image_paths]
+    # Create tasks for all images, bounded by IMAGE_LOAD_CONCURRENCY
+    semaphore = asyncio.Semaphore(IMAGE_LOAD_CONCURRENCY)
+    
+    async def load_bounded(image_ref: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            return await _search_and_load_image(image_ref, vault, ctx)
+    
+    tasks = [load_bounded(image_ref) for image_ref in image_paths.values()]
     
     # Execute all tasks concurrently
     results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -261,8 +294,6 @@ async def create_note(
         created = True
         
         # Update search index in background
-        from ..utils.index_updater import update_index_for_file
-        import asyncio
         asyncio.create_task(update_index_for_file(path))
     except FileExistsError:
         if not overwrite:
@@ -351,8 +382,6 @@ async def update_note(
             note = await vault.write_note(path, content, overwrite=False)
             
             # Update search index in background
-            from ..utils.index_updater import update_index_for_file
-            import asyncio
             asyncio.create_task(update_index_for_file(path))
             
             # Return standardized CRUD success structure
@@ -383,8 +412,6 @@ async def update_note(
     note = await vault.write_note(path, final_content, overwrite=True)
     
     # Update search index in background
-    from ..utils.index_updater import update_index_for_file
-    import asyncio
     asyncio.create_task(update_index_for_file(path))
     
     # Return standardized CRUD success structure
@@ -465,37 +492,79 @@ def _detect_frontmatter(content: str) -> Tuple[str, str, str]:
     if not content.startswith('---'):
         return "", content, ""
     
-    # Find the closing --- (must be at start of line)
-    lines = content.split('\n')
-    closing_index = None
+    # Find the closing --- (a line that is just --- once stripped), jumping
+    # between '---' candidates after line 0 instead of splitting the note
+    first_newline = content.find('\n')
+    candidate = content.find('---', first_newline + 1) if first_newline != -1 else -1
     
-    for i, line in enumerate(lines[1:], 1):  # Start from line 1
-        if line.strip() == '---':
-            closing_index = i
-            break
+    while candidate != -1:
+        line_start = content.rfind('\n', 0, candidate) + 1
+        line_end = content.find('\n', candidate)
+        if line_end == -1:
+            line_end = len(content)
+        
+        if content[line_start:line_end].strip() == '---':
+            # Frontmatter includes delimiters; main content is everything after it
+            return content[:line_end], content[line_end + 1:], '\n'
+        
+        candidate = content.find('---', line_end)
     
-    if closing_index is None:
-        # No closing ---, treat as regular content
-        return "", content, ""
+    # No closing ---, treat as regular content
+    return "", content, ""
+
+
+def _line_offsets(content: str) -> List[int]:
+    """
+    Get the start offset of every line in content.
     
-    # Extract frontmatter (including delimiters)
-    frontmatter_lines = lines[:closing_index + 1]
-    frontmatter = '\n'.join(frontmatter_lines)
+    Line i spans content[offsets[i]:offsets[i + 1] - 1] (or to the end of
+    content for the last line), matching content.split('\n')[i].
+    """
+    offsets = [0]
+    newline = content.find('\n')
+    while newline != -1:
+        offsets.append(newline + 1)
+        newline = content.find('\n', newline + 1)
+    return offsets
+
+
+def _replace_lines(content: str, offsets: List[int], start: int, end: int, text: str) -> str:
+    """
+    Replace lines [start, end) of content with text, splicing the string directly.
     
-    # Extract main content (everything after frontmatter)
-    main_content_lines = lines[closing_index + 1:]
-    main_content = '\n'.join(main_content_lines)
+    Equivalent to splitting on '\n', doing lines[start:end] = [text] and joining
+    again; start == end inserts text as a new line before line start.
+    """
+    head = content[:offsets[start]] if start < len(offsets) else content + '\n'
+    tail = '\n' + content[offsets[end]:] if end < len(offsets) else ''
+    return head + text + tail
+
+
+def _heading_level(line: str) -> int:
+    """
+    Get the level of a stripped markdown heading line, or 0 if it isn't one.
     
-    return frontmatter, main_content, '\n'
+    Plain string test equivalent to matching r'^(#{1,6})\s+', so the common
+    non-heading line never reaches the regex engine.
+    """
+    level = len(line) - len(line.lstrip('#'))
+    if level == 0 or level > 6 or level == len(line) or not line[level].isspace():
+        return 0
+    return level
 
 
-def _find_section_boundaries(content: str, section_identifier: str) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+def _find_section_boundaries(
+    content: str,
+    section_identifier: str,
+    offsets: Optional[List[int]] = None
+) -> Tuple[Optional[int], Optional[int], Optional[str]]:
     """
     Find the start and end boundaries of a section in markdown content.
     
     Args:
         content: Markdown content to search
         section_identifier: Heading to find (e.g., "## Tasks", "### Status")
+        offsets: Line start offsets from _line_offsets(content), computed if omitted
         
     Returns:
         Tuple of (start_line, end_line, actual_heading)
@@ -506,10 +575,15 @@ def _find_section_boundaries(content: str, section_identifier: str) -> Tuple[Opt
         - end_line is the line index before the next heading of same/higher level (or EOF)
         - Matching is case-insensitive
     """
-    lines = content.split('\n')
+    if offsets is None:
+        offsets = _line_offsets(content)
+    line_count = len(offsets)
+    
+    def line_at(i: int) -> str:
+        return content[offsets[i]:offsets[i + 1] - 1] if i + 1 < line_count else content[offsets[i]:]
     
     # Parse the target heading level and text
-    section_match = re.match(r'^(#{1,6})\s+(.+?)\s*#*$', section_identifier.strip())
+    section_match = HEADING_PATTERN.match(section_identifier.strip())
     if not section_match:
         return None, None, None
     
@@ -520,30 +594,28 @@ def _find_section_boundaries(content: str, section_identifier: str) -> Tuple[Opt
     actual_heading = None
     
     # Find the target section
-    for i, line in enumerate(lines):
-        heading_match = re.match(r'^(#{1,6})\s+(.+?)\s*#*$', line.strip())
-        if heading_match:
-            level = len(heading_match.group(1))
-            text = heading_match.group(2).strip().lower()
-            
-            if level == target_level and text == target_text:
-                section_start = i
-                actual_heading = line.strip()
-                break
+    for i in range(line_count):
+        line = line_at(i).strip()
+        # Only headings at the target level need the regex, to extract their text
+        if _heading_level(line) != target_level:
+            continue
+        heading_match = HEADING_PATTERN.match(line)
+        if heading_match and heading_match.group(2).strip().lower() == target_text:
+            section_start = i
+            actual_heading = line
+            break
     
     if section_start is None:
         return None, None, None
     
     # Find the end of this section (next heading of same or higher level)
-    section_end = len(lines)  # Default to end of file
+    section_end = line_count  # Default to end of file
     
-    for i in range(section_start + 1, len(lines)):
-        heading_match = re.match(r'^(#{1,6})\s+', lines[i].strip())
-        if heading_match:
-            level = len(heading_match.group(1))
-            if level <= target_level:  # Same or higher level heading
-                section_end = i
-                break
+    for i in range(section_start + 1, line_count):
+        level = _heading_level(line_at(i).strip())
+        if level and level <= target_level:  # Same or higher level heading
+            section_end = i
+            break
     
     return section_start, section_end, actual_heading
 
@@ -560,13 +632,111 @@ def _create_section_content(heading: str, content: str, target_level: int) -> st
     Returns:
         Formatted section content
     """
-    heading_prefix = '#' * target_level
-    section_content = f"{heading_prefix} {heading}\n"
+    heading_prefix = HEADING_PREFIXES[target_level]
     
     if content.strip():
-        section_content += f"\n{content}"
+        return f"{heading_prefix} {heading}\n\n{content}"
+    return f"{heading_prefix} {heading}\n"
+
+
+def _apply_section_edit(
+    note_content: str,
+    section_identifier: str,
+    content: str,
+    operation: str,
+    create_if_missing: bool
+) -> Tuple[str, str, bool, bool, bool]:
+    """
+    Apply a section edit to full note content (pure CPU, safe to run in a thread).
+    
+    Args:
+        note_content: Full note content including frontmatter
+        section_identifier: Markdown heading that identifies the section
+        content: Content to insert, replace, or append
+        operation: Section edit operation (see edit_note_section)
+        create_if_missing: Create the section if it doesn't exist
+        
+    Returns:
+        Tuple of (final_content, operation_performed, section_created,
+        section_found, frontmatter_preserved)
+    """
+    # Separate frontmatter from content
+    frontmatter, main_content, separator = _detect_frontmatter(note_content)
+    
+    # Find section boundaries; edits are spliced into main_content by line offset
+    offsets = _line_offsets(main_content)
+    start_line, end_line, actual_heading = _find_section_boundaries(main_content, section_identifier, offsets)
+    line_count = len(offsets)
+    
+    if start_line is None:
+        if not create_if_missing:
+            raise ValueError(f"Section '{section_identifier}' not found in note. Use create_if_missing=true to create it.")
+        
+        # Create new section at end of document
+        # Parse section identifier to get level and text
+        section_match = HEADING_PATTERN.match(section_identifier.strip())
+        if not section_match:
+            raise ValueError(f"Invalid section identifier format: {section_identifier}")
+        
+        target_level = len(section_match.group(1))
+        heading_text = section_match.group(2).strip()
+        
+        # Add new section
+        if operation == "edit_heading":
+            # For edit_heading, use the content as the new heading
+            new_section = content.strip()
+        elif operation == "replace_section":
+            new_section = content
+        else:
+            new_section = _create_section_content(heading_text, content, target_level)
+        
+        # Ensure proper spacing
+        if main_content[offsets[-1]:].strip():
+            new_section = "\n" + new_section  # Add blank line before new section
+        
+        modified_content = _replace_lines(main_content, offsets, line_count, line_count, new_section)
+        section_created = True
+        operation_performed = "created"
+    else:
+        # Edit existing section
+        section_created = False
+        
+        if operation == "insert_after":
+            # Insert content immediately after the heading
+            modified_content = _replace_lines(main_content, offsets, start_line + 1, start_line + 1, content)
+            operation_performed = "inserted_after"
+            
+        elif operation == "insert_before":
+            # Insert content immediately before the heading
+            modified_content = _replace_lines(main_content, offsets, start_line, start_line, content)
+            operation_performed = "inserted_before"
+            
+        elif operation == "replace_section":
+            # Replace entire section including heading
+            modified_content = _replace_lines(main_content, offsets, start_line, end_line, content)
+            operation_performed = "replaced"
+            
+        elif operation == "append_to_section":
+            # Add content at the end of the section (before next heading or EOF)
+            new_lines = content
+            # If there's content in the section, add a blank line before new content
+            if end_line > start_line + 1:
+                new_lines = "\n" + content
+            modified_content = _replace_lines(main_content, offsets, end_line, end_line, new_lines)
+            operation_performed = "appended"
+            
+        elif operation == "edit_heading":
+            # Change just the heading text
+            modified_content = _replace_lines(main_content, offsets, start_line, start_line + 1, content.strip())
+            operation_performed = "heading_edited"
+    
+    # Reconstruct full content with frontmatter
+    if frontmatter:
+        final_content = frontmatter + separator + modified_content
+    else:
+        final_content = modified_content
     
-    return section_content
+    return final_content, operation_performed, section_created, start_line is not None, bool(frontmatter)
 
 
 async def edit_note_section(
@@ -651,87 +821,16 @@ async def edit_note_section(
     except FileNotFoundError:
         raise FileNotFoundError(ERROR_MESSAGES["note_not_found"].format(path=path))
     
-    # Separate frontmatter from content
-    frontmatter, main_content, separator = _detect_frontmatter(note_content)
-    
-    # Find section boundaries
-    start_line, end_line, actual_heading = _find_section_boundaries(main_content, section_identifier)
-    
-    if start_line is None:
-        if not create_if_missing:
-            raise ValueError(f"Section '{section_identifier}' not found in note. Use create_if_missing=true to create it.")
-        
-        # Create new section at end of document
-        lines = main_content.split('\n')
-        
-        # Parse section identifier to get level and text
-        section_match = re.match(r'^(#{1,6})\s+(.+?)\s*#*$', section_identifier.strip())
-        if not section_match:
-            raise ValueError(f"Invalid section identifier format: {section_identifier}")
-        
-        target_level = len(section_match.group(1))
-        heading_text = section_match.group(2).strip()
-        
-        # Add new section
-        if operation == "edit_heading":
-            # For edit_heading, use the content as the new heading
-            new_section = content.strip()
-        elif operation == "replace_section":
-            new_section = content
-        else:
-            new_section = _create_section_content(heading_text, content, target_level)
-        
-        # Ensure proper spacing
-        if lines and lines[-1].strip():
-            lines.append("")  # Add blank line before new section
-        lines.append(new_section)
-        
-        modified_content = '\n'.join(lines)
-        section_created = True
-        operation_performed = "created"
-    else:
-        # Edit existing section
-        lines = main_content.split('\n')
-        section_created = False
-        
-        if operation == "insert_after":
-            # Insert content immediately after the heading
-            lines.insert(start_line + 1, content)
-            operation_performed = "inserted_after"
-            
-        elif operation == "insert_before":
-            # Insert content immediately before the heading
-            lines.insert(start_line, content)
-            operation_performed = "inserted_before"
-            
-        elif operation == "replace_section":
-            # Replace entire section including heading
-            del lines[start_line:end_line]
-            lines.insert(start_line, content)
-            operation_performed = "replaced"
-            
-        elif operation == "append_to_section":
-            # Add content at the end of the section (before next heading or EOF)
-            insert_position = end_line
-            # If there's content in the section, add a blank line before new content
-            if end_line > start_line + 1:
-                lines.insert(insert_position, "")
-                insert_position += 1
-            lines.insert(insert_position, content)
-            operation_performed = "appended"
-            
-        elif operation == "edit_heading":
-            # Change just the heading text
-            lines[start_line] = content.strip()
-            operation_performed = "heading_edited"
-        
-        modified_content = '\n'.join(lines)
-    
-    # Reconstruct full content with frontmatter
-    if frontmatter:
-        final_content = frontmatter + separator + modified_content
+    # Apply the edit; large notes are transformed off the event loop
+    if len(note_content) < SECTION_EDIT_THREAD_THRESHOLD:
+        edit_result = _apply_section_edit(
+            note_content, section_identifier, content, operation, create_if_missing
+        )
     else:
-        final_content = modified_content
+        edit_result = await asyncio.to_thread(
+            _apply_section_edit, note_content, section_identifier, content, operation, create_if_missing
+        )
+    final_content, operation_performed, section_created, section_found, frontmatter_preserved = edit_result
     
     # Write the updated note
     note = await vault.write_note(path, final_content, overwrite=True)
@@ -745,8 +844,8 @@ async def edit_note_section(
             "section_identifier": section_identifier,
             "edit_operation": operation_performed,
             "section_created": section_created,
-            "section_found": start_line is not None,
-            "frontmatter_preserved": bool(frontmatter),
+            "section_found": section_found,
+            "frontmatter_preserved": frontmatter_preserved,
             "metadata": note.metadata.model_dump(exclude_none=True)
         }
     }
@@ -826,6 +925,30 @@ async def edit_note_content(
     
     vault = get_vault()
     
+    # Large notes are edited as a stream rather than loaded whole
+    full_path = vault._get_absolute_path(path if path.endswith('.md') else path + '.md')
+    try:
+        note_size = (await asyncio.to_thread(os.stat, full_path)).st_size
+    except FileNotFoundError:
+        # Reported by read_note below
+        note_size = 0
+    if (
+        occurrence in ("first", "all")
+        and replacement_text != search_text
+        and STREAMING_EDIT_THRESHOLD < note_size <= MAX_NOTE_SIZE
+    ):
+        replacements_made = await vault.replace_in_note(path, search_text, replacement_text, occurrence)
+        if replacements_made == 0:
+            raise ValueError(f"Search text not found: '{search_text}'")
+        
+        note = await vault.read_note(path)
+        length_after = len(note.content)
+        length_before = length_after - replacements_made * (len(replacement_text) - len(search_text))
+        
+        return _content_edit_result(
+            note, search_text, replacement_text, replacements_made, occurrence, length_before, length_after
+        )
+    
     # Read the existing note
     try:
         existing_note = await vault.read_note(path)
@@ -835,25 +958,34 @@ async def edit_note_content(
     
     # Perform replacement
     if occurrence == "first":
-        if search_text not in original_content:
+        index = original_content.find(search_text)
+        if index == -1:
             raise ValueError(f"Search text not found: '{search_text}'")
         
-        modified_content = original_content.replace(search_text, replacement_text, 1)
+        modified_content = (
+            original_content[:index] + replacement_text + original_content[index + len(search_text):]
+        )
         replacements_made = 1
         
     elif occurrence == "all":
-        count_before = original_content.count(search_text)
-        if count_before == 0:
-            raise ValueError(f"Search text not found: '{search_text}'")
-        
         modified_content = original_content.replace(search_text, replacement_text)
-        replacements_made = count_before
+        
+        # Derive the count from the length change so the note is only scanned once;
+        # equal-length replacements need an explicit count
+        length_delta = len(search_text) - len(replacement_text)
+        if length_delta:
+            replacements_made = (len(original_content) - len(modified_content)) // length_delta
+        else:
+            replacements_made = original_content.count(search_text)
+        
+        if replacements_made == 0:
+            raise ValueError(f"Search text not found: '{search_text}'")
         
     else:
         raise ValueError(f"Invalid occurrence value: {occurrence}. Must be 'first' or 'all'")
     
     # Check if any changes were actually made
-    if modified_content == original_content:
+    if replacement_text == search_text:
         return {
             "success": True,
             "path": path,
@@ -870,7 +1002,22 @@ async def edit_note_content(
     # Write the updated note
     note = await vault.write_note(path, modified_content, overwrite=True)
     
-    # Return standardized success structure
+    return _content_edit_result(
+        note, search_text, replacement_text, replacements_made, occurrence,
+        len(original_content), len(modified_content)
+    )
+
+
+def _content_edit_result(
+    note: Note,
+    search_text: str,
+    replacement_text: str,
+    replacements_made: int,
+    occurrence: str,
+    length_before: int,
+    length_after: int
+) -> dict:
+    """Build the standardized success structure for edit_note_content."""
     return {
         "success": True,
         "path": note.path,
@@ -880,8 +1027,8 @@ async def edit_note_content(
             "replacement_text": replacement_text,
             "replacements_made": replacements_made,
             "occurrence": occurrence,
-            "content_length_before": len(original_content),
-            "content_length_after": len(modified_content),
+            "content_length_before": length_before,
+            "content_length_after": length_after,
             "metadata": note.metadata.model_dump(exclude_none=True)
         }
     }
\ No newline at end of file
@@ -1,25 +1,94 @@
 """Search and discovery tools for Obsidian MCP server."""
 
+import os
 import re
+import asyncio
+import atexit
 import logging
-from typing import List, Optional, Dict, Any
+import multiprocessing
+import mmap
+import shutil
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import aclosing
+from functools import lru_cache
+from itertools import islice
+from operator import gt, lt, ge, le
+from stat import S_ISDIR
+from typing import List, Optional, Dict, Any, Tuple, Callable, Set
 from datetime import datetime, timedelta
 from pathlib import Path
-from ..utils.filesystem import get_vault
+from ..utils.filesystem import get_vault, MAX_NOTE_SIZE, MMAP_READ_THRESHOLD
 from ..utils import is_markdown_file
 from ..utils.validation import (
     validate_search_query,
     validate_context_length,
     validate_date_search_params,
-    validate_directory_path
+    validate_directory_path,
+    compile_regex
 )
 from ..models import VaultItem
 from ..constants import ERROR_MESSAGES
 
+try:
+    from re import _parser as _regex_parser
+except ImportError:  # Python 3.10
+    import sre_parse as _regex_parser
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of notes read concurrently by the manual tag/property scans
+NOTE_READ_CONCURRENCY = 32
+
+# Maximum number of tag occurrences quoted in a tag search result's context
+MAX_TAG_CONTEXTS = 5
+
+# Notes read per batch by the manual property scan; it stops after the
+# batch that reaches max_results
+PROPERTY_SCAN_BATCH_SIZE = 256
+
+# Result cap for the manual property search, matching the FTS5 path
+MANUAL_PROPERTY_MAX_RESULTS = 200
+
+# Number of (path, property) entries kept in _LOWERED_ITEMS_CACHE
+LOWERED_ITEMS_CACHE_SIZE = 4096
+
+# Lowercased items of list properties, keyed by (path, property name) and
+# tied to the frontmatter list they were built from
+_LOWERED_ITEMS_CACHE: Dict[Tuple[str, str], Tuple[list, frozenset]] = {}
+
+# Directory-scoped regex searches over at least this many notes ask ripgrep
+# (when installed) which notes contain the pattern's required literal
+RIPGREP_MIN_NOTES = 500
+
+_RIPGREP = shutil.which("rg")
+
+# Directory-scoped regex searches over at least this many notes are matched
+# in worker processes, REGEX_POOL_CHUNK_SIZE notes per task
+REGEX_POOL_MIN_NOTES = 1000
+REGEX_POOL_CHUNK_SIZE = 64
+
+# Most worker processes the regex pool starts, however many CPUs there are
+REGEX_POOL_MAX_WORKERS = 8
+
+# Notes the in-process regex scan reads ahead of the one being matched;
+# bounds how many read notes wait in memory
+REGEX_READ_AHEAD = 64
 
-async def _search_by_tag(vault, tag: str, context_length: int) -> List[Dict[str, Any]]:
+# Created on the first search that needs it
+_REGEX_POOL: Optional[ProcessPoolExecutor] = None
+
+# Regex parser opcodes for repeated items (POSSESSIVE_REPEAT is 3.11+)
+_REGEX_REPEATS = tuple(
+    getattr(_regex_parser, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_regex_parser, name)
+)
+
+
+async def _search_by_tag(vault, tag: str, context_length: int, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
     """Search for notes containing a specific tag, supporting hierarchical tags."""
     results = []
     
@@ -46,106 +115,122 @@ async def _search_by_tag(vault, tag: str, context_length: int) -> List[Dict[str,
             # Fall back to manual search if fast search fails
             pass
     
-    for note_info in all_notes:
+    # The search tag bounded by "/" or the ends of a note tag
+    tag_re = re.compile(rf'(?:^|/){re.escape(tag)}(?:/|$)')
+    
+    # Only read the notes the vault's tag index lists under a matching tag
+    tag_index = await vault.get_tag_index([note_info["path"] for note_info in all_notes])
+    candidates = set()
+    for note_tag, paths in tag_index.items():
+        if tag_re.search(note_tag):
+            candidates.update(paths)
+    all_notes = [note_info for note_info in all_notes if note_info["path"] in candidates]
+    if max_results is not None:
+        all_notes = all_notes[:max_results]
+    
+    semaphore = asyncio.Semaphore(NOTE_READ_CONCURRENCY)
+    
+    async def _process(note_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         try:
             # Read the note to get its tags
-            note = await vault.read_note(note_info["path"])
+            async with semaphore:
+                note = await vault.read_note(note_info["path"])
             
             # Check for exact match or hierarchical match
             # For hierarchical tags, we support:
             # - Exact match: "parent/child" matches "parent/child"
             # - Parent match: "parent" matches "parent/child", "parent/grandchild"
             # - Child match: searching for "child" finds "parent/child"
-            matched = False
-            matching_tags = []
-            
-            for note_tag in note.metadata.tags:
-                # Exact match
-                if note_tag == tag:
-                    matched = True
-                    matching_tags.append(note_tag)
-                # Parent tag match - if searching for "parent", match "parent/child"
-                elif note_tag.startswith(tag + "/"):
-                    matched = True
-                    matching_tags.append(note_tag)
-                # Child tag match - if searching for "child", match "parent/child"
-                elif "/" in note_tag and note_tag.split("/")[-1] == tag:
-                    matched = True
-                    matching_tags.append(note_tag)
-                # Any level match - if searching for "middle", match "parent/middle/child"
-                elif "/" in note_tag and f"/{tag}/" in f"/{note_tag}/":
-                    matched = True
-                    matching_tags.append(note_tag)
+            # - Any level match: searching for "middle" finds "parent/middle/child"
+            matching_tags = [note_tag for note_tag in note.metadata.tags if tag_re.search(note_tag)]
+            matched = bool(matching_tags)
             
             if matched:
                 # Get context around the tag occurrences
                 content = note.content
                 contexts = []
                 
-                # Search for all matching tags in content
-                for matched_tag in matching_tags:
-                    tag_pattern = f"#{matched_tag}"
-                    idx = 0
-                    while True:
-                        idx = content.find(tag_pattern, idx)
-                        if idx == -1:
-                            break
-                        
-                        # Extract context
-                        start = max(0, idx - context_length // 2)
-                        end = min(len(content), idx + len(tag_pattern) + context_length // 2)
-                        context = content[start:end].strip()
-                        contexts.append(context)
-                        idx += 1
+                # Search for all matching tags in one pass; longer tags first so
+                # "#parent/child" isn't cut short at "#parent"
+                tag_pattern = re.compile('|'.join(
+                    re.escape(f"#{t}") for t in sorted(matching_tags, key=len, reverse=True)
+                ))
+                for match in tag_pattern.finditer(content):
+                    # Extract context
+                    start = max(0, match.start() - context_length // 2)
+                    end = min(len(content), match.end() + context_length // 2)
+                    contexts.append(content[start:end].strip())
+                    if len(contexts) >= MAX_TAG_CONTEXTS:
+                        break
                 
-                results.append({
+                return {
                     "path": note.path,
                     "score": 1.0,
                     "matches": matching_tags,
                     "context": " ... ".join(contexts) if contexts else f"Note contains tags: {', '.join(f'#{t}' for t in matching_tags)}"
-                })
+                }
         except Exception:
             # Skip notes we can't read
-            continue
+            pass
+        return None
+    
     
+    processed = await asyncio.gather(*(_process(n) for n in all_notes))
+    results.extend(r for r in processed if r is not None)
     return results
 
 
 async def _search_by_path(vault, path_pattern: str, context_length: int) -> List[Dict[str, Any]]:
     """Search for notes matching a path pattern."""
-    results = []
-    
     # Get all notes
     all_notes = await vault.list_notes(recursive=True)
     
-    for note_info in all_notes:
-        # Check if path matches pattern
-        if path_pattern.lower() in note_info["path"].lower():
-            try:
-                # Read note to get some content for context
-                note = await vault.read_note(note_info["path"])
-                
-                # Get first N characters as context
-                context = note.content[:context_length].strip()
-                if len(note.content) > context_length:
-                    context += "..."
-                
-                results.append({
-                    "path": note.path,
-                    "score": 1.0,
-                    "matches": [path_pattern],
-                    "context": context
-                })
-            except Exception:
-                # If we can't read, still include in results
-                results.append({
-                    "path": note_info["path"],
-                    "score": 1.0,
-                    "matches": [path_pattern],
-                    "context": ""
-                })
+    # Check which paths match the pattern
+    pattern_lower = path_pattern.lower()
+    matching_paths = [note_info["path"] for note_info in all_notes if pattern_lower in note_info["path"].lower()]
     
-    return results
+    semaphore = asyncio.Semaphore(NOTE_READ_CONCURRENCY)
+    
+    async def _process(note_path: str) -> Dict[str, Any]:
+        try:
+            # Read note to get some content for context
+            async with semaphore:
+                note = await vault.read_note(note_path)
+            
+            # Get first N characters as context
+            context = note.content[:context_length].strip()
+            if len(note.content) > context_length:
+                context += "..."
+            
+            return {
+                "path": note.path,
+                "score": 1.0,
+                "matches": [path_pattern],
+                "context": context
+            }
+        except Exception:
+            # If we can't read, still include in results
+            return {
+                "path": note_path,
+                "score": 1.0,
+                "matches": [path_pattern],
+                "context": ""
+            }
+    
+    return list(await asyncio.gather(*(_process(note_path) for note_path in matching_paths)))
+
+
+# Comparison prefixes of a property query value, longest first
+PROPERTY_OPERATORS = ('>=', '<=', '!=', '>', '<')
+
+# Ordering operators supported by property search
+PROPERTY_COMPARISONS = {'>': gt, '<': lt, '>=': ge, '<=': le}
+
+# Date formats tried, in order, for ordering comparisons on properties
+PROPERTY_DATE_FORMATS = ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S")
+
+# Every PROPERTY_DATE_FORMATS match starts like this; strptime's %Y is \d{4}
+PROPERTY_DATE_PREFIX = re.compile(r'\d{4}-')
 
 
 def _parse_property_query(query: str) -> Dict[str, Any]:
@@ -161,38 +246,166 @@ def _parse_property_query(query: str) -> Dict[str, Any]:
     Returns:
         Dict with 'name', 'operator', and 'value'
     """
+    name, operator, value = _split_property_query(query)
+    return {'name': name, 'operator': operator, 'value': value}
+
+
+@lru_cache(maxsize=512)
+def _split_property_query(query: str) -> Tuple[str, str, Optional[str]]:
+    """Parse a property query into (name, operator, value); cached per query string."""
     # Remove 'property:' prefix
     prop_query = query[9:]  # len('property:') = 9
     
     # Split by first colon to separate name from value/operator
-    parts = prop_query.split(':', 1)
-    if len(parts) != 2:
+    name, sep, value_part = prop_query.partition(':')
+    if not sep:
         raise ValueError(f"Invalid property query format: {query}")
     
-    name = parts[0]
-    value_part = parts[1]
-    
     # Check for operators
     if value_part == '*':
-        return {'name': name, 'operator': 'exists', 'value': None}
-    elif value_part.startswith('>='):
-        return {'name': name, 'operator': '>=', 'value': value_part[2:]}
-    elif value_part.startswith('<='):
-        return {'name': name, 'operator': '<=', 'value': value_part[2:]}
-    elif value_part.startswith('!='):
-        return {'name': name, 'operator': '!=', 'value': value_part[2:]}
-    elif value_part.startswith('>'):
-        return {'name': name, 'operator': '>', 'value': value_part[1:]}
-    elif value_part.startswith('<'):
-        return {'name': name, 'operator': '<', 'value': value_part[1:]}
-    elif value_part.startswith('*') and value_part.endswith('*'):
-        return {'name': name, 'operator': 'contains', 'value': value_part[1:-1]}
-    else:
-        return {'name': name, 'operator': '=', 'value': value_part}
+        return name, 'exists', None
+    for operator in PROPERTY_OPERATORS:
+        if value_part.startswith(operator):
+            return name, operator, value_part[len(operator):]
+    if value_part.startswith('*') and value_part.endswith('*'):
+        return name, 'contains', value_part[1:-1]
+    return name, '=', value_part
+
+
+def _lowered_items(path: str, prop_name: str, prop_value: list) -> frozenset:
+    """
+    Return the lowercased string forms of a list property's items.
+    
+    Cached per note and property. An entry is only reused while the
+    vault's frontmatter cache hands back the very same list object, so a
+    changed note is recomputed.
+    """
+    key = (path, prop_name)
+    cached = _LOWERED_ITEMS_CACHE.get(key)
+    if cached is not None and cached[0] is prop_value:
+        return cached[1]
+    
+    items = frozenset(str(item).lower() for item in prop_value)
+    if len(_LOWERED_ITEMS_CACHE) >= LOWERED_ITEMS_CACHE_SIZE:
+        _LOWERED_ITEMS_CACHE.clear()
+    _LOWERED_ITEMS_CACHE[key] = (prop_value, items)
+    return items
+
+
+def _property_matcher(prop_name: str, operator: str, value: Optional[str]) -> Callable[[str, Any], bool]:
+    """
+    Build the per-note test for a property query.
+    
+    The operator is resolved and the query value prepared once, so the
+    returned callable only does the work for one (path, property value).
+    """
+    value_lower = str(value).lower()
+    
+    # Check if property exists (special case)
+    if operator == 'exists':
+        return lambda path, prop_value: True
+    
+    if operator in ('=', '!='):
+        def equals(path: str, prop_value: Any) -> bool:
+            # Handle array/list properties: check if value is in the list
+            if isinstance(prop_value, list):
+                return value_lower in _lowered_items(path, prop_name, prop_value)
+            return str(prop_value).lower() == value_lower
+        
+        if operator == '=':
+            return equals
+        return lambda path, prop_value: not equals(path, prop_value)
+    
+    if operator == 'contains':
+        def contains(path: str, prop_value: Any) -> bool:
+            # Check if any item in list contains the value
+            if isinstance(prop_value, list):
+                return any(value_lower in str(item).lower() for item in prop_value)
+            return value_lower in str(prop_value).lower()
+        
+        return contains
+    
+    if operator in PROPERTY_COMPARISONS:
+        compare = PROPERTY_COMPARISONS[operator]
+        
+        # Parse the query value as a date (remembering the format) and as a number
+        date_val = None
+        date_fmt = None
+        for fmt in PROPERTY_DATE_FORMATS:
+            try:
+                date_val = datetime.strptime(str(value), fmt)
+                date_fmt = fmt
+                break
+            except ValueError:
+                continue
+        try:
+            num_val = float(value)
+        except (ValueError, TypeError):
+            num_val = None
+        
+        def ordered(path: str, prop_value: Any) -> bool:
+            # For arrays, compare the length
+            if isinstance(prop_value, list):
+                return num_val is not None and compare(len(prop_value), num_val)
+            
+            # Date comparison, if the query value was a date. Only text that
+            # starts like one is handed to strptime, so other values don't
+            # pay for a raised ValueError
+            if date_fmt:
+                prop_text = str(prop_value)
+                if PROPERTY_DATE_PREFIX.match(prop_text):
+                    try:
+                        return compare(datetime.strptime(prop_text, date_fmt), date_val)
+                    except ValueError:
+                        pass
+            
+            # Try numeric comparison
+            if num_val is not None:
+                try:
+                    return compare(float(prop_value), num_val)
+                except (ValueError, TypeError):
+                    pass
+            
+            # Fall back to string comparison
+            return compare(str(prop_value), str(value))
+        
+        return ordered
+    
+    return lambda path, prop_value: False
 
 
-async def _search_by_property(vault, property_query: str, context_length: int) -> List[Dict[str, Any]]:
-    """Search for notes by property values."""
+def _filter_property_matches(
+    candidates: List[Tuple[str, Dict[str, Any]]],
+    predicates: List[Tuple[str, str, Optional[str]]]
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Keep the (path, property values) pairs that satisfy every predicate.
+    
+    Predicates are (name, operator, value) triples. Pure CPU work over
+    already-read frontmatter, so the manual property search runs it in a
+    worker thread.
+    """
+    matchers = [(name, _property_matcher(name, operator, value)) for name, operator, value in predicates]
+    
+    matching = []
+    for path, prop_values in candidates:
+        try:
+            if all(matches(path, prop_values[name]) for name, matches in matchers):
+                matching.append((path, prop_values))
+        except Exception:
+            # Skip values we can't compare
+            continue
+    
+    return matching
+
+
+async def _search_by_property(
+    vault,
+    property_query: str,
+    context_length: int,
+    max_results: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Search for notes by property values, stopping after max_results matches."""
     # Parse the property query
     try:
         parsed = _parse_property_query(property_query)
@@ -240,145 +453,146 @@ async def _search_by_property(vault, property_query: str, context_length: int) -
             logger.warning(f"Property search via index failed: {e}, falling back to manual search")
     
     # Fall back to manual search (original implementation)
-    results = []
-    all_notes = await vault.list_notes(recursive=True)
+    results = await _search_by_properties(vault, [property_query], context_length, max_results)
+    for result in results:
+        result["property_value"] = result.pop("property_values")[prop_name]
+    return results
+
+
+async def _search_by_properties(
+    vault,
+    property_queries: List[str],
+    context_length: int,
+    max_results: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Search for notes matching all of several property queries.
     
-    # Add timeout protection for large vaults
-    if len(all_notes) > 500:
-        logger.warning(f"Property search on large vault ({len(all_notes)} notes) may be slow. Consider using search_notes_tool instead.")
+    Each note's frontmatter is read once and tested against every query,
+    instead of scanning the vault once per property.
+    """
+    predicates = []
+    for property_query in property_queries:
+        parsed = _parse_property_query(property_query)
+        predicates.append((parsed['name'], parsed['operator'], parsed['value']))
+    prop_names = list(dict.fromkeys(name for name, _, _ in predicates))
     
-    for note_info in all_notes:
+    semaphore = asyncio.Semaphore(NOTE_READ_CONCURRENCY)
+    
+    async def _read_properties(note_info: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
         try:
-            # Read note to get metadata
-            note = await vault.read_note(note_info["path"])
-            
-            # Get the property value from frontmatter
-            frontmatter = note.metadata.frontmatter
-            if prop_name not in frontmatter:
-                # Property doesn't exist
-                if operator == 'exists':
-                    continue  # Skip since we want it to exist
-                else:
-                    continue  # Skip since property is not present
-            
-            prop_value = frontmatter[prop_name]
+            # Read just the frontmatter; the body is only needed for matches
+            async with semaphore:
+                frontmatter = await vault.read_frontmatter(note_info["path"])
+        except Exception:
+            # Skip notes we can't read
+            return None
+        
+        # Skip notes where any of the properties is not present
+        if any(name not in frontmatter for name in prop_names):
+            return None
+        return note_info["path"], {name: frontmatter[name] for name in prop_names}
+    
+    async def _match_batch(batch: List[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+        candidates = [c for c in await asyncio.gather(*(_read_properties(n) for n in batch)) if c is not None]
+        
+        # Matching is CPU-only; keep it off the event loop
+        return await asyncio.to_thread(_filter_property_matches, candidates, predicates)
+    
+    # Match notes in batches as the vault walk finds them, so reading starts
+    # before the whole vault is listed and the scan can stop once it has
+    # enough matches
+    matched = []
+    batch = []
+    note_count = 0
+    async with aclosing(vault.iter_notes(recursive=True)) as notes:
+        async for note_info in notes:
+            note_count += 1
+            # Add timeout protection for large vaults
+            if note_count == 501:
+                logger.warning("Property search on large vault (over 500 notes) may be slow. Consider using search_notes_tool instead.")
             
-            # Check if property exists (special case)
-            if operator == 'exists':
-                matches = True
-            # Handle comparison operators
-            elif operator == '=':
-                # Handle array/list properties
-                if isinstance(prop_value, list):
-                    # Check if value is in the list
-                    matches = any(str(item).lower() == str(value).lower() for item in prop_value)
-                else:
-                    matches = str(prop_value).lower() == str(value).lower()
-            elif operator == '!=':
-                if isinstance(prop_value, list):
-                    # Check if value is NOT in the list
-                    matches = not any(str(item).lower() == str(value).lower() for item in prop_value)
-                else:
-                    matches = str(prop_value).lower() != str(value).lower()
-            elif operator == 'contains':
-                if isinstance(prop_value, list):
-                    # Check if any item in list contains the value
-                    matches = any(str(value).lower() in str(item).lower() for item in prop_value)
-                else:
-                    matches = str(value).lower() in str(prop_value).lower()
-            elif operator in ['>', '<', '>=', '<=']:
-                # For arrays, compare the length
-                if isinstance(prop_value, list):
-                    try:
-                        num_prop = len(prop_value)
-                        num_val = float(value)
-                        if operator == '>':
-                            matches = num_prop > num_val
-                        elif operator == '<':
-                            matches = num_prop < num_val
-                        elif operator == '>=':
-                            matches = num_prop >= num_val
-                        elif operator == '<=':
-                            matches = num_prop <= num_val
-                    except (ValueError, TypeError):
-                        matches = False
-                else:
-                    # Try date/datetime comparison first
-                    try:
-                        # Try common date formats
-                        date_prop = None
-                        date_val = None
-                        
-                        # Try ISO format first (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
-                        for fmt in ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"]:
-                            try:
-                                date_prop = datetime.strptime(str(prop_value), fmt)
-                                date_val = datetime.strptime(str(value), fmt)
-                                break
-                            except:
-                                continue
-                        
-                        if date_prop and date_val:
-                            if operator == '>':
-                                matches = date_prop > date_val
-                            elif operator == '<':
-                                matches = date_prop < date_val
-                            elif operator == '>=':
-                                matches = date_prop >= date_val
-                            elif operator == '<=':
-                                matches = date_prop <= date_val
-                        else:
-                            raise ValueError("Not a date")
-                    except:
-                        # Try numeric comparison
-                        try:
-                            num_prop = float(prop_value)
-                            num_val = float(value)
-                            if operator == '>':
-                                matches = num_prop > num_val
-                            elif operator == '<':
-                                matches = num_prop < num_val
-                            elif operator == '>=':
-                                matches = num_prop >= num_val
-                            elif operator == '<=':
-                                matches = num_prop <= num_val
-                        except (ValueError, TypeError):
-                            # Fall back to string comparison
-                            if operator == '>':
-                                matches = str(prop_value) > str(value)
-                            elif operator == '<':
-                                matches = str(prop_value) < str(value)
-                            elif operator == '>=':
-                                matches = str(prop_value) >= str(value)
-                            elif operator == '<=':
-                                matches = str(prop_value) <= str(value)
-            else:
-                matches = False
+            batch.append(note_info)
+            if len(batch) >= PROPERTY_SCAN_BATCH_SIZE:
+                matched.extend(await _match_batch(batch))
+                batch = []
+                if max_results is not None and len(matched) >= max_results:
+                    break
+        else:
+            if batch:
+                matched.extend(await _match_batch(batch))
+    
+    # The walk is unordered; return matches in path order like list_notes
+    matched.sort(key=lambda m: m[0])
+    if max_results is not None:
+        matched = matched[:max_results]
+    
+    async def _build_result(path: str, prop_values: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            async with semaphore:
+                note = await vault.read_note(path)
             
-            if matches:
-                # Create context showing the property
+            # Create context showing the properties
+            context_lines = []
+            for name, prop_value in prop_values.items():
                 if isinstance(prop_value, list):
                     # Format list values nicely
-                    context = f"{prop_name}: [{', '.join(str(v) for v in prop_value)}]"
+                    context_lines.append(f"{name}: [{', '.join(str(v) for v in prop_value)}]")
                 else:
-                    context = f"{prop_name}: {prop_value}"
-                if note.content:
-                    # Add some note content too
-                    content_preview = note.content[:context_length].strip()
-                    if len(note.content) > context_length:
-                        content_preview += "..."
-                    context = f"{context}\n\n{content_preview}"
-                
-                results.append({
-                    "path": note.path,
-                    "score": 1.0,
-                    "matches": [f"{prop_name} {operator} {value if value else 'exists'}"],
-                    "context": context,
-                    "property_value": prop_value
-                })
+                    context_lines.append(f"{name}: {prop_value}")
+            context = "\n".join(context_lines)
+            if note.content:
+                # Add some note content too
+                content_preview = note.content[:context_length].strip()
+                if len(note.content) > context_length:
+                    content_preview += "..."
+                context = f"{context}\n\n{content_preview}"
+            
+            return {
+                "path": note.path,
+                "score": 1.0,
+                "matches": [f"{name} {operator} {value if value else 'exists'}" for name, operator, value in predicates],
+                "context": context,
+                "property_values": prop_values
+            }
         except Exception:
             # Skip notes we can't read
+            return None
+    
+    processed = await asyncio.gather(*(_build_result(path, prop_values) for path, prop_values in matched))
+    return [r for r in processed if r is not None]
+
+
+def _collect_by_date(
+    vault_root: str,
+    note_paths: List[str],
+    date_type: str,
+    start_ts: float,
+    end_ts: Optional[float],
+    now: datetime
+) -> List[Dict[str, Any]]:
+    """
+    Stat notes and keep those whose timestamp falls in [start_ts, end_ts).
+    
+    Compares raw timestamps and only builds datetimes for matching notes.
+    end_ts of None means no upper bound. Runs in a worker thread.
+    """
+    results = []
+    use_ctime = date_type == "created"
+    
+    for note_path in note_paths:
+        stat = os.stat(os.path.join(vault_root, note_path))
+        timestamp = stat.st_ctime if use_ctime else stat.st_mtime
+        
+        if timestamp < start_ts or (end_ts is not None and timestamp >= end_ts):
             continue
+        
+        file_date = datetime.fromtimestamp(timestamp)
+        results.append({
+            "path": note_path,
+            "date": file_date.isoformat(),
+            "days_ago": (now - file_date).days
+        })
     
     return results
 
@@ -448,41 +662,16 @@ async def search_by_date(
         # Get all notes in the vault
         all_notes = await vault.list_notes(recursive=True)
         
-        # Filter by date
-        formatted_results = []
-        for note_info in all_notes:
-            note_path = note_info["path"]
-            
-            # Get file stats (use lenient path validation for existing files)
-            full_path = vault._get_absolute_path(note_path)
-            stat = full_path.stat()
-            
-            # Get the appropriate timestamp
-            if date_type == "created":
-                timestamp = stat.st_ctime
-            else:
-                timestamp = stat.st_mtime
-            
-            file_date = datetime.fromtimestamp(timestamp)
-            
-            # Check if it matches our criteria
-            if operator == "within":
-                if file_date >= start_date:
-                    days_diff = (now - file_date).days
-                    formatted_results.append({
-                        "path": note_path,
-                        "date": file_date.isoformat(),
-                        "days_ago": days_diff
-                    })
-            else:
-                # "exactly" - check if it's on that specific day
-                if start_date <= file_date < end_date:
-                    days_diff = (now - file_date).days
-                    formatted_results.append({
-                        "path": note_path,
-                        "date": file_date.isoformat(),
-                        "days_ago": days_diff
-                    })
+        # Filter by date; the stat calls run off the event loop
+        formatted_results = await asyncio.to_thread(
+            _collect_by_date,
+            str(vault.vault_path),
+            [note_info["path"] for note_info in all_notes],
+            date_type,
+            start_date.timestamp(),
+            end_date.timestamp() if operator != "within" else None,
+            now
+        )
         
         # Sort by date (most recent first)
         formatted_results.sort(key=lambda x: x["date"], reverse=True)
@@ -578,7 +767,7 @@ async def search_by_property(
         try:
             vault = get_vault()
             query = f"property:{property_name}:{operator}{value}" if operator != "exists" else f"property:{property_name}:*"
-            results = await _search_by_property(vault, query, context_length)
+            results = await _search_by_property(vault, query, context_length, MANUAL_PROPERTY_MAX_RESULTS)
             
             return {
                 "results": results,
@@ -590,7 +779,7 @@ async def search_by_property(
                     "context_length": context_length,
                     "search_method": "manual_fallback"
                 },
-                "truncated": False,
+                "truncated": len(results) >= MANUAL_PROPERTY_MAX_RESULTS,
                 "performance_note": f"Used manual search for complex operator '{operator}'. For better performance on large vaults, consider using simpler operators."
             }
         except Exception as e:
@@ -686,7 +875,7 @@ async def search_by_property(
         try:
             vault = get_vault()
             query = f"property:{property_name}:{value}" if operator != "exists" else f"property:{property_name}:*"
-            results = await _search_by_property(vault, query, context_length)
+            results = await _search_by_property(vault, query, context_length, MANUAL_PROPERTY_MAX_RESULTS)
             
             return {
                 "results": results,
@@ -698,7 +887,7 @@ async def search_by_property(
                     "context_length": context_length,
                     "search_method": "manual_fallback"
                 },
-                "truncated": False,
+                "truncated": len(results) >= MANUAL_PROPERTY_MAX_RESULTS,
                 "performance_note": "Fast search failed, used manual search as fallback."
             }
         except Exception as fallback_error:
@@ -716,6 +905,77 @@ async def search_by_property(
             }
 
 
+def _build_property_query(property_name: str, operator: str, value: Optional[str]) -> str:
+    """Turn a property name, operator and value into a property:name:... query string."""
+    if operator == "exists":
+        return f"property:{property_name}:*"
+    if operator == "contains":
+        return f"property:{property_name}:*{value}*"
+    if operator in ("=", "equals"):
+        return f"property:{property_name}:{value}"
+    return f"property:{property_name}:{operator}{value}"
+
+
+async def search_by_properties(
+    filters: List[Dict[str, Any]],
+    context_length: int = 100,
+    ctx=None
+) -> dict:
+    """
+    Search for notes whose frontmatter matches all of several property filters.
+    
+    Reads each note's frontmatter once and checks every filter against it,
+    so combined queries like "status = active AND priority > 3" cost one
+    pass over the vault rather than one search per property.
+    
+    Args:
+        filters: List of {"property": name, "operator": op, "value": value}.
+            Operators are the same as search_by_property; operator defaults
+            to "=" and value may be omitted for "exists"
+        context_length: Characters of note content to include in results
+        ctx: MCP context for progress reporting
+        
+    Returns:
+        Dictionary with search results including each note's property values
+        
+    Example:
+        >>> await search_by_properties([
+        ...     {"property": "status", "value": "active"},
+        ...     {"property": "priority", "operator": ">", "value": "3"}
+        ... ])
+    """
+    if not filters:
+        raise ValueError("At least one property filter is required")
+    
+    operators = ["=", "equals", "!=", ">", "<", ">=", "<=", "contains", "exists"]
+    queries = []
+    for property_filter in filters:
+        property_name = property_filter.get("property")
+        operator = property_filter.get("operator", "=")
+        if not property_name:
+            raise ValueError(f"Property filter is missing 'property': {property_filter}")
+        if operator not in operators:
+            raise ValueError(f"Invalid operator: {operator}. Supported: {', '.join(operators)}")
+        queries.append(_build_property_query(property_name, operator, property_filter.get("value")))
+    
+    if ctx:
+        ctx.info(f"Property search with {len(queries)} filters")
+    
+    vault = get_vault()
+    results = await _search_by_properties(vault, queries, context_length, MANUAL_PROPERTY_MAX_RESULTS)
+    
+    return {
+        "results": results,
+        "count": len(results),
+        "query": {
+            "filters": filters,
+            "context_length": context_length,
+            "search_method": "manual_batch"
+        },
+        "truncated": len(results) >= MANUAL_PROPERTY_MAX_RESULTS
+    }
+
+
 async def list_notes(
     directory: Optional[str] = None,
     recursive: bool = True,
@@ -838,7 +1098,12 @@ async def list_folders(
         # Determine search path
         if directory:
             search_path = vault._ensure_safe_path(directory)
-            if not search_path.exists() or not search_path.is_dir():
+            # One stat answers both "exists" and "is a directory"
+            try:
+                is_dir = S_ISDIR(os.stat(search_path).st_mode)
+            except OSError:
+                is_dir = False
+            if not is_dir:
                 return {
                     "directory": directory,
                     "recursive": recursive,
@@ -848,33 +1113,38 @@ async def list_folders(
         else:
             search_path = vault.vault_path
         
-        # Find all directories
-        folders = []
+        # Find all directories as (path, name) tuples; dicts are only built
+        # once they are sorted
+        found = []
         if recursive:
-            # Recursive search
-            for path in search_path.rglob("*"):
-                if path.is_dir():
-                    rel_path = path.relative_to(vault.vault_path)
-                    # Skip hidden directories
-                    if not any(part.startswith(".") for part in rel_path.parts):
-                        folders.append({
-                            "path": str(rel_path),
-                            "name": path.name
-                        })
+            # Recursive search - walk with scandir so only directory entries
+            # cost anything beyond the listing itself
+            start = "" if search_path == vault.vault_path else str(search_path.relative_to(vault.vault_path))
+            stack = [(str(search_path), start)]
+            while stack:
+                current, rel_dir = stack.pop()
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        # Skip hidden directories (and everything beneath them)
+                        if entry.name.startswith(".") or not entry.is_dir():
+                            continue
+                        rel_path = os.path.join(rel_dir, entry.name)
+                        found.append((rel_path, entry.name))
+                        # List symlinked folders but don't descend into them
+                        if not entry.is_symlink():
+                            stack.append((entry.path, rel_path))
         else:
             # Non-recursive - only immediate subdirectories
-            for path in search_path.iterdir():
-                if path.is_dir():
-                    rel_path = path.relative_to(vault.vault_path)
+            start = "" if search_path == vault.vault_path else str(search_path.relative_to(vault.vault_path))
+            with os.scandir(search_path) as entries:
+                for entry in entries:
                     # Skip hidden directories
-                    if not path.name.startswith("."):
-                        folders.append({
-                            "path": str(rel_path),
-                            "name": path.name
-                        })
+                    if not entry.name.startswith(".") and entry.is_dir():
+                        found.append((os.path.join(start, entry.name), entry.name))
         
-        # Sort by path
-        folders.sort(key=lambda x: x["path"])
+        # Sort by path (paths are unique, so names never break ties)
+        found.sort()
+        folders = [{"path": path, "name": name} for path, name in found]
         
         # Return standardized list results structure
         return {
@@ -900,85 +1170,397 @@ async def list_folders(
         }
 
 
-async def _search_by_regex_filtered(vault, notes_list, pattern: str, regex_flags: int, context_length: int, max_results: int) -> List[Dict[str, Any]]:
+def _collect_literal_runs(items, runs: List[str]) -> None:
+    """Append the runs of literal characters a parsed regex sequence requires."""
+    run = []
+    for op, av in items:
+        if op is _regex_parser.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            runs.append("".join(run))
+            run = []
+        if op is _regex_parser.SUBPATTERN:
+            # Groups are mandatory unless they switch case-insensitivity on
+            if not av[1] & re.IGNORECASE:
+                _collect_literal_runs(av[3], runs)
+        elif op in _REGEX_REPEATS and av[0] >= 1:
+            _collect_literal_runs(av[2], runs)
+    if run:
+        runs.append("".join(run))
+
+
+def _required_literal(regex: re.Pattern) -> Optional[str]:
     """
-    Directory-aware regex search that only searches through specified notes.
-    Much faster than vault-wide search when directory is specified.
+    Find the longest literal substring every match of a regex must contain.
+    
+    Lets the search skip notes with a plain substring test before running the
+    regex engine. Case-insensitive patterns have no usable literal, since case
+    folding is wider than lowercasing both sides.
+    """
+    if regex.flags & re.IGNORECASE:
+        return None
+    try:
+        parsed = _regex_parser.parse(regex.pattern, regex.flags)
+    except Exception:
+        return None
+    runs: List[str] = []
+    _collect_literal_runs(parsed, runs)
+    return max(runs, key=len, default=None)
+
+
+class _LiteralMatch:
+    """The parts of re.Match the regex search reads, for a literal match."""
+    
+    __slots__ = ("_start", "_end", "_text")
+    
+    def __init__(self, start: int, end: int, text: str):
+        self._start = start
+        self._end = end
+        self._text = text
+    
+    def start(self) -> int:
+        return self._start
+    
+    def end(self) -> int:
+        return self._end
+    
+    def group(self, index: int = 0) -> str:
+        if index != 0:
+            raise IndexError("no such group")
+        return self._text
+    
+    def groups(self) -> tuple:
+        return ()
+
+
+class _LiteralPattern:
+    """
+    Stand-in for a compiled regex that is a plain literal.
+    
+    finditer walks the text with str.find instead of the regex engine and
+    yields the same non-overlapping matches.
+    """
+    
+    def __init__(self, regex: re.Pattern, literal: str):
+        self.pattern = regex.pattern
+        self.flags = regex.flags
+        self.literal = literal
+    
+    def finditer(self, string: str):
+        literal = self.literal
+        step = len(literal)
+        find = string.find
+        idx = find(literal)
+        while idx != -1:
+            yield _LiteralMatch(idx, idx + step, literal)
+            idx = find(literal, idx + step)
+
+
+@lru_cache(maxsize=256)
+def _specialize_regex(regex: re.Pattern):
     """
-    import re
+    Swap a case-sensitive, purely literal pattern for a str.find matcher.
     
-    # Compile regex pattern
+    Patterns with any other construct (classes, repeats, groups, anchors)
+    are returned unchanged.
+    """
+    if regex.flags & re.IGNORECASE:
+        return regex
     try:
-        regex = re.compile(pattern, regex_flags)
-    except re.error as e:
-        raise ValueError(f"Invalid regex pattern: {e}")
+        parsed = _regex_parser.parse(regex.pattern, regex.flags)
+    except Exception:
+        return regex
+    chars = []
+    for op, av in parsed:
+        if op is _regex_parser.IN and len(av) == 1 and av[0][0] is _regex_parser.LITERAL:
+            # A single-character class like [.] is still a literal
+            op, av = av[0]
+        if op is not _regex_parser.LITERAL:
+            return regex
+        chars.append(chr(av))
+    if not chars:
+        return regex
+    return _LiteralPattern(regex, "".join(chars))
+
+
+async def _ripgrep_candidates(vault_root: Path, directory: Optional[str], literal: str) -> Optional[Set[str]]:
+    """
+    Find the notes under directory that contain literal, using ripgrep.
     
-    results = []
+    Only a fixed-string search is delegated: ripgrep's regex dialect differs
+    from Python's, so the pattern itself always runs through re. Returns
+    vault-relative paths, or None if ripgrep is unavailable or fails.
+    """
+    # Note content is decoded with universal newlines, so literals with line
+    # breaks don't match the raw bytes ripgrep sees
+    if _RIPGREP is None or any(c in literal for c in "\r\n\x00"):
+        return None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            _RIPGREP, "--files-with-matches", "--null", "--fixed-strings",
+            "--no-ignore", "--hidden", "--follow", "--text", "--encoding", "none",
+            "--no-messages", "--iglob", "*.md", "-e", literal, "--", directory or ".",
+            cwd=str(vault_root),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except OSError as e:
+        logger.debug(f"ripgrep unavailable: {e}")
+        return None
+    try:
+        stdout, _ = await proc.communicate()
+    except asyncio.CancelledError:
+        proc.kill()
+        raise
+    # 0: some files matched, 1: none did, 2: an error (results may be partial)
+    if proc.returncode not in (0, 1):
+        return None
+    return {os.path.normpath(os.fsdecode(path)) for path in stdout.split(b"\0") if path}
+
+
+def _file_contains(full_path: Path, needle: bytes) -> bool:
+    """
+    Check a note's raw bytes for needle without decoding or parsing it.
+    
+    Large notes are scanned through a memory map. Returns True if the file
+    can't be read, so the caller's normal read reports the error.
+    """
+    try:
+        with open(full_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_READ_THRESHOLD:
+                return needle in f.read()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(needle) != -1
+    except (OSError, ValueError):
+        return True
+
+
+def _regex_note_result(path: str, content: str, regex: re.Pattern, context_length: int) -> Optional[Dict[str, Any]]:
+    """Build the search_by_regex result for one note, or None if it doesn't match."""
+    # Walk matches lazily; only the first few are kept for context
+    matches = regex.finditer(content)
     
-    # Search through only the specified notes
-    for note_info in notes_list:
-        if len(results) >= max_results:
-            break
+    # Extract contexts for matches; matches whose windows clip to the same
+    # range (e.g. several hits in a short note) share one context string
+    match_contexts = []
+    contexts: Dict[Tuple[int, int], str] = {}
+    line_num = 1  # Start at 1 for human-readable line numbers
+    counted_to = 0
+    for match in islice(matches, 5):  # Limit to first 5 matches per file
+        match_start = match.start()
+        match_end = match.end()
+        
+        # Find line number by counting newlines since the
+        # previous match (matches come in order)
+        line_num += content.count('\n', counted_to, match_start)
+        counted_to = match_start
+        
+        # Extract context
+        context_start = max(0, match_start - context_length // 2)
+        context_end = min(len(content), match_end + context_length // 2)
+        context = contexts.get((context_start, context_end))
+        if context is None:
+            context = content[context_start:context_end].strip()
             
+            # Add ellipsis if truncated
+            if context_start > 0:
+                context = "..." + context
+            if context_end < len(content):
+                context = context + "..."
+            contexts[(context_start, context_end)] = context
+        
+        match_contexts.append({
+            "match": match.group(0),
+            "line": line_num,
+            "context": context,
+            "groups": match.groups() if match.groups() else None
+        })
+    
+    if not match_contexts:
+        return None
+    
+    # Count the remaining matches without holding on to them
+    match_count = len(match_contexts) + sum(1 for _ in matches)
+    return {
+        "path": path,
+        "match_count": match_count,
+        "matches": match_contexts,
+        "score": min(match_count / 5.0 + 1.0, 5.0)  # Score based on match count
+    }
+
+
+def _scan_regex_chunk(vault_root: str, paths: List[str], regex: re.Pattern, context_length: int, literal: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Match regex against a chunk of notes inside a worker process.
+    
+    Reads notes the way read_note does (UTF-8, universal newlines, at most
+    MAX_NOTE_SIZE) and returns results in the order of paths.
+    """
+    results = []
+    for path in paths:
+        full_path = os.path.join(vault_root, path)
         try:
-            # Read the note content
-            note = await vault.read_note(note_info["path"])
-            content = note.content
-            
-            # Find all matches with their positions
-            matches = list(regex.finditer(content))
+            if os.stat(full_path).st_size > MAX_NOTE_SIZE:
+                continue
+            with open(full_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to search in {path}: {e}")
+            continue
+        
+        if literal and literal not in content:
+            continue
+        result = _regex_note_result(path, content, regex, context_length)
+        if result:
+            results.append(result)
+    return results
+
+
+def _get_regex_pool() -> ProcessPoolExecutor:
+    """Return the process pool for large regex scans, creating it on first use."""
+    global _REGEX_POOL
+    if _REGEX_POOL is None:
+        # Workers are spawned rather than forked: a fork would copy the
+        # server's event loop, threads and open SQLite connections
+        _REGEX_POOL = ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, REGEX_POOL_MAX_WORKERS),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _REGEX_POOL
+
+
+def _shutdown_regex_pool() -> None:
+    """Stop the regex pool's workers, dropping queued chunks; the next large scan starts a new pool."""
+    global _REGEX_POOL
+    if _REGEX_POOL is not None:
+        pool, _REGEX_POOL = _REGEX_POOL, None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Don't leave workers behind (or queued chunks running) when the server exits
+atexit.register(_shutdown_regex_pool)
+
+
+async def _search_by_regex_pooled(vault, notes_list, regex: re.Pattern, context_length: int, max_results: int, literal: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Run the directory-scoped regex scan across worker processes.
+    
+    Chunks are consumed in list order so the max_results cut-off picks the
+    same notes as the in-process scan.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_regex_pool()
+    vault_root = str(vault.vault_path)
+    paths = [note_info["path"] for note_info in notes_list]
+    
+    results = []
+    scans = [
+        loop.run_in_executor(
+            pool, _scan_regex_chunk, vault_root,
+            paths[i:i + REGEX_POOL_CHUNK_SIZE], regex, context_length, literal
+        )
+        for i in range(0, len(paths), REGEX_POOL_CHUNK_SIZE)
+    ]
+    try:
+        for scan in scans:
+            results.extend(await scan)
+            if len(results) >= max_results:
+                break
+    finally:
+        # Drop chunks that haven't started once enough notes have matched
+        for scan in scans:
+            scan.cancel()
+    
+    return results[:max_results]
+
+
+async def _search_by_regex_filtered(vault, notes_list, regex: re.Pattern, context_length: int, max_results: int, directory: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Directory-aware regex search that only searches through specified notes.
+    Much faster than vault-wide search when directory is specified.
+    """
+    results = []
+    regex = _specialize_regex(regex)
+    literal = _required_literal(regex)
+    
+    # On large scopes, let ripgrep rule out notes without the literal so they
+    # are never read
+    if literal and len(notes_list) >= RIPGREP_MIN_NOTES:
+        found = await _ripgrep_candidates(vault.vault_path, directory, literal)
+        if found is not None:
+            notes_list = [note_info for note_info in notes_list if note_info["path"] in found]
+            literal = None
+    
+    # Matching is CPU-bound and holds the GIL, so large scopes are spread
+    # across worker processes
+    if len(notes_list) >= REGEX_POOL_MIN_NOTES and (os.cpu_count() or 1) > 1:
+        try:
+            results = await _search_by_regex_pooled(vault, notes_list, regex, context_length, max_results, literal)
+        except (BrokenProcessPool, OSError, pickle.PicklingError) as e:
+            logger.debug(f"Process pool regex scan failed, scanning in-process: {e}")
+            if isinstance(e, BrokenProcessPool):
+                _shutdown_regex_pool()
+        else:
+            results.sort(key=lambda x: x["score"], reverse=True)
+            return results
+    
+    # Otherwise check the literal against each note's raw bytes, so notes
+    # without it are never decoded or parsed. Decoding translates newlines,
+    # so literals with line breaks are left to the str check below.
+    needle = literal.encode('utf-8') if literal and not any(c in literal for c in "\r\n") else None
+    
+    semaphore = asyncio.Semaphore(NOTE_READ_CONCURRENCY)
+    
+    async def _read(note_info: Dict[str, Any]):
+        async with semaphore:
+            if needle and not await asyncio.to_thread(_file_contains, vault.vault_path / note_info["path"], needle):
+                return None
+            return await vault.read_note(note_info["path"])
+    
+    # Reads run up to REGEX_READ_AHEAD notes ahead of matching, but notes are
+    # consumed in list order so the max_results cut-off picks the same notes
+    # as a sequential scan
+    pending = iter(notes_list)
+    reads = deque(
+        (note_info, asyncio.create_task(_read(note_info)))
+        for note_info in islice(pending, REGEX_READ_AHEAD)
+    )
+    try:
+        # Search through only the specified notes
+        while reads and len(results) < max_results:
+            note_info, read = reads.popleft()
+            # Refill the window before waiting on this note
+            for next_info in islice(pending, 1):
+                reads.append((next_info, asyncio.create_task(_read(next_info))))
             
-            if matches:
-                # Get line numbers for better context
-                lines = content.split('\n')
-                line_starts = [0]
-                for line in lines[:-1]:
-                    line_starts.append(line_starts[-1] + len(line) + 1)
+            try:
+                # Read the note content
+                note = await read
+                if note is None:
+                    continue
+                content = note.content
                 
-                # Extract contexts for matches
-                match_contexts = []
-                for match in matches[:5]:  # Limit to first 5 matches per file
-                    match_start = match.start()
-                    match_end = match.end()
-                    
-                    # Find line number
-                    line_num = 1  # Start at 1 for human-readable line numbers
-                    for i, start in enumerate(line_starts):
-                        if start > match_start:
-                            line_num = i
-                            break
-                    else:
-                        line_num = len(lines)
-                    
-                    # Extract context
-                    context_start = max(0, match_start - context_length // 2)
-                    context_end = min(len(content), match_end + context_length // 2)
-                    context = content[context_start:context_end].strip()
-                    
-                    # Add ellipsis if truncated
-                    if context_start > 0:
-                        context = "..." + context
-                    if context_end < len(content):
-                        context = context + "..."
-                    
-                    match_contexts.append({
-                        "match": match.group(0),
-                        "line": line_num,
-                        "context": context,
-                        "groups": match.groups() if match.groups() else None
-                    })
+                # Notes without the pattern's required literal can't match
+                if literal and literal not in content:
+                    continue
                 
-                results.append({
-                    "path": note_info["path"],
-                    "match_count": len(matches),
-                    "matches": match_contexts,
-                    "score": min(len(matches) / 5.0 + 1.0, 5.0)  # Score based on match count
-                })
-        
-        except Exception as e:
-            # Skip notes we can't read, but log for debugging
-            logger.warning(f"Failed to search in {note_info['path']}: {e}")
-            continue
+                result = _regex_note_result(note_info["path"], content, regex, context_length)
+                if result:
+                    results.append(result)
+            
+            except Exception as e:
+                # Skip notes we can't read, but log for debugging
+                logger.warning(f"Failed to search in {note_info['path']}: {e}")
+                continue
+    
+    finally:
+        # Drop reads we no longer need once enough notes have matched, and
+        # collect them so a read that already failed isn't logged as an
+        # unretrieved task exception
+        for _, read in reads:
+            read.cancel()
+        await asyncio.gather(*(read for _, read in reads), return_exceptions=True)
     
     # Sort by score (descending)
     results.sort(key=lambda x: x["score"], reverse=True)
@@ -1050,18 +1632,6 @@ async def search_by_regex(
         # Find URLs: r"https?://[^\\s)>]+"
         # Find code blocks: r"```python([^`]+)```"
     """
-    # Validate regex pattern
-    try:
-        # Test compile the pattern
-        re.compile(pattern)
-    except re.error as e:
-        raise ValueError(f"Invalid regular expression pattern: {e}")
-    
-    # Validate context_length
-    is_valid, error = validate_context_length(context_length)
-    if not is_valid:
-        raise ValueError(error)
-    
     # Convert string flags to regex flags
     regex_flags = 0
     if flags:
@@ -1079,6 +1649,17 @@ async def search_by_regex(
             else:
                 raise ValueError(f"Unknown regex flag: {flag}. Supported flags: ignorecase/i, multiline/m, dotall/s")
     
+    # Validate regex pattern; the compiled pattern is reused for the search
+    try:
+        regex = compile_regex(pattern, regex_flags)
+    except re.error as e:
+        raise ValueError(f"Invalid regular expression pattern: {e}")
+    
+    # Validate context_length
+    is_valid, error = validate_context_length(context_length)
+    if not is_valid:
+        raise ValueError(error)
+    
     if ctx:
         ctx.info(f"Searching with regex pattern: {pattern}")
     
@@ -1133,7 +1714,7 @@ async def search_by_regex(
                 if ctx:
                     ctx.info(f"Using directory-filtered regex search: {vault_size} notes in '{directory}'")
                 results = await asyncio.wait_for(
-                    _search_by_regex_filtered(vault, all_notes, pattern, regex_flags, context_length, max_results),
+                    _search_by_regex_filtered(vault, all_notes, regex, context_length, max_results, directory),
                     timeout=timeout
                 )
             else:
@@ -1232,32 +1813,44 @@ async def search_by_regex(
         }
 
 
+# Shapes of regex patterns that search_notes can answer directly
+_SIMPLE_WORD_PATTERN = re.compile(r'^\\?w*([a-zA-Z0-9_]+)\\?w*$')
+_SIMPLE_TEXT_PATTERN = re.compile(r'^[a-zA-Z0-9\s_-]+$')
+_ESCAPED_CHAR = re.compile(r'\\(.)')
+_LITERAL_TEXT_PATTERN = re.compile(r'^[a-zA-Z0-9\s_.-]+$')
+_SIMPLE_OR_PATTERN = re.compile(r'^\(([^)]+)\)$')
+_OR_TERM_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+
 def _suggest_fast_alternative(pattern: str, flags: Optional[List[str]] = None) -> Optional[str]:
     """Suggest a fast search alternative for simple regex patterns."""
-    import re
-    
     # Check if case insensitive
-    is_case_insensitive = flags and any(f.lower() in ['i', 'ignorecase'] for f in flags)
-    
+    is_case_insensitive = bool(flags and any(f.lower() in ['i', 'ignorecase'] for f in flags))
+    return _fast_alternative(pattern, is_case_insensitive)
+
+
+@lru_cache(maxsize=256)
+def _fast_alternative(pattern: str, is_case_insensitive: bool) -> Optional[str]:
+    """Cached body of _suggest_fast_alternative; flags reduced to case sensitivity."""
     # Simple word patterns
-    simple_word = re.match(r'^\\?w*([a-zA-Z0-9_]+)\\?w*$', pattern)
+    simple_word = _SIMPLE_WORD_PATTERN.match(pattern)
     if simple_word:
         return simple_word.group(1).lower() if is_case_insensitive else simple_word.group(1)
     
     # Simple text patterns without special chars
-    if re.match(r'^[a-zA-Z0-9\s_-]+$', pattern):
+    if _SIMPLE_TEXT_PATTERN.match(pattern):
         return pattern.lower() if is_case_insensitive else pattern
     
     # Literal strings with escaped special chars
-    literal_pattern = re.sub(r'\\(.)', r'\1', pattern)
-    if re.match(r'^[a-zA-Z0-9\s_.-]+$', literal_pattern):
+    literal_pattern = _ESCAPED_CHAR.sub(r'\1', pattern)
+    if _LITERAL_TEXT_PATTERN.match(literal_pattern):
         return literal_pattern.lower() if is_case_insensitive else literal_pattern
     
     # Simple OR patterns
-    or_match = re.match(r'^\(([^)]+)\)$', pattern)
+    or_match = _SIMPLE_OR_PATTERN.match(pattern)
     if or_match:
         terms = or_match.group(1).split('|')
-        if all(re.match(r'^[a-zA-Z0-9_-]+$', term.strip()) for term in terms):
+        if all(_OR_TERM_PATTERN.match(term.strip()) for term in terms):
             clean_terms = [term.strip() for term in terms]
             if is_case_insensitive:
                 clean_terms = [term.lower() for term in clean_terms]
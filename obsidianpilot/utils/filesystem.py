@@ -9,15 +9,57 @@ import yaml
 import base64
 import io
 import logging
+import mmap
+import shutil
+import tempfile
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Set, Tuple, AsyncIterator, Iterator
 from PIL import Image
 from ..models import Note, NoteMetadata
 from .persistent_index import PersistentSearchIndex
+from .validation import compile_regex
 
 logger = logging.getLogger(__name__)
 
+# Number of parsed notes kept by ObsidianVault.read_note
+NOTE_CACHE_SIZE = 64
+
+# Number of parsed frontmatter blocks kept by ObsidianVault.read_frontmatter
+FRONTMATTER_CACHE_SIZE = 4096
+
+# Number of image filename -> path lookups kept by ObsidianVault.find_image
+IMAGE_PATH_CACHE_SIZE = 512
+
+# How long a "not found" image lookup is trusted before walking the vault again
+IMAGE_NOT_FOUND_TTL = 30  # seconds
+
+# Largest note read_note will load
+MAX_NOTE_SIZE = 10 * 1024 * 1024  # 10MB
+
+# Chunk size used when streaming edits through a note
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Notes at least this large are read through mmap; below it a plain read is cheaper
+MMAP_READ_THRESHOLD = 64 * 1024
+
+# Notes found per step of the background vault walk in iter_notes, and how
+# many steps it may run ahead of the consumer
+NOTE_WALK_CHUNK_SIZE = 256
+NOTE_WALK_QUEUE_SIZE = 4
+
+# Number of (directory, recursive) listings kept by ObsidianVault.list_notes
+NOTE_LIST_CACHE_SIZE = 32
+
+# Files and directories modified this recently may change again without
+# their mtime changing (FAT keeps 2-second timestamps), so caches keyed on
+# mtime don't trust them yet
+RACY_MTIME_WINDOW = 2.0  # seconds
+
 
 class ObsidianVault:
     """Direct filesystem access to Obsidian vault."""
@@ -55,6 +97,34 @@ class ObsidianVault:
         
         # Track if persistent index has been initialized
         self._persistent_index_initialized = False
+        
+        # Recently read notes, keyed by path and validated against (mtime_ns, size)
+        # so read-modify-write loops on the same note skip the read and YAML parse;
+        # notes modified within RACY_MTIME_WINDOW are stored with mtime_ns -1
+        self._note_cache: "OrderedDict[str, Tuple[int, int, Note]]" = OrderedDict()
+        
+        # Frontmatter only, for scans that filter on properties across the vault
+        self._frontmatter_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+        
+        # Inverted tag index (tag -> paths), plus the (mtime_ns, size, tags)
+        # each path was indexed at so only changed notes are re-read
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._tag_index_files: Dict[str, Tuple[int, int, List[str]]] = {}
+        self._tag_index_lock = asyncio.Lock()
+        
+        # list_notes results keyed by (directory, recursive), with the mtime_ns
+        # of every directory the listing walked; any file added, removed or
+        # renamed changes one of those, so unchanged mtimes mean the same notes
+        self._note_list_cache: "OrderedDict[Tuple[Optional[str], bool], Tuple[Dict[str, int], List[Dict[str, str]]]]" = OrderedDict()
+        
+        # Image filename -> (relative path or None, lookup time), so repeated
+        # references don't walk the whole vault again
+        self._image_path_cache: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        
+        # Write coalescing: latest unwritten content per file, and the task
+        # currently flushing that file
+        self._pending_writes: Dict[Path, str] = {}
+        self._write_flushes: Dict[Path, asyncio.Future] = {}
     
     def _ensure_safe_path(self, path: str) -> Path:
         """
@@ -277,7 +347,7 @@ class ObsidianVault:
             path: Path to note relative to vault root
             
         Returns:
-            Note object with content and metadata
+            Note object with content and metadata (a copy the caller may modify)
         """
         # Ensure .md extension
         if not path.endswith('.md'):
@@ -286,18 +356,28 @@ class ObsidianVault:
         # Use lenient path validation for reading existing files
         full_path = self._get_absolute_path(path)
         
-        if not full_path.exists():
+        await self._wait_for_write(full_path)
+        try:
+            stat = full_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Note not found: {path}")
         
+        # Serve unchanged notes from the cache
+        cached = self._note_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            self._note_cache.move_to_end(path)
+            return cached[2].model_copy(deep=True)
+        
         # Check file size to prevent memory issues
-        stat = full_path.stat()
-        max_size = 10 * 1024 * 1024  # 10MB limit
-        if stat.st_size > max_size:
-            raise ValueError(f"File too large: {stat.st_size} bytes (max: {max_size} bytes)")
+        if stat.st_size > MAX_NOTE_SIZE:
+            raise ValueError(f"File too large: {stat.st_size} bytes (max: {MAX_NOTE_SIZE} bytes)")
         
         # Read file content asynchronously
-        async with aiofiles.open(full_path, 'r', encoding='utf-8') as f:
-            content = await f.read()
+        if stat.st_size >= MMAP_READ_THRESHOLD:
+            content = await asyncio.to_thread(self._read_text_mmap, full_path)
+        else:
+            async with aiofiles.open(full_path, 'r', encoding='utf-8') as f:
+                content = await f.read()
         
         # Parse frontmatter
         frontmatter, clean_content = self._parse_frontmatter(content)
@@ -308,9 +388,6 @@ class ObsidianVault:
         # Extract tags
         tags = self._extract_tags(clean_content, normalized_frontmatter)
         
-        # Get file stats
-        stat = full_path.stat()
-        
         # Create metadata
         metadata = NoteMetadata(
             tags=tags,
@@ -320,16 +397,195 @@ class ObsidianVault:
             frontmatter=normalized_frontmatter
         )
         
-        return Note(
+        note = Note(
             path=path,
             content=content,
             metadata=metadata
         )
+        
+        # A just-modified note is re-read next time, in case it changes
+        # again within the same mtime tick and at the same size
+        mtime_ns = -1 if stat.st_mtime > time.time() - RACY_MTIME_WINDOW else stat.st_mtime_ns
+        self._note_cache[path] = (mtime_ns, stat.st_size, note)
+        self._note_cache.move_to_end(path)
+        if len(self._note_cache) > NOTE_CACHE_SIZE:
+            self._note_cache.popitem(last=False)
+        
+        # Callers edit notes in place (e.g. tag updates), so the cached
+        # instance is never handed out
+        return note.model_copy(deep=True)
+    
+    async def read_frontmatter(self, path: str) -> Dict[str, Any]:
+        """
+        Read only the frontmatter of a note.
+        
+        Stops reading at the closing --- so property filters over the whole
+        vault don't load note bodies. Returns the same normalized dict as
+        read_note(path).metadata.frontmatter. The returned dict is cached;
+        don't modify it.
+        
+        Args:
+            path: Path to note relative to vault root
+            
+        Returns:
+            Normalized frontmatter dict (empty if the note has none)
+        """
+        # Ensure .md extension
+        if not path.endswith('.md'):
+            path += '.md'
+        
+        full_path = self._get_absolute_path(path)
+        
+        await self._wait_for_write(full_path)
+        try:
+            stat = full_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Note not found: {path}")
+        
+        # A fully parsed note is just as good
+        cached_note = self._note_cache.get(path)
+        if cached_note and cached_note[0] == stat.st_mtime_ns and cached_note[1] == stat.st_size:
+            return cached_note[2].metadata.frontmatter
+        
+        cached = self._frontmatter_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            self._frontmatter_cache.move_to_end(path)
+            return cached[2]
+        
+        header = await asyncio.to_thread(self._read_frontmatter_block, full_path)
+        frontmatter = self._normalize_frontmatter(self._parse_frontmatter(header)[0]) if header else {}
+        
+        mtime_ns = -1 if stat.st_mtime > time.time() - RACY_MTIME_WINDOW else stat.st_mtime_ns
+        self._frontmatter_cache[path] = (mtime_ns, stat.st_size, frontmatter)
+        self._frontmatter_cache.move_to_end(path)
+        if len(self._frontmatter_cache) > FRONTMATTER_CACHE_SIZE:
+            self._frontmatter_cache.popitem(last=False)
+        
+        return frontmatter
+    
+    @staticmethod
+    def _read_frontmatter_block(full_path: Path) -> str:
+        """
+        Read a note up to and including its closing --- line.
+        
+        Returns an empty string if the note doesn't start with frontmatter
+        or it is never closed, matching _parse_frontmatter.
+        """
+        with open(full_path, 'r', encoding='utf-8') as f:
+            first = f.readline()
+            if first != "---\n":
+                return ""
+            lines = [first]
+            for line in f:
+                # _parse_frontmatter looks for "\n---\n" from offset 4, so a
+                # --- directly on the second line doesn't close the block
+                if line == "---\n" and len(lines) > 1:
+                    lines.append(line)
+                    return "".join(lines)
+                lines.append(line)
+        return ""
+    
+    async def get_tag_index(self, paths: Optional[List[str]] = None) -> Dict[str, Set[str]]:
+        """
+        Return an inverted index of tag -> note paths.
+        
+        Built on first use; later calls only stat each note and re-read the
+        ones whose mtime or size changed, so repeated tag searches don't
+        parse the whole vault. The returned dict is shared; don't modify it.
+        
+        Args:
+            paths: Note paths to index (default: every note in the vault)
+            
+        Returns:
+            Dict mapping each tag (without #) to the paths of notes carrying it
+        """
+        if paths is None:
+            paths = [note_info["path"] for note_info in await self.list_notes(recursive=True)]
+        
+        async with self._tag_index_lock:
+            await asyncio.to_thread(self._refresh_tag_index, paths)
+        return self._tag_index
+    
+    def _refresh_tag_index(self, paths: List[str]) -> None:
+        """Bring the tag index up to date with the given note paths (blocking)."""
+        current = set(paths)
+        for path in [p for p in self._tag_index_files if p not in current]:
+            self._unindex_tags(path)
+        
+        racy_after = time.time() - RACY_MTIME_WINDOW
+        for path in paths:
+            try:
+                stat = os.stat(self.vault_path / path)
+            except OSError:
+                self._unindex_tags(path)
+                continue
+            
+            indexed = self._tag_index_files.get(path)
+            if indexed and indexed[0] == stat.st_mtime_ns and indexed[1] == stat.st_size:
+                continue
+            
+            self._unindex_tags(path)
+            
+            # Notes read_note would refuse are left out, and retried next time
+            if stat.st_size > MAX_NOTE_SIZE:
+                continue
+            try:
+                with open(self.vault_path / path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except (OSError, ValueError):
+                continue
+            
+            frontmatter, clean_content = self._parse_frontmatter(content)
+            tags = self._extract_tags(clean_content, self._normalize_frontmatter(frontmatter))
+            
+            # A just-modified note is re-read next time, in case it changes
+            # again within the same mtime tick
+            mtime_ns = -1 if stat.st_mtime > racy_after else stat.st_mtime_ns
+            self._tag_index_files[path] = (mtime_ns, stat.st_size, tags)
+            for tag in tags:
+                self._tag_index.setdefault(tag, set()).add(path)
+    
+    def _unindex_tags(self, path: str) -> None:
+        """Remove a note from the tag index."""
+        indexed = self._tag_index_files.pop(path, None)
+        if not indexed:
+            return
+        
+        for tag in indexed[2]:
+            tagged = self._tag_index.get(tag)
+            if tagged is not None:
+                tagged.discard(path)
+                if not tagged:
+                    del self._tag_index[tag]
+    
+    @staticmethod
+    def _read_text_mmap(full_path: Path) -> str:
+        """
+        Read a large UTF-8 file by decoding straight from a memory map.
+        
+        Avoids the intermediate bytes copy of a buffered read; newlines are
+        translated the same way as a text-mode read.
+        """
+        with open(full_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, 'utf-8')
+        
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
     
     async def write_note(self, path: str, content: str, overwrite: bool = False) -> Note:
         """
         Write a note to the vault.
         
+        Concurrent writes to the same note are coalesced, so an intermediate
+        content may never reach the disk. When this returns, the file holds
+        this content or that of a later write to the same note; it is not
+        fsynced. read_note, replace_in_note and delete_note wait for an
+        in-flight write to the note first, so they never see an older
+        content or get overtaken by a pending write; a write made during a
+        replace_in_note is written after the replace.
+        
         Args:
             path: Path to note relative to vault root
             content: Markdown content
@@ -344,20 +600,158 @@ class ObsidianVault:
         
         full_path = self._ensure_safe_path(path)
         
-        # Check if exists
-        if full_path.exists() and not overwrite:
+        # Check if exists (or is about to, with a write still in flight)
+        if (full_path.exists() or full_path in self._write_flushes) and not overwrite:
             raise FileExistsError(f"Note already exists: {path}")
         
         # Create parent directories if needed
         full_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write content asynchronously
-        async with aiofiles.open(full_path, 'w', encoding='utf-8') as f:
-            await f.write(content)
+        # Write content asynchronously. Writes to the same file are coalesced:
+        # while one is in flight, later ones replace the pending content and
+        # only the newest is written next; every caller waits for that write.
+        # A streamed replace in flight leaves the content queued and starts
+        # its flush when it ends, so wait again until nothing is queued
+        self._note_cache.pop(path, None)
+        self._frontmatter_cache.pop(path, None)
+        self._pending_writes[full_path] = content
+        while full_path in self._pending_writes:
+            flush = self._write_flushes.get(full_path)
+            if flush is None:
+                flush = asyncio.ensure_future(self._flush_writes(full_path))
+                self._write_flushes[full_path] = flush
+            await asyncio.shield(flush)
+        self._note_list_cache.clear()
         
         # Return the newly created note
         return await self.read_note(path)
     
+    async def _flush_writes(self, full_path: Path) -> None:
+        """Write the latest pending content for full_path until none is left."""
+        try:
+            while full_path in self._pending_writes:
+                content = self._pending_writes.pop(full_path)
+                async with aiofiles.open(full_path, 'w', encoding='utf-8') as f:
+                    await f.write(content)
+        except Exception:
+            # Callers waiting on this flush get the error; don't leave their content queued
+            self._pending_writes.pop(full_path, None)
+            raise
+        finally:
+            self._write_flushes.pop(full_path, None)
+    
+    async def _wait_for_write(self, full_path: Path) -> None:
+        """Wait until no write or replace to full_path is in flight."""
+        # A replace hands writes queued behind it to a new flush, so keep
+        # waiting until none is registered
+        while full_path in self._write_flushes:
+            # The writers get the flush's error; this only waits for it to end
+            await asyncio.wait([self._write_flushes[full_path]])
+    
+    async def replace_in_note(
+        self,
+        path: str,
+        search_text: str,
+        replacement_text: str,
+        occurrence: str = "first"
+    ) -> int:
+        """
+        Replace literal text in a note by streaming it through a temp file.
+        
+        Same semantics as str.replace on the content read_note returns, but
+        the note is never held in memory whole.
+        
+        Args:
+            path: Path to note relative to vault root
+            search_text: Literal text to find
+            replacement_text: Text to replace it with
+            occurrence: "first" or "all"
+            
+        Returns:
+            Number of replacements made (the note is left untouched if 0)
+        """
+        # Ensure .md extension
+        if not path.endswith('.md'):
+            path += '.md'
+        
+        full_path = self._ensure_safe_path(path)
+        
+        await self._wait_for_write(full_path)
+        if not full_path.exists():
+            raise FileNotFoundError(f"Note not found: {path}")
+        
+        # Registered as the note's flush, so writes, reads and deletes
+        # started meanwhile wait for the replace to finish
+        self._note_cache.pop(path, None)
+        self._frontmatter_cache.pop(path, None)
+        flush = asyncio.ensure_future(
+            self._replace_then_flush(full_path, search_text, replacement_text, occurrence == "first")
+        )
+        self._write_flushes[full_path] = flush
+        try:
+            return await asyncio.shield(flush)
+        finally:
+            # A read racing the registration may have cached the old content
+            self._note_cache.pop(path, None)
+            self._frontmatter_cache.pop(path, None)
+    
+    async def _replace_then_flush(self, full_path: Path, search_text: str, replacement_text: str, first_only: bool) -> int:
+        """Run a streamed replace, then start a flush for any write queued behind it."""
+        try:
+            return await asyncio.to_thread(self._stream_replace, full_path, search_text, replacement_text, first_only)
+        finally:
+            self._write_flushes.pop(full_path, None)
+            if full_path in self._pending_writes:
+                self._write_flushes[full_path] = asyncio.ensure_future(self._flush_writes(full_path))
+    
+    @staticmethod
+    def _stream_replace(full_path: Path, search_text: str, replacement_text: str, first_only: bool) -> int:
+        """Chunked search/replace from full_path into a temp file, swapped in if anything changed."""
+        # A unique temp file per call, so overlapping replaces can't share one
+        fd, tmp_name = tempfile.mkstemp(dir=full_path.parent, prefix=full_path.name + '.', suffix='.tmp')
+        tmp_path = Path(tmp_name)
+        # Keep enough unprocessed text between chunks to catch a match straddling them
+        overlap = len(search_text) - 1
+        replacements = 0
+        buffer = ""
+        
+        try:
+            # fdopen first, so fd is closed even if the note can't be opened
+            with os.fdopen(fd, 'w', encoding='utf-8') as dst, open(full_path, 'r', encoding='utf-8') as src:
+                while True:
+                    chunk = src.read(STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if first_only and replacements:
+                        dst.write(chunk)
+                        continue
+                    
+                    buffer += chunk
+                    pos = 0
+                    while not (first_only and replacements):
+                        index = buffer.find(search_text, pos)
+                        if index == -1:
+                            break
+                        dst.write(buffer[pos:index])
+                        dst.write(replacement_text)
+                        pos = index + len(search_text)
+                        replacements += 1
+                    
+                    cut = len(buffer) if first_only and replacements else max(pos, len(buffer) - overlap)
+                    dst.write(buffer[pos:cut])
+                    buffer = buffer[cut:]
+                
+                dst.write(buffer)
+            
+            if replacements:
+                # mkstemp creates the file owner-only; keep the note's permissions
+                shutil.copymode(full_path, tmp_path)
+                os.replace(tmp_path, full_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        
+        return replacements
+    
     async def delete_note(self, path: str) -> bool:
         """
         Delete a note from the vault.
@@ -374,11 +768,16 @@ class ObsidianVault:
         
         full_path = self._ensure_safe_path(path)
         
+        # A write still in flight would recreate the file after the unlink
+        await self._wait_for_write(full_path)
         if not full_path.exists():
             raise FileNotFoundError(f"Note not found: {path}")
         
         # Delete the file
+        self._note_cache.pop(path, None)
+        self._frontmatter_cache.pop(path, None)
         full_path.unlink()
+        self._note_list_cache.clear()
         return True
     
     async def _initialize_persistent_index(self) -> None:
@@ -466,7 +865,7 @@ class ObsidianVault:
                         rel_path, content, stat.st_mtime, stat.st_size, metadata
                     )
                     
-                    logger.debug(f"Indexed: {rel_path}")
+                    logger.debug("Indexed: %s", rel_path)
                     
                     # Also update memory cache for fast access
                     self._search_index[rel_path] = {
@@ -701,7 +1100,7 @@ class ObsidianVault:
         """Legacy in-memory regex search (fallback when persistent index is disabled)."""
         # Compile regex pattern
         try:
-            regex = re.compile(pattern, flags)
+            regex = compile_regex(pattern, flags)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
         
@@ -715,11 +1114,13 @@ class ObsidianVault:
             matches = list(regex.finditer(content))
             
             if matches:
-                # Get line numbers for better context
-                lines = content.split('\n')
+                # Get line numbers for better context; line starts come from
+                # the newline positions, without splitting out every line
                 line_starts = [0]
-                for line in lines[:-1]:
-                    line_starts.append(line_starts[-1] + len(line) + 1)
+                idx = content.find('\n')
+                while idx != -1:
+                    line_starts.append(idx + 1)
+                    idx = content.find('\n', idx + 1)
                 
                 # Extract contexts for matches
                 match_contexts = []
@@ -728,13 +1129,7 @@ class ObsidianVault:
                     match_end = match.end()
                     
                     # Find line number
-                    line_num = 0
-                    for i, start in enumerate(line_starts):
-                        if start > match_start:
-                            line_num = i
-                            break
-                    else:
-                        line_num = len(lines)
+                    line_num = bisect_right(line_starts, match_start)
                     
                     # Extract context
                     context_start = max(0, match_start - context_length // 2)
@@ -780,17 +1175,122 @@ class ObsidianVault:
         Returns:
             List of note paths and names
         """
-        notes = []
+        key = (directory, recursive)
+        cached = self._note_list_cache.get(key)
+        if cached is not None and await asyncio.to_thread(self._dir_mtimes_unchanged, cached[0]):
+            self._note_list_cache.move_to_end(key)
+            return list(cached[1])
+        
+        # Snapshot directory mtimes before walking, so a change made during
+        # the walk invalidates the entry on the next call
+        search_path = self._note_search_path(directory)
+        dir_mtimes = None
+        if search_path is not None:
+            dir_mtimes = await asyncio.to_thread(self._note_dir_mtimes, search_path, recursive)
         
-        # Determine search path
+        notes = [note_info async for note_info in self.iter_notes(directory, recursive)]
+        
+        # Sort by path
+        notes.sort(key=lambda x: x["path"])
+        
+        # A directory modified within the last mtime tick could change again
+        # without its mtime moving, so such a listing isn't cached yet
+        racy_after_ns = time.time_ns() - int(RACY_MTIME_WINDOW * 1e9)
+        if dir_mtimes is not None and all(mtime < racy_after_ns for mtime in dir_mtimes.values()):
+            self._note_list_cache[key] = (dir_mtimes, notes)
+            self._note_list_cache.move_to_end(key)
+            if len(self._note_list_cache) > NOTE_LIST_CACHE_SIZE:
+                self._note_list_cache.popitem(last=False)
+        
+        return list(notes)
+    
+    def _note_search_path(self, directory: Optional[str]) -> Optional[Path]:
+        """Directory list_notes/iter_notes walk, or None if it isn't a directory."""
         if directory:
             # Use lenient validation for reading existing directories
             search_path = self._get_absolute_path(directory)
             if not search_path.exists() or not search_path.is_dir():
-                return []
-        else:
-            search_path = self.vault_path
+                return None
+            return search_path
+        return self.vault_path
+    
+    @staticmethod
+    def _note_dir_mtimes(search_path: Path, recursive: bool) -> Dict[str, int]:
+        """
+        Map each directory a note walk covers to its mtime_ns (blocking).
         
+        Mirrors _walk_notes: symlinked directories aren't descended into, and
+        .trash/.obsidian are left out since notes under them are skipped.
+        """
+        root = str(search_path)
+        dir_mtimes = {root: os.stat(root).st_mtime_ns}
+        if not recursive:
+            return dir_mtimes
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name in ('.trash', '.obsidian') or entry.is_symlink() or not entry.is_dir():
+                        continue
+                    dir_mtimes[entry.path] = entry.stat().st_mtime_ns
+                    stack.append(entry.path)
+        return dir_mtimes
+    
+    @staticmethod
+    def _dir_mtimes_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+        """Whether every directory still has the mtime_ns recorded for it (blocking)."""
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes.items())
+        except OSError:
+            return False
+    
+    async def iter_notes(self, directory: Optional[str] = None, recursive: bool = True) -> AsyncIterator[Dict[str, str]]:
+        """
+        Yield notes as the vault walk finds them, in walk order (unsorted).
+        
+        The walk runs in a worker thread ahead of the consumer, so callers can
+        start reading notes before the whole vault has been listed. Use
+        contextlib.aclosing when breaking out early so the walk is stopped.
+        
+        Args:
+            directory: Specific directory to list (optional)
+            recursive: Whether to include subdirectories
+            
+        Yields:
+            Dicts with the note's path and name, as in list_notes
+        """
+        search_path = self._note_search_path(directory)
+        if search_path is None:
+            return
+        
+        walker = self._walk_notes(search_path, recursive)
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=NOTE_WALK_QUEUE_SIZE)
+        
+        async def produce() -> None:
+            try:
+                while True:
+                    chunk = await asyncio.to_thread(lambda: list(islice(walker, NOTE_WALK_CHUNK_SIZE)))
+                    await chunks.put(chunk)
+                    if not chunk:
+                        return
+            except Exception as e:
+                await chunks.put(e)
+        
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                chunk = await chunks.get()
+                if isinstance(chunk, Exception):
+                    raise chunk
+                if not chunk:
+                    return
+                for note_info in chunk:
+                    yield note_info
+        finally:
+            producer.cancel()
+    
+    def _walk_notes(self, search_path: Path, recursive: bool) -> Iterator[Dict[str, str]]:
+        """Walk search_path for markdown notes, skipping .trash and .obsidian (blocking)."""
         # Find markdown files
         pattern = "**/*.md" if recursive else "*.md"
         for md_file in search_path.glob(pattern):
@@ -803,15 +1303,10 @@ class ObsidianVault:
                 path_normalized.startswith('.obsidian/') or '/.obsidian/' in path_normalized):
                 continue
                 
-            notes.append({
+            yield {
                 "path": rel_path_str,
                 "name": md_file.name
-            })
-        
-        # Sort by path
-        notes.sort(key=lambda x: x["path"])
-        
-        return notes
+            }
     
     async def find_image(self, filename: str) -> Optional[str]:
         """
@@ -831,12 +1326,33 @@ class ObsidianVault:
         if file_ext not in image_extensions:
             return None
         
+        # Reuse a previous lookup while it still holds: found paths must still
+        # exist, misses expire after IMAGE_NOT_FOUND_TTL
+        cached = self._image_path_cache.get(filename)
+        if cached:
+            found_path, looked_up_at = cached
+            if found_path is not None:
+                still_valid = (self.vault_path / found_path).is_file()
+            else:
+                still_valid = time.time() - looked_up_at < IMAGE_NOT_FOUND_TTL
+            
+            if still_valid:
+                self._image_path_cache.move_to_end(filename)
+                return found_path
+            del self._image_path_cache[filename]
+        
         # Search for the image file
+        found_path = None
         for image_file in self.vault_path.rglob(filename):
             if image_file.is_file():
-                return str(image_file.relative_to(self.vault_path))
+                found_path = str(image_file.relative_to(self.vault_path))
+                break
+        
+        self._image_path_cache[filename] = (found_path, time.time())
+        if len(self._image_path_cache) > IMAGE_PATH_CACHE_SIZE:
+            self._image_path_cache.popitem(last=False)
         
-        return None
+        return found_path
     
     async def read_image(self, path: str, max_width: int = 1600) -> Dict[str, Any]:
         """
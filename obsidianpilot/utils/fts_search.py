@@ -3,14 +3,116 @@
 import asyncio
 import aiosqlite
 import logging
+import re
+import sqlite3
+import threading
 import time
 import hashlib
 from pathlib import Path
-from typing import List, Dict, Any, Optional, AsyncIterator
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 from ..utils.filesystem import get_vault
 
 logger = logging.getLogger(__name__)
 
+# Bump when the notes_fts definition changes; a mismatch drops the old index
+# so the existing empty-index path rebuilds it once
+FTS_SCHEMA_VERSION = 6
+
+# Search statements are kept as fixed text with bound parameters: sqlite3 caches
+# prepared statements per connection keyed by SQL text, so each reader thread
+# parses and plans these once and reuses them on every search
+_SEARCH_SQL = """
+    SELECT 
+        filepath,
+        snippet(notes_fts, 2, '<mark>', '</mark>', '...', ?) as snippet,
+        rank,
+        filename
+    FROM notes_fts
+    WHERE notes_fts MATCH ?
+    ORDER BY rank
+    LIMIT ? OFFSET ?
+"""
+
+# One ranked/limited arm of a batched search, tagged with its bucket index
+_SEARCH_MANY_ARM_SQL = """
+    SELECT * FROM (
+        SELECT
+            ? as bucket,
+            filepath,
+            snippet(notes_fts, 2, '<mark>', '</mark>', '...', ?) as snippet,
+            rank,
+            filename
+        FROM notes_fts
+        WHERE notes_fts MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    )
+"""
+
+# Lowercase boolean operators _transform_query uppercases for FTS5; the
+# lookahead leaves the trailing space for a directly following operator
+_LOWER_BOOLEAN_RE = re.compile(r' (or|and|not)(?= )')
+
+# Whether a query uses boolean operators, in any case
+_BOOLEAN_OP_RE = re.compile(r' (?:OR|AND|NOT) ', re.IGNORECASE)
+
+# Splits boolean queries around their operators, keeping the operators
+_BOOLEAN_SPLIT_RE = re.compile(r'\b(AND|OR|NOT)\b', re.IGNORECASE)
+
+# Space-separated query tokens; a quoted run (closed or not) keeps its spaces
+_QUERY_TOKEN_RE = re.compile(r'(?:"[^"]*"?|[^ "])+')
+
+# Patterns QueryParser.validate_query rejects (basic SQL injection check)
+_DANGER_RE = re.compile(r'--|;|\b(?:DROP|DELETE|INSERT|UPDATE)\b', re.IGNORECASE)
+
+# Notes rebuild_fts_index writes per executemany batch; each batch is its
+# own transaction
+REBUILD_BATCH_SIZE = 500
+
+# Concurrent note readers feeding the single rebuild writer, and how many
+# read notes may wait for it before the readers block
+REBUILD_READERS = 8
+REBUILD_QUEUE_SIZE = 200
+
+# Writes shared by the single-file and batched indexing paths; the upserts
+# (rather than REPLACE) let the notes_content and notes_metadata triggers fire
+_INDEXED_SHA_SQL = """
+    SELECT m.content_sha
+    FROM notes_content c JOIN notes_metadata m ON m.file_id = c.id
+    WHERE c.filepath = ?
+"""
+
+_UPSERT_CONTENT_SQL = """
+    INSERT INTO notes_content
+    (filepath, filename, content, tags, properties)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(filepath) DO UPDATE SET
+        filename = excluded.filename,
+        content = excluded.content,
+        tags = excluded.tags,
+        properties = excluded.properties
+"""
+
+# notes_metadata is keyed by the note's notes_content id, looked up from the
+# path the content upsert just wrote
+_UPSERT_METADATA_SQL = """
+    INSERT INTO notes_metadata
+    (file_id, mtime, size, last_indexed, content_sha)
+    SELECT id, ?, ?, ?, ? FROM notes_content WHERE filepath = ?
+    ON CONFLICT(file_id) DO UPDATE SET
+        mtime = excluded.mtime,
+        size = excluded.size,
+        last_indexed = excluded.last_indexed,
+        content_sha = excluded.content_sha
+"""
+
+# Size of the memory map connections read the database through (256MB)
+_MMAP_SIZE = 268435456
+
+# Statement cache size for reader connections (batched searches add one
+# entry per distinct batch size)
+_READER_CACHED_STATEMENTS = 256
+
 
 class FTSSearchIndex:
     """Fast full-text search using SQLite FTS5 virtual tables."""
@@ -20,12 +122,40 @@ class FTSSearchIndex:
         self.db: Optional[aiosqlite.Connection] = None
         self._initialized = False
         
+        # Whether any note is indexed; None until checked (see has_any)
+        self._has_any: Optional[bool] = None
+        
+        # Whether the trigram substring index exists (needs SQLite 3.34+)
+        self._has_trigram = False
+        
+        # Read-only connections, one per worker thread, so searches run off the
+        # event loop and don't queue behind index writes on self.db
+        self._local = threading.local()
+        self._reader_connections: List[sqlite3.Connection] = []
+        self._reader_lock = threading.Lock()
+        
+        # Held by rebuild_fts_index for the whole rebuild. Incremental
+        # updaters take it around reading and indexing notes, so a save made
+        # during a rebuild is indexed after it, with the note's latest content
+        self.write_lock = asyncio.Lock()
+        
     async def initialize(self):
         """Initialize the FTS5 search index."""
         if self._initialized:
             return
             
         self.db = await aiosqlite.connect(self.db_path)
+        # Larger pages suit the long FTS5 segment blobs; this only takes
+        # effect for a new database, before WAL is enabled
+        await self.db.execute("PRAGMA page_size=8192")
+        # WAL lets reader threads query while the writer connection is indexing
+        await self.db.execute("PRAGMA journal_mode=WAL")
+        # The index can always be rebuilt from the vault, so trade durability
+        # of the last commits for not syncing on every one
+        await self.db.execute("PRAGMA synchronous=NORMAL")
+        await self.db.execute("PRAGMA temp_store=MEMORY")
+        await self.db.execute("PRAGMA cache_size=-64000")  # 64MB
+        await self.db.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
         await self._create_fts_tables()
         self._initialized = True
         logger.info("FTS5 search index initialized")
@@ -33,13 +163,83 @@ class FTSSearchIndex:
     async def close(self):
         """Close the database connection."""
         if self.db:
+            # Let SQLite refresh any planner statistics the session's queries
+            # found stale, as its docs recommend before closing
+            try:
+                await self.db.execute("PRAGMA optimize")
+            except Exception as e:
+                logger.debug(f"PRAGMA optimize on close failed: {e}")
             await self.db.close()
             self._initialized = False
+        
+        with self._reader_lock:
+            for conn in self._reader_connections:
+                conn.close()
+            self._reader_connections.clear()
+        self._local = threading.local()
+    
+    def _get_reader(self) -> sqlite3.Connection:
+        """Get the read-only connection for the current thread, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=_READER_CACHED_STATEMENTS
+            )
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+            self._local.conn = conn
+            with self._reader_lock:
+                self._reader_connections.append(conn)
+        return conn
             
     async def _create_fts_tables(self):
         """Create FTS5 virtual table and supporting tables."""
         
-        # Create FTS5 virtual table for fast search
+        # Key/value table for index-wide bookkeeping (schema version, etc.)
+        await self.db.execute("""
+            CREATE TABLE IF NOT EXISTS fts_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+        
+        cursor = await self.db.execute(
+            "SELECT value FROM fts_meta WHERE key = 'schema_version'"
+        )
+        row = await cursor.fetchone()
+        schema_version = int(row[0]) if row else None
+        
+        if schema_version != FTS_SCHEMA_VERSION:
+            # Tokenizer or columns changed - drop the old index so it gets rebuilt
+            logger.info(
+                f"FTS index schema version {schema_version} (expected {FTS_SCHEMA_VERSION}), "
+                "recreating index tables"
+            )
+            await self.db.execute("DROP TABLE IF EXISTS notes_fts")
+            await self.db.execute("DROP TABLE IF EXISTS notes_trigram")
+            await self.db.execute("DROP TABLE IF EXISTS notes_content")
+            await self.db.execute("DROP TABLE IF EXISTS notes_metadata")
+            await self.db.execute(
+                "DELETE FROM fts_meta WHERE key IN ('total_files', 'total_size_bytes', 'last_indexed_at')"
+            )
+        
+        # Indexed text lives here once; notes_fts reads it back by rowid
+        # instead of keeping its own copy
+        await self.db.execute("""
+            CREATE TABLE IF NOT EXISTS notes_content (
+                id INTEGER PRIMARY KEY,
+                filepath TEXT UNIQUE,
+                filename TEXT,
+                content TEXT,
+                tags TEXT,
+                properties TEXT
+            )
+        """)
+        
+        # Create FTS5 virtual table for fast search (external content: only
+        # the inverted index is stored)
         await self.db.execute("""
             CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
                 filepath UNINDEXED,     -- File path (not searchable)
@@ -47,17 +247,82 @@ class FTSSearchIndex:
                 content,               -- Full note content
                 tags,                  -- Space-separated tags
                 properties,            -- Frontmatter properties as text
-                tokenize = 'porter unicode61 remove_diacritics 1'
+                content = 'notes_content',
+                content_rowid = 'id',
+                tokenize = 'porter unicode61 remove_diacritics 2'
             )
         """)
         
-        # Create metadata table for additional info
+        # Keep the inverted index in step with notes_content
+        await self.db.execute("""
+            CREATE TRIGGER IF NOT EXISTS notes_content_ai AFTER INSERT ON notes_content
+            BEGIN
+                INSERT INTO notes_fts (rowid, filepath, filename, content, tags, properties)
+                VALUES (NEW.id, NEW.filepath, NEW.filename, NEW.content, NEW.tags, NEW.properties);
+            END
+        """)
+        await self.db.execute("""
+            CREATE TRIGGER IF NOT EXISTS notes_content_ad AFTER DELETE ON notes_content
+            BEGIN
+                INSERT INTO notes_fts (notes_fts, rowid, filepath, filename, content, tags, properties)
+                VALUES ('delete', OLD.id, OLD.filepath, OLD.filename, OLD.content, OLD.tags, OLD.properties);
+            END
+        """)
+        await self.db.execute("""
+            CREATE TRIGGER IF NOT EXISTS notes_content_au AFTER UPDATE ON notes_content
+            BEGIN
+                INSERT INTO notes_fts (notes_fts, rowid, filepath, filename, content, tags, properties)
+                VALUES ('delete', OLD.id, OLD.filepath, OLD.filename, OLD.content, OLD.tags, OLD.properties);
+                INSERT INTO notes_fts (rowid, filepath, filename, content, tags, properties)
+                VALUES (NEW.id, NEW.filepath, NEW.filename, NEW.content, NEW.tags, NEW.properties);
+            END
+        """)
+        
+        # Trigram index over the content, so the substring fallback's LIKE
+        # can use an index instead of scanning every note
+        try:
+            await self.db.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS notes_trigram USING fts5(
+                    content,
+                    content = 'notes_content',
+                    content_rowid = 'id',
+                    tokenize = 'trigram'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.info(f"Trigram tokenizer unavailable, substring fallback will scan: {e}")
+        else:
+            self._has_trigram = True
+            await self.db.execute("""
+                CREATE TRIGGER IF NOT EXISTS notes_content_trigram_ai AFTER INSERT ON notes_content
+                BEGIN
+                    INSERT INTO notes_trigram (rowid, content) VALUES (NEW.id, NEW.content);
+                END
+            """)
+            await self.db.execute("""
+                CREATE TRIGGER IF NOT EXISTS notes_content_trigram_ad AFTER DELETE ON notes_content
+                BEGIN
+                    INSERT INTO notes_trigram (notes_trigram, rowid, content) VALUES ('delete', OLD.id, OLD.content);
+                END
+            """)
+            await self.db.execute("""
+                CREATE TRIGGER IF NOT EXISTS notes_content_trigram_au AFTER UPDATE ON notes_content
+                WHEN OLD.content IS NOT NEW.content
+                BEGIN
+                    INSERT INTO notes_trigram (notes_trigram, rowid, content) VALUES ('delete', OLD.id, OLD.content);
+                    INSERT INTO notes_trigram (rowid, content) VALUES (NEW.id, NEW.content);
+                END
+            """)
+        
+        # Create metadata table for additional info (keyed by the integer
+        # notes_content id rather than repeating the path)
         await self.db.execute("""
             CREATE TABLE IF NOT EXISTS notes_metadata (
-                filepath TEXT PRIMARY KEY,
+                file_id INTEGER PRIMARY KEY REFERENCES notes_content(id),
                 mtime REAL,
                 size INTEGER,
-                last_indexed REAL
+                last_indexed REAL,
+                content_sha BLOB        -- Fingerprint of the indexed text
             )
         """)
         
@@ -66,6 +331,49 @@ class FTSSearchIndex:
             CREATE INDEX IF NOT EXISTS idx_notes_mtime 
             ON notes_metadata(mtime)
         """)
+        await self.db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_notes_last_indexed
+            ON notes_metadata(last_indexed)
+        """)
+        
+        # Seed the stats counters from the current tables (no-op once present)
+        await self.db.execute("""
+            INSERT OR IGNORE INTO fts_meta (key, value)
+            SELECT 'total_files', COUNT(*) FROM notes_metadata
+            UNION ALL
+            SELECT 'total_size_bytes', COALESCE(SUM(size), 0) FROM notes_metadata
+            UNION ALL
+            SELECT 'last_indexed_at', CAST(MAX(last_indexed) AS INTEGER) FROM notes_metadata
+        """)
+        
+        # Keep the counters in step with notes_metadata so get_stats never scans
+        await self.db.execute("""
+            CREATE TRIGGER IF NOT EXISTS notes_metadata_ai AFTER INSERT ON notes_metadata
+            BEGIN
+                UPDATE fts_meta SET value = value + 1 WHERE key = 'total_files';
+                UPDATE fts_meta SET value = value + NEW.size WHERE key = 'total_size_bytes';
+                UPDATE fts_meta SET value = CAST(NEW.last_indexed AS INTEGER) WHERE key = 'last_indexed_at';
+            END
+        """)
+        await self.db.execute("""
+            CREATE TRIGGER IF NOT EXISTS notes_metadata_au AFTER UPDATE ON notes_metadata
+            BEGIN
+                UPDATE fts_meta SET value = value - OLD.size + NEW.size WHERE key = 'total_size_bytes';
+                UPDATE fts_meta SET value = CAST(NEW.last_indexed AS INTEGER) WHERE key = 'last_indexed_at';
+            END
+        """)
+        await self.db.execute("""
+            CREATE TRIGGER IF NOT EXISTS notes_metadata_ad AFTER DELETE ON notes_metadata
+            BEGIN
+                UPDATE fts_meta SET value = value - 1 WHERE key = 'total_files';
+                UPDATE fts_meta SET value = value - OLD.size WHERE key = 'total_size_bytes';
+            END
+        """)
+        
+        await self.db.execute(
+            "INSERT OR REPLACE INTO fts_meta (key, value) VALUES ('schema_version', ?)",
+            (str(FTS_SCHEMA_VERSION),)
+        )
         
         await self.db.commit()
         
@@ -73,59 +381,167 @@ class FTSSearchIndex:
         """Index a single file in the FTS5 table."""
         if not self._initialized:
             await self.initialize()
-            
+        
+        if await self.index_file_no_commit(filepath, content, metadata):
+            await self.db.commit()
+    
+    async def index_files(self, files: List[Tuple[str, str, Any]]) -> int:
+        """
+        Index several (filepath, content, metadata) files in one transaction.
+        
+        Files that fail to index are logged and skipped.
+        
+        Returns:
+            Number of files whose rows were written
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        written = 0
+        for filepath, content, metadata in files:
+            try:
+                written += await self.index_file_no_commit(filepath, content, metadata)
+            except Exception as e:
+                logger.warning(f"Failed to index {filepath}: {e}")
+        if written:
+            await self.db.commit()
+        return written
+    
+    async def index_file_no_commit(self, filepath: str, content: str, metadata: Dict[str, Any]) -> bool:
+        """
+        Write a file's index rows without committing.
+        
+        For bulk indexing: the caller commits once for many files instead of
+        paying a commit per file. Requires an initialized index.
+        
+        Returns:
+            False if the file's indexed text was unchanged and nothing was written
+        """
         try:
-            # Extract components
-            filename = Path(filepath).stem
+            row, content_sha = self._index_row(filepath, content, metadata)
             
-            # Handle metadata as NoteMetadata object
-            if hasattr(metadata, 'tags'):
-                tags = ' '.join(metadata.tags if metadata.tags else [])
-            else:
-                tags = ''
-            
-            # Format properties as searchable text
-            properties = []
-            if hasattr(metadata, 'frontmatter') and metadata.frontmatter:
-                for key, value in metadata.frontmatter.items():
-                    if key != 'tags':  # Tags handled separately
-                        if isinstance(value, list):
-                            properties.append(f"{key}:{' '.join(str(v) for v in value)}")
-                        else:
-                            properties.append(f"{key}:{value}")
-            properties_text = ' '.join(properties)
-            
-            # Delete existing entry first (FTS5 doesn't support PRIMARY KEY for OR REPLACE)
-            await self.db.execute("DELETE FROM notes_fts WHERE filepath = ?", (filepath,))
-            
-            # Insert new entry in FTS5 table
-            await self.db.execute("""
-                INSERT INTO notes_fts 
-                (filepath, filename, content, tags, properties)
-                VALUES (?, ?, ?, ?, ?)
-            """, (filepath, filename, content, tags, properties_text))
+            # Skip the rewrite when the text is what's already indexed (e.g. a
+            # save that only touched the mtime)
+            cursor = await self.db.execute(_INDEXED_SHA_SQL, (filepath,))
+            existing = await cursor.fetchone()
+            if existing is not None and existing[0] == content_sha:
+                return False
             
-            # Update metadata
-            await self.db.execute("""
-                INSERT OR REPLACE INTO notes_metadata
-                (filepath, mtime, size, last_indexed)
-                VALUES (?, ?, ?, ?)
-            """, (filepath, time.time(), len(content), time.time()))
+            # Upsert the note's text; the notes_content triggers update notes_fts
+            await self.db.execute(_UPSERT_CONTENT_SQL, row)
             
-            await self.db.commit()
+            # Update metadata (upsert rather than REPLACE so the counter triggers fire)
+            now = time.time()
+            await self.db.execute(_UPSERT_METADATA_SQL, (now, len(content), now, content_sha, filepath))
+            self._has_any = True
+            return True
             
         except Exception as e:
             logger.error(f"Error indexing file {filepath}: {e}")
             raise
+    
+    def _open_writer(self) -> sqlite3.Connection:
+        """
+        Open a synchronous connection for bulk writes (blocking).
+        
+        Runs in autocommit mode so callers manage transactions with explicit
+        BEGIN/COMMIT; it may be used from any one thread at a time.
+        """
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")  # 64MB
+        conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        return conn
+    
+    @classmethod
+    def _sync_index_files(cls, conn: sqlite3.Connection, files: List[Tuple[str, str, Any]]) -> int:
+        """
+        Write index rows for several (filepath, content, metadata) files on conn (blocking).
+        
+        Same as calling index_file_no_commit per file, but each table gets a
+        single executemany. Writes join the caller's transaction.
+        
+        Returns:
+            Number of files whose rows were written (unchanged files are skipped)
+        """
+        if not files:
+            return 0
+        
+        rows = [cls._index_row(filepath, content, metadata) for filepath, content, metadata in files]
+        
+        indexed_shas = dict(conn.execute(
+            "SELECT c.filepath, m.content_sha "
+            "FROM notes_content c JOIN notes_metadata m ON m.file_id = c.id "
+            f"WHERE c.filepath IN ({','.join('?' * len(rows))})",
+            [row[0] for row, _ in rows]
+        ).fetchall())
+        changed = [
+            (row, content_sha, len(content))
+            for (row, content_sha), (_, content, _) in zip(rows, files)
+            if indexed_shas.get(row[0]) != content_sha
+        ]
+        if not changed:
+            return 0
+        
+        now = time.time()
+        conn.executemany(_UPSERT_CONTENT_SQL, [row for row, _, _ in changed])
+        conn.executemany(
+            _UPSERT_METADATA_SQL,
+            [(now, size, now, content_sha, row[0]) for row, content_sha, size in changed]
+        )
+        return len(changed)
+    
+    @staticmethod
+    def _index_row(filepath: str, content: str, metadata: Any) -> Tuple[Tuple[str, str, str, str, str], bytes]:
+        """Build a file's notes_content row and the fingerprint of its text."""
+        # Extract components
+        filename = Path(filepath).stem
+        
+        # Handle metadata as NoteMetadata object
+        if hasattr(metadata, 'tags'):
+            tags = ' '.join(metadata.tags if metadata.tags else [])
+        else:
+            tags = ''
+        
+        # Format properties as searchable text (memoized on NoteMetadata)
+        properties_text = metadata.fts_properties() if hasattr(metadata, 'fts_properties') else ''
+        
+        content_sha = hashlib.blake2b(
+            '\0'.join((filename, content, tags, properties_text)).encode('utf-8', 'surrogatepass'),
+            digest_size=16
+        ).digest()
+        return (filepath, filename, content, tags, properties_text), content_sha
             
     async def remove_file(self, filepath: str):
         """Remove a file from the FTS5 index."""
         if not self._initialized:
             return
             
-        await self.db.execute("DELETE FROM notes_fts WHERE filepath = ?", (filepath,))
-        await self.db.execute("DELETE FROM notes_metadata WHERE filepath = ?", (filepath,))
+        await self.db.execute(
+            "DELETE FROM notes_metadata WHERE file_id = (SELECT id FROM notes_content WHERE filepath = ?)",
+            (filepath,)
+        )
+        await self.db.execute("DELETE FROM notes_content WHERE filepath = ?", (filepath,))
         await self.db.commit()
+        # The removed note may have been the last one
+        self._has_any = None
+        
+    async def optimize(self):
+        """
+        Merge all FTS5 index segments so each term has a single posting list.
+        
+        Also re-gathers the planner statistics, which a bulk load leaves stale.
+        """
+        if not self._initialized:
+            return
+            
+        try:
+            await self.db.execute("INSERT INTO notes_fts(notes_fts) VALUES('optimize')")
+            await self.db.execute("ANALYZE")
+            await self.db.commit()
+        except Exception as e:
+            logger.warning(f"FTS index optimize failed: {e}")
         
     async def search(
         self, 
@@ -141,40 +557,147 @@ class FTSSearchIndex:
         try:
             # Transform query for FTS5
             fts_query = self._transform_query(query)
-            logger.debug(f"Transformed query: '{query}' -> FTS5 query: '{fts_query}'")
-            
-            # Perform search with ranking
-            cursor = await self.db.execute("""
-                SELECT 
-                    filepath,
-                    snippet(notes_fts, 2, '<mark>', '</mark>', '...', ?) as snippet,
-                    rank,
-                    filename
-                FROM notes_fts
-                WHERE notes_fts MATCH ?
-                ORDER BY rank
-                LIMIT ? OFFSET ?
-            """, (snippet_length, fts_query, limit, offset))
-            
-            results = []
-            rows = await cursor.fetchall()
-            
-            for row in rows:
-                filepath, snippet, rank, filename = row
-                results.append({
-                    "path": filepath,
-                    "filename": filename,
-                    "context": snippet,
-                    "score": -rank,  # FTS5 rank is negative, flip for intuitive scoring
-                    "rank": len(results) + offset + 1
-                })
-                
-            return results
+            logger.debug("Transformed query: '%s' -> FTS5 query: '%s'", query, fts_query)
+            
+            return await asyncio.to_thread(
+                self._sync_search, fts_query, limit, offset, snippet_length
+            )
+            
+        except Exception as e:
+            logger.error(f"Search error for query '{query}': {e}")
+            # Fall back to simple search if FTS5 query fails
+            return await asyncio.to_thread(self._simple_search, query, limit, offset)
+    
+    async def search_columns(
+        self,
+        query: str,
+        limit: int = 50,
+        offset: int = 0,
+        snippet_length: int = 30
+    ) -> Dict[str, List[Any]]:
+        """Same as search() but returns parallel lists (paths, filenames, contexts, scores) in rank order."""
+        if not self._initialized:
+            await self.initialize()
+            
+        try:
+            fts_query = self._transform_query(query)
+            logger.debug("Transformed query: '%s' -> FTS5 query: '%s'", query, fts_query)
+            
+            return await asyncio.to_thread(
+                self._sync_search_columns, fts_query, limit, offset, snippet_length
+            )
             
         except Exception as e:
             logger.error(f"Search error for query '{query}': {e}")
             # Fall back to simple search if FTS5 query fails
-            return await self._simple_search(query, limit, offset)
+            results = await asyncio.to_thread(self._simple_search, query, limit, offset)
+            return {
+                "paths": [r["path"] for r in results],
+                "filenames": [r["filename"] for r in results],
+                "contexts": [r["context"] for r in results],
+                "scores": [r["score"] for r in results]
+            }
+    
+    async def search_many(
+        self,
+        queries: List[str],
+        limit: int = 50,
+        snippet_length: int = 30
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several searches in one SQL statement, returning one result list per query."""
+        if not self._initialized:
+            await self.initialize()
+            
+        try:
+            fts_queries = [self._transform_query(query) for query in queries]
+            return await asyncio.to_thread(
+                self._sync_search_many, fts_queries, limit, snippet_length
+            )
+            
+        except Exception as e:
+            logger.error(f"Batched search error for queries {queries}: {e}")
+            # One bad query fails the whole statement - fall back to searching each separately
+            return [await self.search(query, limit=limit, snippet_length=snippet_length) for query in queries]
+    
+    def _sync_search_many(
+        self,
+        fts_queries: List[str],
+        limit: int,
+        snippet_length: int
+    ) -> List[List[Dict[str, Any]]]:
+        """Run the batched FTS5 query on a worker thread."""
+        params = []
+        for i, fts_query in enumerate(fts_queries):
+            params.extend([i, snippet_length, fts_query, limit])
+        
+        cursor = self._get_reader().execute(
+            " UNION ALL ".join([_SEARCH_MANY_ARM_SQL] * len(fts_queries)) + " ORDER BY bucket, rank",
+            params
+        )
+        
+        buckets: List[List[Dict[str, Any]]] = [[] for _ in fts_queries]
+        for bucket, filepath, snippet, rank, filename in cursor.fetchall():
+            results = buckets[bucket]
+            results.append({
+                "path": filepath,
+                "filename": filename,
+                "context": snippet,
+                "score": -rank,  # FTS5 rank is negative, flip for intuitive scoring
+                "rank": len(results) + 1
+            })
+            
+        return buckets
+    
+    def _sync_search(
+        self,
+        fts_query: str,
+        limit: int,
+        offset: int,
+        snippet_length: int
+    ) -> List[Dict[str, Any]]:
+        """Run the ranked FTS5 query on a worker thread."""
+        # Perform search with ranking
+        cursor = self._get_reader().execute(
+            _SEARCH_SQL, (snippet_length, fts_query, limit, offset)
+        )
+        
+        results = []
+        rows = cursor.fetchall()
+        
+        for row in rows:
+            filepath, snippet, rank, filename = row
+            results.append({
+                "path": filepath,
+                "filename": filename,
+                "context": snippet,
+                "score": -rank,  # FTS5 rank is negative, flip for intuitive scoring
+                "rank": len(results) + offset + 1
+            })
+            
+        return results
+    
+    def _sync_search_columns(
+        self,
+        fts_query: str,
+        limit: int,
+        offset: int,
+        snippet_length: int
+    ) -> Dict[str, List[Any]]:
+        """Run the ranked FTS5 query on a worker thread, transposing rows into columns."""
+        rows = self._get_reader().execute(
+            _SEARCH_SQL, (snippet_length, fts_query, limit, offset)
+        ).fetchall()
+        
+        if not rows:
+            return {"paths": [], "filenames": [], "contexts": [], "scores": []}
+        
+        paths, snippets, ranks, filenames = zip(*rows)
+        return {
+            "paths": list(paths),
+            "filenames": list(filenames),
+            "contexts": list(snippets),
+            "scores": [-rank for rank in ranks]  # FTS5 rank is negative, flip for intuitive scoring
+        }
             
     def _transform_query(self, query: str) -> str:
         """Transform user query to FTS5 syntax."""
@@ -186,12 +709,10 @@ class FTSSearchIndex:
             return query  # Already a phrase
             
         # Handle boolean operators (case insensitive)
-        query = query.replace(' or ', ' OR ')
-        query = query.replace(' and ', ' AND ')
-        query = query.replace(' not ', ' NOT ')
+        query = _LOWER_BOOLEAN_RE.sub(lambda m: ' ' + m.group(1).upper(), query)
         
         # Check if query contains boolean operators (including partial matches)
-        has_boolean = any(op in query.upper() for op in [' OR ', ' AND ', ' NOT '])
+        has_boolean = _BOOLEAN_OP_RE.search(query) is not None
         
         # Handle multi-word terms in boolean queries
         if has_boolean:
@@ -207,10 +728,8 @@ class FTSSearchIndex:
         
     def _quote_multiword_terms(self, query: str) -> str:
         """Quote multi-word terms in boolean queries for proper FTS5 parsing."""
-        import re
-        
         # Split by boolean operators while preserving them
-        parts = re.split(r'\b(AND|OR|NOT)\b', query, flags=re.IGNORECASE)
+        parts = _BOOLEAN_SPLIT_RE.split(query)
         
         result_parts = []
         for part in parts:
@@ -236,24 +755,34 @@ class FTSSearchIndex:
                 
         return ' '.join(result_parts)
         
-    async def _simple_search(
+    def _simple_search(
         self, 
         query: str, 
         limit: int, 
         offset: int
     ) -> List[Dict[str, Any]]:
-        """Fallback simple search if FTS5 query fails."""
+        """Fallback simple search if FTS5 query fails (runs on a worker thread)."""
         query_lower = query.lower()
         
-        cursor = await self.db.execute("""
-            SELECT filepath, filename, content
-            FROM notes_fts
-            WHERE content LIKE ?
-            LIMIT ? OFFSET ?
-        """, (f"%{query_lower}%", limit, offset))
+        if self._has_trigram and len(query_lower) >= 3:
+            # The trigram index answers LIKE directly (it needs 3+ characters)
+            cursor = self._get_reader().execute("""
+                SELECT c.filepath, c.filename, c.content
+                FROM notes_trigram
+                JOIN notes_content c ON c.id = notes_trigram.rowid
+                WHERE notes_trigram.content LIKE ?
+                LIMIT ? OFFSET ?
+            """, (f"%{query_lower}%", limit, offset))
+        else:
+            cursor = self._get_reader().execute("""
+                SELECT filepath, filename, content
+                FROM notes_content
+                WHERE content LIKE ?
+                LIMIT ? OFFSET ?
+            """, (f"%{query_lower}%", limit, offset))
         
         results = []
-        rows = await cursor.fetchall()
+        rows = cursor.fetchall()
         
         for i, row in enumerate(rows):
             filepath, filename, content = row
@@ -282,33 +811,69 @@ class FTSSearchIndex:
             
         return results
         
+    async def has_any(self) -> bool:
+        """
+        Whether the index holds at least one note.
+        
+        Cheaper than get_stats for "is there an index yet" checks: the answer
+        is remembered until the index is cleared or a note is removed.
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        if self._has_any is None:
+            self._has_any = await asyncio.to_thread(self._sync_has_any)
+        return self._has_any
+    
+    def _sync_has_any(self) -> bool:
+        """Check for an indexed note on a worker thread."""
+        return bool(self._get_reader().execute(
+            "SELECT EXISTS(SELECT 1 FROM notes_metadata)"
+        ).fetchone()[0])
+    
+    async def get_indexed_times(self) -> Dict[str, float]:
+        """Map every indexed note's path to when it was last indexed."""
+        if not self._initialized:
+            await self.initialize()
+        
+        return await asyncio.to_thread(self._sync_get_indexed_times)
+    
+    def _sync_get_indexed_times(self) -> Dict[str, float]:
+        """Read the indexed times on a worker thread."""
+        # idx_notes_last_indexed covers the metadata side (it carries the
+        # file_id), leaving one rowid lookup per note for the path
+        return dict(self._get_reader().execute("""
+            SELECT c.filepath, m.last_indexed
+            FROM notes_metadata m
+            JOIN notes_content c ON c.id = m.file_id
+        """).fetchall())
+    
     async def get_stats(self) -> Dict[str, Any]:
         """Get search index statistics."""
         if not self._initialized:
             await self.initialize()
             
-        # Get total indexed files
-        cursor = await self.db.execute("SELECT COUNT(*) FROM notes_fts")
-        total_files = (await cursor.fetchone())[0]
+        return await asyncio.to_thread(self._sync_get_stats)
+    
+    def _sync_get_stats(self) -> Dict[str, Any]:
+        """Collect index statistics on a worker thread."""
+        conn = self._get_reader()
         
-        # Get total content size
-        cursor = await self.db.execute("SELECT SUM(size) FROM notes_metadata")
-        total_size = (await cursor.fetchone())[0] or 0
+        # Counters are maintained by triggers on notes_metadata
+        meta = dict(conn.execute("""
+            SELECT key, value FROM fts_meta
+            WHERE key IN ('total_files', 'total_size_bytes', 'last_indexed_at')
+        """).fetchall())
         
-        # Get index freshness
-        cursor = await self.db.execute("""
-            SELECT 
-                MIN(last_indexed) as oldest,
-                MAX(last_indexed) as newest
-            FROM notes_metadata
-        """)
-        row = await cursor.fetchone()
-        oldest_index = row[0]
-        newest_index = row[1]
+        # MIN over the indexed column is a single b-tree lookup
+        oldest_index = conn.execute(
+            "SELECT MIN(last_indexed) FROM notes_metadata"
+        ).fetchone()[0]
+        newest_index = int(meta["last_indexed_at"]) if meta.get("last_indexed_at") is not None else None
         
         return {
-            "total_files": total_files,
-            "total_size_bytes": total_size,
+            "total_files": int(meta.get("total_files") or 0),
+            "total_size_bytes": int(meta.get("total_size_bytes") or 0),
             "oldest_index": oldest_index,
             "newest_index": newest_index,
             "index_age_seconds": time.time() - (newest_index or 0)
@@ -324,23 +889,7 @@ class QueryParser:
         field_queries = {}
         
         # Split by spaces but preserve quoted phrases
-        tokens = []
-        in_quotes = False
-        current_token = ""
-        
-        for char in query:
-            if char == '"':
-                in_quotes = not in_quotes
-                current_token += char
-            elif char == ' ' and not in_quotes:
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-            else:
-                current_token += char
-                
-        if current_token:
-            tokens.append(current_token)
+        tokens = _QUERY_TOKEN_RE.findall(query)
             
         # Parse field:value tokens
         remaining_tokens = []
@@ -367,11 +916,9 @@ class QueryParser:
             return False, "Search query too long (max 1000 characters)"
             
         # Check for potential SQL injection (basic)
-        dangerous_patterns = ['--', ';', 'DROP', 'DELETE', 'INSERT', 'UPDATE']
-        query_upper = query.upper()
-        for pattern in dangerous_patterns:
-            if pattern in query_upper:
-                return False, f"Query contains potentially dangerous pattern: {pattern}"
+        match = _DANGER_RE.search(query)
+        if match:
+            return False, f"Query contains potentially dangerous pattern: {match.group(0).upper()}"
                 
         return True, ""
 
@@ -403,16 +950,56 @@ async def rebuild_fts_index():
     
     logger.info("Rebuilding FTS index...")
     
-    # Clear existing index
-    if fts._initialized:
-        await fts.db.execute("DELETE FROM notes_fts")
-        await fts.db.execute("DELETE FROM notes_metadata")
-        await fts.db.commit()
+    # The rebuild is a strictly serial stream of writes, so it goes through
+    # its own synchronous connection, one worker-thread hop per batch,
+    # rather than an aiosqlite round-trip per statement
+    writer = await asyncio.to_thread(fts._open_writer)
+    
+    def clear_index() -> None:
+        writer.execute("BEGIN")
+        writer.execute("DELETE FROM notes_content")
+        writer.execute("DELETE FROM notes_metadata")
+        writer.execute("COMMIT")
+        fts._has_any = None
+    
+    def write_batch(files: List[Tuple[str, str, Any]]) -> int:
+        """
+        Write and commit a batch, falling back to one file at a time if it fails (blocking).
+        
+        The transaction begins and ends within this call, so it is never
+        held open while the rebuild awaits more notes.
+        """
+        writer.execute("BEGIN")
+        try:
+            FTSSearchIndex._sync_index_files(writer, files)
+            writer.execute("COMMIT")
+            return len(files)
+        except Exception as e:
+            logger.debug(f"Batched index write failed, indexing one at a time: {e}")
+            writer.execute("ROLLBACK")
+        written = 0
+        writer.execute("BEGIN")
+        try:
+            for file in files:
+                try:
+                    FTSSearchIndex._sync_index_files(writer, [file])
+                    written += 1
+                except Exception as e:
+                    logger.warning(f"Failed to index {file[0]}: {e}")
+        finally:
+            writer.execute("COMMIT")
+        return written
+    
+    def finish() -> None:
+        try:
+            if writer.in_transaction:
+                writer.execute("ROLLBACK")
+        finally:
+            writer.close()
     
     # Re-index all notes
     all_notes = await vault.list_notes(recursive=True)
-    indexed_count = 0
-    
+    paths: asyncio.Queue = asyncio.Queue()
     for note_info in all_notes:
         filepath = note_info["path"]
         
@@ -421,20 +1008,62 @@ async def rebuild_fts_index():
         if (filepath_normalized.startswith('.trash/') or '/.trash/' in filepath_normalized or
             filepath_normalized.startswith('.obsidian/') or '/.obsidian/' in filepath_normalized):
             continue
-            
+        paths.put_nowait(filepath)
+    
+    # Disk reads overlap with each other and with the writes: several
+    # readers parse notes into a bounded queue, this coroutine is the one
+    # writer draining it. Each reader ends its stream with a None.
+    notes: asyncio.Queue = asyncio.Queue(maxsize=REBUILD_QUEUE_SIZE)
+    
+    async def read_notes() -> None:
+        while not paths.empty():
+            filepath = paths.get_nowait()
+            try:
+                note = await vault.read_note(filepath)
+            except Exception as e:
+                logger.warning(f"Failed to index {filepath}: {e}")
+                logger.debug(f"Traceback for {filepath}", exc_info=True)
+                continue
+            await notes.put((note.path, note.content, note.metadata))
+        await notes.put(None)
+    
+    indexed_count = 0
+    batch = []
+    readers = []
+    
+    # Writes go out REBUILD_BATCH_SIZE notes at a time, one commit per batch
+    # rather than per note
+    async with fts.write_lock:
         try:
-            note = await vault.read_note(filepath)
-            await fts.index_file(note.path, note.content, note.metadata)
-            indexed_count += 1
+            await asyncio.to_thread(clear_index)
             
-            if indexed_count % 100 == 0:
-                logger.info(f"Indexed {indexed_count} notes...")
+            readers = [asyncio.create_task(read_notes()) for _ in range(REBUILD_READERS)]
+            running = len(readers)
+            while running:
+                item = await notes.get()
+                if item is None:
+                    running -= 1
+                    continue
                 
-        except Exception as e:
-            logger.warning(f"Failed to index {note_info['path']}: {e}")
-            import traceback
-            logger.debug(f"Traceback: {traceback.format_exc()}")
-            continue
+                batch.append(item)
+                if len(batch) < REBUILD_BATCH_SIZE:
+                    continue
+                
+                indexed_count += await asyncio.to_thread(write_batch, batch)
+                batch = []
+                logger.info(f"Indexed {indexed_count} notes...")
+            
+            if batch:
+                indexed_count += await asyncio.to_thread(write_batch, batch)
+        finally:
+            for reader in readers:
+                reader.cancel()
+            await asyncio.gather(*readers, return_exceptions=True)
+            await asyncio.to_thread(finish)
+            fts._has_any = None
+        
+        # Merge the per-note segments left by bulk insert into one b-tree
+        await fts.optimize()
     
     logger.info(f"FTS index rebuild complete. Indexed {indexed_count} notes.")
     return indexed_count
\ No newline at end of file
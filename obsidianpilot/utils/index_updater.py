@@ -2,14 +2,91 @@
 
 import asyncio
 import logging
+import os
 import time
+from array import array
 from pathlib import Path
-from typing import Set, Dict, Any
+from typing import Set, Dict, Any, List, Optional, Tuple
 from .fts_search import get_fts_search
 from .filesystem import get_vault
 
 logger = logging.getLogger(__name__)
 
+# Folders whose notes are never indexed
+EXCLUDED_DIRS = ('.trash', '.obsidian')
+
+# Seconds update_index_for_file waits to gather further saves into one commit
+INDEX_UPDATE_DELAY = 0.25
+
+
+def _scan_note_mtimes(vault_root: str) -> Dict[str, float]:
+    """
+    Map every indexable note in the vault to its mtime (blocking).
+    
+    Walks with os.scandir, taking mtimes from the directory entries, and
+    covers the same notes as vault.list_notes: symlinked folders aren't
+    descended into and .trash/.obsidian are skipped.
+    """
+    mtimes: Dict[str, float] = {}
+    stack = [(vault_root, "")]
+    while stack:
+        current, rel_dir = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError as e:
+            logger.warning(f"Failed to scan {current}: {e}")
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if entry.name not in EXCLUDED_DIRS and not entry.is_symlink():
+                            stack.append((entry.path, os.path.join(rel_dir, entry.name)))
+                    elif entry.name.endswith('.md'):
+                        mtimes[os.path.join(rel_dir, entry.name)] = entry.stat().st_mtime
+                except OSError as e:
+                    logger.warning(f"Failed to check file {entry.path}: {e}")
+    return mtimes
+
+
+def _diff_sorted(
+    old_paths: List[str], old_mtimes: array, new_paths: List[str], new_mtimes: array
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Compare two sorted path lists with parallel mtimes in one merge walk.
+    
+    Returns:
+        (added, modified, deleted) paths; a path is modified when its new
+        mtime is later than its old one
+    """
+    added: List[str] = []
+    modified: List[str] = []
+    deleted: List[str] = []
+    i = j = 0
+    old_count, new_count = len(old_paths), len(new_paths)
+    while i < old_count and j < new_count:
+        old_path, new_path = old_paths[i], new_paths[j]
+        if old_path == new_path:
+            if new_mtimes[j] > old_mtimes[i]:
+                modified.append(new_path)
+            i += 1
+            j += 1
+        elif old_path < new_path:
+            deleted.append(old_path)
+            i += 1
+        else:
+            added.append(new_path)
+            j += 1
+    deleted.extend(old_paths[i:])
+    added.extend(new_paths[j:])
+    return added, modified, deleted
+
+
+def _sorted_mtimes(mtimes: Dict[str, float]) -> Tuple[List[str], array]:
+    """Split a path -> mtime map into a sorted path list and a parallel array of mtimes."""
+    paths = sorted(mtimes)
+    return paths, array('d', [mtimes[path] for path in paths])
+
 
 class IndexUpdater:
     """Tracks file changes and updates the search index automatically."""
@@ -23,7 +100,10 @@ class IndexUpdater:
         """
         self.check_interval = check_interval
         self._last_check = 0
-        self._file_mtimes: Dict[str, float] = {}
+        # Last seen notes, kept compact between checks: sorted paths and
+        # their mtimes in a parallel array
+        self._paths: List[str] = []
+        self._mtimes = array('d')
         self._running = False
         
     async def check_and_update(self) -> Dict[str, Any]:
@@ -31,51 +111,32 @@ class IndexUpdater:
         vault = get_vault()
         fts = await get_fts_search()
         
-        # Get current files
-        all_notes = await vault.list_notes(recursive=True)
-        current_files = {note['path'] for note in all_notes}
-        
+        # Wait out a running rebuild rather than diffing against a half-built index
+        async with fts.write_lock:
+            return await self._check_and_update(vault, fts)
+    
+    async def _check_and_update(self, vault, fts) -> Dict[str, Any]:
+        """Diff the vault against the last check and apply the changes (holding fts.write_lock)."""
         # Get indexed files
-        stats = await fts.get_stats()
-        if stats['total_files'] == 0:
+        if not await fts.has_any():
             return {"status": "no_index", "message": "Index not built yet"}
         
-        # Track changes
-        added_files = []
-        modified_files = []
-        deleted_files = []
+        # Get current files and their mtimes in one walk, off the event loop
+        current_mtimes = await asyncio.to_thread(_scan_note_mtimes, str(vault.vault_path))
+        current_paths, current_times = _sorted_mtimes(current_mtimes)
         
-        # Check each file (skip .trash folder)
-        for note_info in all_notes:
-            filepath = note_info['path']
-            
-            # Skip files in .trash and .obsidian folders (handle both Windows \ and Unix / separators)
-            filepath_normalized = filepath.replace('\\', '/')
-            if (filepath_normalized.startswith('.trash/') or '/.trash/' in filepath_normalized or
-                filepath_normalized.startswith('.obsidian/') or '/.obsidian/' in filepath_normalized):
-                continue
-                
-            full_path = vault.vault_path / filepath
-            
-            try:
-                mtime = full_path.stat().st_mtime
-                
-                # Check if file is new or modified
-                if filepath not in self._file_mtimes:
-                    added_files.append(filepath)
-                elif mtime > self._file_mtimes[filepath]:
-                    modified_files.append(filepath)
-                    
-                self._file_mtimes[filepath] = mtime
-                
-            except Exception as e:
-                logger.warning(f"Failed to check file {filepath}: {e}")
+        # Track changes. The first check has nothing to compare against, so
+        # it diffs against the index itself: notes saved since they were last
+        # indexed count as modified
+        if self._paths:
+            previous_paths, previous_times = self._paths, self._mtimes
+        else:
+            previous_paths, previous_times = _sorted_mtimes(await fts.get_indexed_times())
+        added_files, modified_files, deleted_files = _diff_sorted(
+            previous_paths, previous_times, current_paths, current_times
+        )
         
-        # Check for deleted files
-        for filepath in list(self._file_mtimes.keys()):
-            if filepath not in current_files:
-                deleted_files.append(filepath)
-                del self._file_mtimes[filepath]
+        self._paths, self._mtimes = current_paths, current_times
         
         # Update index for changes
         updated_count = 0
@@ -103,7 +164,7 @@ class IndexUpdater:
             "modified": len(modified_files),
             "deleted": len(deleted_files),
             "total_updated": updated_count,
-            "total_files": len(current_files)
+            "total_files": len(current_paths)
         }
     
     async def start_auto_update(self):
@@ -141,6 +202,11 @@ class IndexUpdater:
 # Global updater instance
 _index_updater = None
 
+# Notes saved since the last flush (insertion-ordered, each path once) and
+# the task that will flush them
+_pending_updates: Dict[str, None] = {}
+_flush_task: Optional[asyncio.Task] = None
+
 
 async def start_index_updater():
     """Start the global index updater."""
@@ -153,27 +219,63 @@ async def start_index_updater():
 
 
 async def update_index_for_file(filepath: str):
-    """Update index for a specific file (called after create/update operations)."""
+    """
+    Queue an index update for a specific file (called after create/update operations).
+    
+    Saves arriving within INDEX_UPDATE_DELAY of each other are indexed
+    together and committed once, so rapid autosaves don't each pay a commit.
+    Use flush_index_updates to apply queued updates immediately.
+    """
+    global _flush_task
+    
+    # Skip files in .trash and .obsidian folders (handle both Windows \ and Unix / separators)
+    filepath_normalized = filepath.replace('\\', '/')
+    if (filepath_normalized.startswith('.trash/') or '/.trash/' in filepath_normalized or
+        filepath_normalized.startswith('.obsidian/') or '/.obsidian/' in filepath_normalized):
+        logger.debug(f"Skipping index update for excluded file: {filepath}")
+        return
+    
+    _pending_updates[filepath] = None
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_flush_after_delay())
+
+
+async def _flush_after_delay():
+    """Let more saves queue up, then index them all (again, if more arrive meanwhile)."""
+    while _pending_updates:
+        await asyncio.sleep(INDEX_UPDATE_DELAY)
+        await flush_index_updates()
+
+
+async def flush_index_updates():
+    """Index every queued file now, reading each note's latest content."""
+    if not _pending_updates:
+        return
+    filepaths = list(_pending_updates)
+    _pending_updates.clear()
+    
     try:
-        # Skip files in .trash and .obsidian folders (handle both Windows \ and Unix / separators)
-        filepath_normalized = filepath.replace('\\', '/')
-        if (filepath_normalized.startswith('.trash/') or '/.trash/' in filepath_normalized or
-            filepath_normalized.startswith('.obsidian/') or '/.obsidian/' in filepath_normalized):
-            logger.debug(f"Skipping index update for excluded file: {filepath}")
-            return
-        
         vault = get_vault()
         fts = await get_fts_search()
         
-        # Check if index exists
-        stats = await fts.get_stats()
-        if stats['total_files'] == 0:
-            return  # No index yet
-        
-        # Update the file in index
-        note = await vault.read_note(filepath)
-        await fts.index_file(note.path, note.content, note.metadata)
-        logger.debug(f"Updated index for {filepath}")
+        # Saves made during a rebuild wait for it to finish, then are read
+        # and indexed with their latest content
+        async with fts.write_lock:
+            # Check if index exists
+            if not await fts.has_any():
+                return  # No index yet
+            
+            files = []
+            for filepath in filepaths:
+                try:
+                    note = await vault.read_note(filepath)
+                except Exception as e:
+                    logger.warning(f"Failed to update index for {filepath}: {e}")
+                    continue
+                files.append((note.path, note.content, note.metadata))
+            
+            await fts.index_files(files)
+        logger.debug(f"Updated index for {len(files)} file(s)")
         
     except Exception as e:
-        logger.warning(f"Failed to update index for {filepath}: {e}")
\ No newline at end of file
+        logger.warning(f"Failed to update index for {', '.join(filepaths)}: {e}")
\ No newline at end of file
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import logging
+from .validation import compile_regex
 
 logger = logging.getLogger(__name__)
 
@@ -306,7 +307,7 @@ class PersistentSearchIndex:
         
         # Compile regex pattern
         try:
-            regex = re.compile(pattern, flags)
+            regex = compile_regex(pattern, flags)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
         
@@ -462,7 +463,7 @@ class PersistentSearchIndex:
                 line_num = self._find_line_number(line_offsets, match_start)
             else:
                 # Fallback: count newlines before match
-                line_num = content[:match_start].count('\n') + 1
+                line_num = content.count('\n', 0, match_start) + 1
             
             # Extract context
             context_start = max(0, match_start - context_length // 2)
@@ -514,7 +515,7 @@ class PersistentSearchIndex:
                 if line_offsets:
                     line_num = self._find_line_number(line_offsets, match_start)
                 else:
-                    line_num = content[:match_start].count('\n') + 1
+                    line_num = content.count('\n', 0, match_start) + 1
                 
                 # Extract context from full content
                 context_start = max(0, match_start - context_length // 2)
@@ -1,6 +1,7 @@
 """Enhanced validation utilities with constraint checking."""
 
 import re
+from functools import lru_cache
 from typing import List, Tuple, Optional, Any
 from ..constants import MARKDOWN_EXTENSIONS, ERROR_MESSAGES
 
@@ -73,6 +74,19 @@ def validate_search_query(query: str) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
+@lru_cache(maxsize=256)
+def compile_regex(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Compile a user-supplied regex, caching it per (pattern, flags).
+    
+    Shared by the regex search paths so a repeated query is only parsed once.
+    
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return re.compile(pattern, flags)
+
+
 def validate_context_length(length: int) -> Tuple[bool, Optional[str]]:
     """
     Validate context length parameter.
@@ -152,10 +166,14 @@ def validate_tags(tags: List[str]) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
+@lru_cache(maxsize=1024)
 def validate_directory_path(path: Optional[str]) -> Tuple[bool, Optional[str]]:
     """
     Validate a directory path for listing.
     
+    Cached per path, since the same directories are listed and searched
+    repeatedly.
+    
     Args:
         path: Directory path to validate (can be None)
         
@@ -64,8 +64,9 @@ async def test_fast_search():
         print("\n3. Testing simple search...")
         results = await fast_search_notes("project", max_results=5)
         print(f"   Found {results['total_count']} results for 'project'")
-        for i, result in enumerate(results['results'][:2]):
-            print(f"   - {result['path']}: {result['context'][:100]}...")
+        columns = results['results']
+        for path, context in list(zip(columns['paths'], columns['contexts']))[:2]:
+            print(f"   - {path}: {context[:100]}...")
         
         # Test 4: Boolean search
         print("\n4. Testing boolean search...")
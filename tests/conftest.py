@@ -1,6 +1,7 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
+import pytest_asyncio
 import asyncio
 import sys
 from pathlib import Path
@@ -14,4 +15,24 @@ def event_loop():
     """Create an instance of the default event loop for the test session."""
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
-    loop.close()
\ No newline at end of file
+    loop.close()
+
+
+@pytest_asyncio.fixture
+async def vault(tmp_path):
+    """Empty vault in a temporary directory, installed as the global vault."""
+    from obsidianpilot.utils import filesystem, fts_search, index_updater
+    
+    test_vault = filesystem.init_vault(str(tmp_path), use_persistent_index=False)
+    yield test_vault
+    
+    # Drop the module-level state the tools keep between calls
+    if index_updater._flush_task is not None:
+        index_updater._flush_task.cancel()
+        await asyncio.gather(index_updater._flush_task, return_exceptions=True)
+        index_updater._flush_task = None
+    index_updater._pending_updates.clear()
+    if fts_search._fts_search is not None:
+        await fts_search._fts_search.close()
+        fts_search._fts_search = None
+    filesystem.vault = None
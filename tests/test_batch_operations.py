@@ -0,0 +1,128 @@
+"""Tests for the batch note tools."""
+
+import pytest
+from obsidianpilot.tools.batch_operations import (
+    read_notes_batch, update_notes_batch, add_tags_batch, MAX_BATCH_SIZE
+)
+
+
+class TestPerItemFailures:
+    """Test that a failing item is reported in its position without stopping the batch."""
+    
+    @pytest.mark.asyncio
+    async def test_read_batch(self, vault):
+        """Test a missing note becomes a failure entry between successful reads."""
+        await vault.write_note("a.md", "first")
+        await vault.write_note("c.md", "third")
+        
+        result = await read_notes_batch(["a.md", "missing.md", "c.md"])
+        
+        assert result["success"] is False
+        assert result["operation"] == "batch_read"
+        assert result["summary"] == {"total": 3, "succeeded": 2, "failed": 1}
+        first, missing, third = result["results"]
+        assert first["success"] is True and first["path"] == "a.md"
+        assert missing["success"] is False
+        assert missing["path"] == "missing.md"
+        assert missing["error"]
+        assert third["success"] is True and third["path"] == "c.md"
+    
+    @pytest.mark.asyncio
+    async def test_update_batch(self, vault):
+        """Test one failed update leaves the other items applied."""
+        await vault.write_note("a.md", "old a")
+        await vault.write_note("c.md", "old c")
+        
+        result = await update_notes_batch([
+            {"path": "a.md", "content": "new a"},
+            {"path": "missing.md", "content": "never written"},
+            {"path": "c.md", "content": " and more", "merge_strategy": "append"}
+        ])
+        
+        assert result["summary"] == {"total": 3, "succeeded": 2, "failed": 1}
+        assert [item["success"] for item in result["results"]] == [True, False, True]
+        assert result["results"][1]["path"] == "missing.md"
+        assert (await vault.read_note("a.md")).content == "new a"
+        assert (await vault.read_note("c.md")).content.startswith("old c")
+        assert (await vault.read_note("c.md")).content.endswith("and more")
+        assert not (vault.vault_path / "missing.md").exists()
+    
+    @pytest.mark.asyncio
+    async def test_add_tags_batch(self, vault):
+        """Test tagging continues past a missing note."""
+        await vault.write_note("a.md", "body")
+        
+        result = await add_tags_batch(["missing.md", "a.md"], ["project"])
+        
+        assert [item["success"] for item in result["results"]] == [False, True]
+        assert result["results"][0]["path"] == "missing.md"
+        assert "project" in (await vault.read_note("a.md")).metadata.tags
+    
+    @pytest.mark.asyncio
+    async def test_all_succeed(self, vault):
+        """Test a clean batch reports success."""
+        await vault.write_note("a.md", "body")
+        
+        result = await read_notes_batch(["a.md"])
+        
+        assert result["success"] is True
+        assert result["summary"] == {"total": 1, "succeeded": 1, "failed": 0}
+
+
+class TestBatchValidation:
+    """Test the checks made before any item runs."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("paths", [["a.md", "b.md", "a.md"], ["a", "a.md"], ["/a.md", "a.md"]])
+    async def test_duplicate_write_paths_rejected(self, vault, paths):
+        """Test a note named twice in a write batch is rejected before anything is written."""
+        with pytest.raises(ValueError, match="more than once"):
+            await update_notes_batch([
+                {"path": path, "content": f"content {i}", "create_if_not_exists": True}
+                for i, path in enumerate(paths)
+            ])
+        with pytest.raises(ValueError, match="more than once"):
+            await add_tags_batch(paths, ["tag"])
+        
+        assert list(vault.vault_path.glob("*.md")) == []
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_read_paths_allowed(self, vault):
+        """Test reads may name the same note twice."""
+        await vault.write_note("a.md", "body")
+        
+        result = await read_notes_batch(["a.md", "a.md"])
+        
+        assert result["summary"]["succeeded"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_batch_size_limit(self, vault):
+        """Test batches over MAX_BATCH_SIZE items are rejected and the limit itself is accepted."""
+        assert MAX_BATCH_SIZE == 100
+        too_many = [f"note{i}.md" for i in range(MAX_BATCH_SIZE + 1)]
+        
+        with pytest.raises(ValueError, match="max: 100"):
+            await read_notes_batch(too_many)
+        with pytest.raises(ValueError, match="max: 100"):
+            await update_notes_batch([{"path": path, "content": "x"} for path in too_many])
+        with pytest.raises(ValueError, match="max: 100"):
+            await add_tags_batch(too_many, ["tag"])
+        
+        result = await read_notes_batch(too_many[:MAX_BATCH_SIZE])
+        assert result["summary"]["total"] == MAX_BATCH_SIZE
+    
+    @pytest.mark.asyncio
+    async def test_empty_batch_rejected(self, vault):
+        """Test a batch needs at least one item."""
+        with pytest.raises(ValueError):
+            await read_notes_batch([])
+        with pytest.raises(ValueError):
+            await update_notes_batch([])
+        with pytest.raises(ValueError):
+            await add_tags_batch([], ["tag"])
+    
+    @pytest.mark.asyncio
+    async def test_malformed_update_item_rejected(self, vault):
+        """Test update items need a path and content."""
+        with pytest.raises(ValueError, match="'path' and 'content'"):
+            await update_notes_batch([{"path": "a.md"}])
@@ -0,0 +1,91 @@
+"""Tests for the FTS5-backed fast search tools."""
+
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from obsidianpilot.models import NoteMetadata
+from obsidianpilot.tools import fast_search
+from obsidianpilot.utils.fts_search import get_fts_search
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+class TestFastSearchImport:
+    """Test that the fast search module loads on its own."""
+    
+    def test_import_in_fresh_interpreter(self):
+        """Test importing fast_search first doesn't hit the server import cycle."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import obsidianpilot.tools.fast_search"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+        
+        assert result.returncode == 0, result.stderr
+
+
+@pytest.fixture
+def no_background_index(monkeypatch):
+    """Keep search_notes from starting the server's background indexer."""
+    async def start_background_index():
+        pass
+    monkeypatch.setattr(fast_search, "_start_background_index", start_background_index)
+
+
+class TestSearchNotesShape:
+    """Pin the columnar fts5_full_text_v2 response of search_notes."""
+    
+    @pytest.mark.asyncio
+    async def test_columnar_results(self, vault, no_background_index):
+        """Test results are parallel lists in rank order."""
+        fts = await get_fts_search()
+        await fts.index_files([
+            ("Notes/often.md", "python " * 5 + "filler", NoteMetadata()),
+            ("Notes/once.md", "python " + "filler " * 5, NoteMetadata()),
+            ("Notes/other.md", "nothing relevant", NoteMetadata()),
+        ])
+        
+        result = await fast_search.search_notes("python", max_results=10)
+        
+        assert result["query"] == {"text": "python", "context_length": 100, "type": "fts5_full_text_v2"}
+        assert set(result["results"]) == {"paths", "filenames", "contexts", "scores"}
+        assert result["results"]["paths"] == ["Notes/often.md", "Notes/once.md"]
+        assert result["results"]["filenames"] == ["often", "once"]
+        assert all("<mark>" in context for context in result["results"]["contexts"])
+        scores = result["results"]["scores"]
+        assert scores == sorted(scores, reverse=True)
+        assert result["total_count"] == 2
+        assert result["max_results"] == 10
+        assert result["truncated"] is False
+        assert result["performance"]["indexed_files"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_columns_match_row_search(self, vault, no_background_index):
+        """Test the columns hold the same hits as the row-shaped index search."""
+        fts = await get_fts_search()
+        await fts.index_files([
+            (f"note{i}.md", f"topic alpha {'beta ' * i}", NoteMetadata()) for i in range(1, 6)
+        ])
+        
+        result = await fast_search.search_notes("beta", max_results=3)
+        rows = await fts.search("beta", limit=3, snippet_length=100 // 3)
+        
+        assert result["results"] == {
+            "paths": [row["path"] for row in rows],
+            "filenames": [row["filename"] for row in rows],
+            "contexts": [row["context"] for row in rows],
+            "scores": [row["score"] for row in rows]
+        }
+        assert result["truncated"] is True
+    
+    @pytest.mark.asyncio
+    async def test_empty_index_keeps_shape(self, vault, no_background_index):
+        """Test an unbuilt index returns empty columns rather than a list."""
+        result = await fast_search.search_notes("python")
+        
+        assert result["results"] == {"paths": [], "filenames": [], "contexts": [], "scores": []}
+        assert result["query"]["type"] == "fts5_full_text_v2"
+        assert result["performance"]["status"] == "index_not_ready"
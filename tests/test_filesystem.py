@@ -0,0 +1,413 @@
+"""Tests for the vault filesystem layer and its caches."""
+
+import asyncio
+import os
+import threading
+import time
+import pytest
+from obsidianpilot.utils import filesystem
+from obsidianpilot.utils.filesystem import ObsidianVault
+
+
+class TestReadNoteCache:
+    """Test that cached reads can't be changed through a returned note."""
+    
+    @pytest.mark.asyncio
+    async def test_mutating_returned_note_does_not_touch_cache(self, vault):
+        """Test edits to a returned note don't show up in the next read."""
+        await vault.write_note("note.md", "---\ntags: [alpha]\nstatus: draft\n---\n\nBody text")
+        
+        note = await vault.read_note("note.md")
+        note.content = "changed"
+        note.metadata.tags.append("beta")
+        note.metadata.frontmatter["status"] = "done"
+        
+        reread = await vault.read_note("note.md")
+        assert reread.content == "---\ntags: [alpha]\nstatus: draft\n---\n\nBody text"
+        assert reread.metadata.tags == ["alpha"]
+        assert reread.metadata.frontmatter["status"] == "draft"
+        assert (await vault.read_frontmatter("note.md"))["status"] == "draft"
+    
+    @pytest.mark.asyncio
+    async def test_reads_return_distinct_instances(self, vault):
+        """Test two cached reads don't share a Note."""
+        await vault.write_note("note.md", "#tag text")
+        
+        first = await vault.read_note("note.md")
+        second = await vault.read_note("note.md")
+        assert first == second
+        assert first is not second
+        assert first.metadata is not second.metadata
+    
+    @staticmethod
+    def _rewrite(path, content, stamp_ns):
+        """Overwrite path outside the vault API, keeping its mtime at stamp_ns."""
+        path.write_text(content, encoding="utf-8")
+        os.utime(path, ns=(stamp_ns, stamp_ns))
+    
+    @pytest.mark.asyncio
+    async def test_rewrite_within_mtime_tick(self, vault):
+        """Test an external same-size save that keeps the mtime isn't served stale."""
+        path = vault.vault_path / "note.md"
+        stamp = time.time_ns()
+        self._rewrite(path, "---\nstatus: draft\n---\nold body", stamp)
+        assert (await vault.read_note("note.md")).content.endswith("old body")
+        assert (await vault.read_frontmatter("note.md"))["status"] == "draft"
+        
+        self._rewrite(path, "---\nstatus: final\n---\nnew body", stamp)
+        note = await vault.read_note("note.md")
+        assert note.content.endswith("new body")
+        assert note.metadata.frontmatter["status"] == "final"
+        
+        vault._note_cache.clear()
+        self._rewrite(path, "---\nstatus: tired\n---\nnew body", stamp)
+        assert (await vault.read_frontmatter("note.md"))["status"] == "tired"
+    
+    @pytest.mark.asyncio
+    async def test_settled_note_is_cached(self, vault):
+        """Test a note last modified outside the window is served from the cache."""
+        path = vault.vault_path / "note.md"
+        stamp = time.time_ns() - 60 * 10**9
+        self._rewrite(path, "settled", stamp)
+        
+        await vault.read_note("note.md")
+        assert vault._note_cache["note.md"][0] == stamp
+
+
+class TestStreamReplace:
+    """Test the chunked replace against str.replace on small chunks."""
+    
+    @pytest.fixture
+    def small_chunks(self, monkeypatch):
+        """Stream 8 characters at a time so short notes span many chunks."""
+        monkeypatch.setattr(filesystem, "STREAM_CHUNK_SIZE", 8)
+    
+    @staticmethod
+    def _replace(path, content, search_text, replacement_text, first_only):
+        """Write content, stream-replace it and return (count, new content)."""
+        path.write_text(content, encoding="utf-8")
+        count = ObsidianVault._stream_replace(path, search_text, replacement_text, first_only)
+        return count, path.read_text(encoding="utf-8")
+    
+    def test_match_straddling_chunk_boundary(self, tmp_path, small_chunks):
+        """Test a match split across two chunks is still replaced."""
+        # "needle" starts at offset 5, crossing the boundary at 8
+        content = "abcd needle tail"
+        count, result = self._replace(tmp_path / "note.md", content, "needle", "pin", True)
+        assert count == 1
+        assert result == "abcd pin tail"
+    
+    def test_search_longer_than_chunk(self, tmp_path, small_chunks):
+        """Test a search string spanning several chunks."""
+        search_text = "a long search string spanning chunks"
+        content = f"start {search_text} middle {search_text} end"
+        count, result = self._replace(tmp_path / "note.md", content, search_text, "X", False)
+        assert count == 2
+        assert result == "start X middle X end"
+    
+    @pytest.mark.parametrize("search_text,replacement_text", [
+        ("ab", "ba"),
+        ("aba", ""),
+        ("b", "bbbbbbbbbbbb"),
+        ("abababab", "Z"),
+    ])
+    def test_replace_all_matches_str_replace(self, tmp_path, small_chunks, search_text, replacement_text):
+        """Test replace-all counts and output equal str.count and str.replace."""
+        content = "ab" * 37 + "\nabaab\n" + "b" * 11 + "ababa" * 9
+        count, result = self._replace(tmp_path / "note.md", content, search_text, replacement_text, False)
+        assert count == content.count(search_text)
+        assert result == content.replace(search_text, replacement_text)
+    
+    def test_first_only_matches_str_replace(self, tmp_path, small_chunks):
+        """Test a first-only replace leaves later matches alone."""
+        content = "x" * 20 + "match " * 10
+        count, result = self._replace(tmp_path / "note.md", content, "match", "hit", True)
+        assert count == 1
+        assert result == content.replace("match", "hit", 1)
+    
+    def test_no_match_leaves_file_untouched(self, tmp_path, small_chunks):
+        """Test the note isn't rewritten when nothing matches."""
+        path = tmp_path / "note.md"
+        path.write_text("nothing to see here", encoding="utf-8")
+        mtime = path.stat().st_mtime_ns
+        
+        assert ObsidianVault._stream_replace(path, "absent", "x", False) == 0
+        assert path.stat().st_mtime_ns == mtime
+        assert os.listdir(tmp_path) == ["note.md"]
+    
+    def test_failed_write_keeps_original(self, tmp_path, small_chunks):
+        """Test a write error mid-stream leaves the note as it was."""
+        path = tmp_path / "note.md"
+        content = "keep " * 20
+        path.write_text(content, encoding="utf-8")
+        
+        # A lone surrogate can't be encoded, so writing the replacement fails
+        with pytest.raises(UnicodeEncodeError):
+            ObsidianVault._stream_replace(path, "keep", "\ud800", False)
+        
+        assert path.read_text(encoding="utf-8") == content
+        assert os.listdir(tmp_path) == ["note.md"]
+    
+    def test_failed_swap_keeps_original(self, tmp_path, small_chunks, monkeypatch):
+        """Test a failing rename leaves the note as it was and removes the temp file."""
+        path = tmp_path / "note.md"
+        content = "keep " * 20
+        path.write_text(content, encoding="utf-8")
+        
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(filesystem.os, "replace", fail_replace)
+        
+        with pytest.raises(OSError):
+            ObsidianVault._stream_replace(path, "keep", "drop", False)
+        
+        assert path.read_text(encoding="utf-8") == content
+        assert os.listdir(tmp_path) == ["note.md"]
+    
+    def test_temp_file_is_unique(self, tmp_path, small_chunks):
+        """Test another replace's temp file next to the note is left alone."""
+        path = tmp_path / "note.md"
+        other = tmp_path / "note.md.tmp"
+        other.write_text("another replace in progress", encoding="utf-8")
+        
+        count, result = self._replace(path, "old text", "old", "new", False)
+        
+        assert (count, result) == (1, "new text")
+        assert other.read_text(encoding="utf-8") == "another replace in progress"
+        assert sorted(os.listdir(tmp_path)) == ["note.md", "note.md.tmp"]
+    
+    def test_permissions_kept(self, tmp_path, small_chunks):
+        """Test the replaced note keeps its file mode."""
+        path = tmp_path / "note.md"
+        path.write_text("old text", encoding="utf-8")
+        path.chmod(0o644)
+        
+        assert ObsidianVault._stream_replace(path, "old", "new", False) == 1
+        assert path.stat().st_mode & 0o777 == 0o644
+    
+    @pytest.mark.asyncio
+    async def test_replace_in_note_refreshes_cache(self, vault, small_chunks):
+        """Test read_note sees the replaced text, not the cached note."""
+        await vault.write_note("note.md", "old text across chunks, old again")
+        await vault.read_note("note.md")
+        
+        assert await vault.replace_in_note("note.md", "old", "new", "all") == 2
+        assert (await vault.read_note("note.md")).content == "new text across chunks, new again"
+
+
+class TestCoalescedWrites:
+    """Test operations right after coalesced writes see the last content."""
+    
+    @staticmethod
+    async def _start_writes(vault, path, count):
+        """Start overlapping overwrites v0..v{count-1} of path without waiting for them."""
+        writes = [
+            asyncio.create_task(vault.write_note(path, f"v{i}", overwrite=True))
+            for i in range(count)
+        ]
+        # Let every write queue its content behind the first flush
+        await asyncio.sleep(0)
+        return writes
+    
+    @pytest.mark.asyncio
+    async def test_read_sees_last_write(self, vault):
+        """Test read_note waits for the in-flight write instead of reading old content."""
+        await vault.write_note("note.md", "original")
+        await vault.read_note("note.md")
+        
+        writes = await self._start_writes(vault, "note.md", 5)
+        note = await vault.read_note("note.md")
+        
+        assert note.content == "v4"
+        results = await asyncio.gather(*writes)
+        assert all(result.content == "v4" for result in results)
+        assert (vault.vault_path / "note.md").read_text(encoding="utf-8") == "v4"
+    
+    @pytest.mark.asyncio
+    async def test_delete_is_not_undone_by_pending_write(self, vault):
+        """Test a pending write doesn't recreate a note deleted after it."""
+        await vault.write_note("note.md", "original")
+        
+        writes = await self._start_writes(vault, "note.md", 3)
+        assert await vault.delete_note("note.md")
+        await asyncio.gather(*writes, return_exceptions=True)
+        
+        assert not (vault.vault_path / "note.md").exists()
+        with pytest.raises(FileNotFoundError):
+            await vault.read_note("note.md")
+    
+    @pytest.mark.asyncio
+    async def test_move_carries_last_write(self, vault):
+        """Test moving a note right after writes moves the last content."""
+        from obsidianpilot.tools.organization import move_note
+        
+        await vault.write_note("Inbox/note.md", "original")
+        
+        writes = await self._start_writes(vault, "Inbox/note.md", 4)
+        await move_note("Inbox/note.md", "Archive/note.md")
+        await asyncio.gather(*writes, return_exceptions=True)
+        
+        assert (await vault.read_note("Archive/note.md")).content == "v3"
+        assert not (vault.vault_path / "Inbox" / "note.md").exists()
+    
+    @pytest.mark.asyncio
+    async def test_replace_applies_to_last_write(self, vault):
+        """Test replace_in_note edits the content of the last write."""
+        await vault.write_note("note.md", "original")
+        
+        writes = await self._start_writes(vault, "note.md", 3)
+        assert await vault.replace_in_note("note.md", "v2", "final") == 1
+        await asyncio.gather(*writes)
+        
+        assert (await vault.read_note("note.md")).content == "final"
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_creates_conflict(self, vault):
+        """Test two creates of a new note can't both succeed."""
+        results = await asyncio.gather(
+            vault.write_note("new.md", "first"),
+            vault.write_note("new.md", "second"),
+            return_exceptions=True
+        )
+        
+        assert sum(isinstance(result, FileExistsError) for result in results) == 1
+        assert (await vault.read_note("new.md")).content == "first"
+    
+    @staticmethod
+    async def _start_paused_replace(vault, monkeypatch, path, search_text, replacement_text):
+        """Start replace_in_note and return (task, release) once its stream is running."""
+        started = threading.Event()
+        release = threading.Event()
+        stream_replace = vault._stream_replace
+        
+        def paused_stream_replace(*args):
+            started.set()
+            release.wait(10)
+            return stream_replace(*args)
+        monkeypatch.setattr(vault, "_stream_replace", paused_stream_replace)
+        
+        replace = asyncio.create_task(vault.replace_in_note(path, search_text, replacement_text, "all"))
+        assert await asyncio.to_thread(started.wait, 10)
+        return replace, release
+    
+    @pytest.mark.asyncio
+    async def test_write_during_replace_lands_after_it(self, vault, monkeypatch):
+        """Test a write started mid-replace isn't overwritten when the replace swaps its file in."""
+        await vault.write_note("note.md", "old text")
+        replace, release = await self._start_paused_replace(vault, monkeypatch, "note.md", "old", "new")
+        
+        write = asyncio.create_task(vault.write_note("note.md", "written", overwrite=True))
+        read = asyncio.create_task(vault.read_note("note.md"))
+        await asyncio.sleep(0.05)
+        assert not write.done() and not read.done()
+        
+        release.set()
+        assert await replace == 1
+        assert (await write).content == "written"
+        assert (await read).content == "written"
+        assert (vault.vault_path / "note.md").read_text(encoding="utf-8") == "written"
+    
+    @pytest.mark.asyncio
+    async def test_delete_waits_for_replace(self, vault, monkeypatch):
+        """Test a delete started mid-replace isn't undone by the replace's rename."""
+        await vault.write_note("note.md", "old text")
+        replace, release = await self._start_paused_replace(vault, monkeypatch, "note.md", "old", "new")
+        
+        delete = asyncio.create_task(vault.delete_note("note.md"))
+        await asyncio.sleep(0.05)
+        assert not delete.done()
+        
+        release.set()
+        assert await replace == 1
+        assert await delete
+        assert not (vault.vault_path / "note.md").exists()
+
+
+class TestListNotesCache:
+    """Test that cached listings follow notes added and removed in nested folders."""
+    
+    @staticmethod
+    def _set_dir_mtimes(root, stamp_ns):
+        """Set the mtime of root and every folder below it."""
+        for dirpath, _, _ in os.walk(root):
+            os.utime(dirpath, ns=(stamp_ns, stamp_ns))
+    
+    @staticmethod
+    async def _paths(vault, directory=None):
+        """Paths list_notes returns."""
+        return [note["path"] for note in await vault.list_notes(directory)]
+    
+    @pytest.fixture
+    def nested_vault(self, vault):
+        """Vault with notes three folders deep whose folders were last changed a minute ago."""
+        deep = vault.vault_path / "a" / "b" / "c"
+        deep.mkdir(parents=True)
+        (vault.vault_path / "top.md").write_text("top", encoding="utf-8")
+        (deep / "deep.md").write_text("deep", encoding="utf-8")
+        self._set_dir_mtimes(vault.vault_path, time.time_ns() - 60 * 10**9)
+        return vault
+    
+    @pytest.mark.asyncio
+    async def test_nested_create_and_delete(self, nested_vault):
+        """Test notes created or deleted outside the vault API in a nested folder show up."""
+        vault = nested_vault
+        deep = vault.vault_path / "a" / "b" / "c"
+        assert await self._paths(vault) == ["a/b/c/deep.md", "top.md"]
+        assert (None, True) in vault._note_list_cache
+        
+        (deep / "new.md").write_text("new", encoding="utf-8")
+        assert await self._paths(vault) == ["a/b/c/deep.md", "a/b/c/new.md", "top.md"]
+        assert await self._paths(vault, "a/b") == ["a/b/c/deep.md", "a/b/c/new.md"]
+        
+        self._set_dir_mtimes(vault.vault_path, time.time_ns() - 30 * 10**9)
+        (deep / "deep.md").unlink()
+        assert await self._paths(vault) == ["a/b/c/new.md", "top.md"]
+        assert await self._paths(vault, "a/b") == ["a/b/c/new.md"]
+    
+    @pytest.mark.asyncio
+    async def test_new_folder_is_listed(self, nested_vault):
+        """Test a note in a newly created nested folder shows up."""
+        vault = nested_vault
+        await self._paths(vault)
+        
+        newer = vault.vault_path / "a" / "b" / "d"
+        newer.mkdir()
+        (newer / "fresh.md").write_text("fresh", encoding="utf-8")
+        assert "a/b/d/fresh.md" in await self._paths(vault)
+    
+    @pytest.mark.asyncio
+    async def test_change_within_mtime_tick(self, vault):
+        """Test a folder whose mtime doesn't move (coarse timestamps) isn't served stale."""
+        folder = vault.vault_path / "inbox"
+        folder.mkdir()
+        (folder / "one.md").write_text("one", encoding="utf-8")
+        stamp = time.time_ns()
+        self._set_dir_mtimes(vault.vault_path, stamp)
+        assert await self._paths(vault) == ["inbox/one.md"]
+        
+        (folder / "two.md").write_text("two", encoding="utf-8")
+        self._set_dir_mtimes(vault.vault_path, stamp)
+        assert await self._paths(vault) == ["inbox/one.md", "inbox/two.md"]
+    
+    @pytest.mark.asyncio
+    async def test_write_and_delete_clear_cache(self, nested_vault):
+        """Test write_note and delete_note drop cached listings."""
+        vault = nested_vault
+        await self._paths(vault)
+        await self._paths(vault, "a")
+        assert len(vault._note_list_cache) == 2
+        
+        await vault.write_note("a/b/c/deep.md", "rewritten", overwrite=True)
+        assert len(vault._note_list_cache) == 0
+        
+        self._set_dir_mtimes(vault.vault_path, time.time_ns() - 60 * 10**9)
+        await self._paths(vault)
+        await vault.write_note("a/b/c/added.md", "added")
+        assert len(vault._note_list_cache) == 0
+        assert "a/b/c/added.md" in await self._paths(vault)
+        
+        self._set_dir_mtimes(vault.vault_path, time.time_ns() - 60 * 10**9)
+        await self._paths(vault)
+        await vault.delete_note("a/b/c/added.md")
+        assert len(vault._note_list_cache) == 0
+        assert "a/b/c/added.md" not in await self._paths(vault)
@@ -0,0 +1,297 @@
+"""Tests for the SQLite FTS5 search index."""
+
+import asyncio
+import sqlite3
+import pytest
+import pytest_asyncio
+from obsidianpilot.models import NoteMetadata
+from obsidianpilot.utils import fts_search, index_updater
+from obsidianpilot.utils.fts_search import (
+    FTSSearchIndex, FTS_SCHEMA_VERSION, get_fts_search, rebuild_fts_index
+)
+
+
+@pytest_asyncio.fixture
+async def fts(tmp_path):
+    """Fresh FTS index in a temporary database."""
+    index = FTSSearchIndex(str(tmp_path / "fts.db"))
+    await index.initialize()
+    yield index
+    await index.close()
+
+
+def _schema_version(db_path):
+    """Read the schema version recorded in an index database."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT value FROM fts_meta WHERE key = 'schema_version'").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestSchemaMigration:
+    """Test that indexes written by older versions are rebuilt on open."""
+    
+    @staticmethod
+    def _write_old_index(db_path, schema_version):
+        """Create an index in the pre-external-content layout, keyed by path."""
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE VIRTUAL TABLE notes_fts USING fts5(
+                filepath UNINDEXED, filename, content, tags, properties
+            );
+            CREATE TABLE notes_metadata (
+                filepath TEXT PRIMARY KEY, mtime REAL, size INTEGER, last_indexed REAL
+            );
+            INSERT INTO notes_fts VALUES ('old.md', 'old', 'stale text', '', '');
+            INSERT INTO notes_metadata VALUES ('old.md', 1.0, 10, 1.0);
+        """)
+        if schema_version is not None:
+            conn.executescript(f"""
+                CREATE TABLE fts_meta (key TEXT PRIMARY KEY, value TEXT);
+                INSERT INTO fts_meta VALUES ('schema_version', '{schema_version}');
+                INSERT INTO fts_meta VALUES ('total_files', '1');
+                INSERT INTO fts_meta VALUES ('total_size_bytes', '10');
+            """)
+        conn.commit()
+        conn.close()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("schema_version", [None, 5])
+    async def test_old_index_is_recreated(self, tmp_path, schema_version):
+        """Test opening an unversioned or v5 index drops it and starts empty."""
+        db_path = str(tmp_path / "fts.db")
+        self._write_old_index(db_path, schema_version)
+        
+        index = FTSSearchIndex(db_path)
+        await index.initialize()
+        try:
+            stats = await index.get_stats()
+            assert stats["total_files"] == 0
+            assert stats["total_size_bytes"] == 0
+            assert not await index.has_any()
+            assert await index.search("stale") == []
+            
+            # The recreated tables take writes in the new layout
+            await index.index_file("new.md", "fresh text", NoteMetadata())
+            results = await index.search("fresh")
+            assert [result["path"] for result in results] == ["new.md"]
+        finally:
+            await index.close()
+        
+        assert _schema_version(db_path) == str(FTS_SCHEMA_VERSION)
+    
+    @pytest.mark.asyncio
+    async def test_current_index_is_kept(self, tmp_path):
+        """Test reopening an index at the current version keeps its notes."""
+        db_path = str(tmp_path / "fts.db")
+        index = FTSSearchIndex(db_path)
+        await index.initialize()
+        await index.index_file("kept.md", "kept text", NoteMetadata())
+        await index.close()
+        
+        index = FTSSearchIndex(db_path)
+        await index.initialize()
+        try:
+            assert (await index.get_stats())["total_files"] == 1
+            assert [result["path"] for result in await index.search("kept")] == ["kept.md"]
+        finally:
+            await index.close()
+
+
+class TestStatsCounters:
+    """Test the trigger-maintained counters get_stats reports."""
+    
+    @pytest.mark.asyncio
+    async def test_insert_upsert_delete(self, fts):
+        """Test counts and sizes after inserting, rewriting and removing notes."""
+        await fts.index_file("a.md", "a" * 10, NoteMetadata())
+        await fts.index_file("b.md", "b" * 20, NoteMetadata())
+        stats = await fts.get_stats()
+        assert stats["total_files"] == 2
+        assert stats["total_size_bytes"] == 30
+        assert stats["newest_index"] is not None
+        
+        # Rewriting a note replaces its size rather than adding a file
+        await fts.index_file("a.md", "a" * 15, NoteMetadata())
+        stats = await fts.get_stats()
+        assert stats["total_files"] == 2
+        assert stats["total_size_bytes"] == 35
+        
+        # Unchanged content writes nothing
+        await fts.index_file("a.md", "a" * 15, NoteMetadata())
+        assert (await fts.get_stats())["total_size_bytes"] == 35
+        
+        await fts.remove_file("b.md")
+        stats = await fts.get_stats()
+        assert stats["total_files"] == 1
+        assert stats["total_size_bytes"] == 15
+        
+        await fts.remove_file("a.md")
+        stats = await fts.get_stats()
+        assert stats["total_files"] == 0
+        assert stats["total_size_bytes"] == 0
+        assert not await fts.has_any()
+    
+    @pytest.mark.asyncio
+    async def test_counters_match_tables(self, fts):
+        """Test the counters agree with a full count of notes_metadata."""
+        await fts.index_files([
+            (f"note{i}.md", f"note number {i} " * (i + 1), NoteMetadata()) for i in range(20)
+        ])
+        await fts.remove_file("note3.md")
+        await fts.index_file("note4.md", "shorter", NoteMetadata())
+        
+        stats = await fts.get_stats()
+        conn = sqlite3.connect(fts.db_path)
+        try:
+            count, size = conn.execute("SELECT COUNT(*), SUM(size) FROM notes_metadata").fetchone()
+        finally:
+            conn.close()
+        assert stats["total_files"] == count == 19
+        assert stats["total_size_bytes"] == size
+
+
+class TestSearchMany:
+    """Test batched searches against a small index."""
+    
+    @pytest_asyncio.fixture
+    async def indexed(self, fts):
+        """Index notes where 'python' appears with different frequencies."""
+        await fts.index_files([
+            (f"python{i}.md", "python " * i + "filler words " * (10 - i), NoteMetadata())
+            for i in range(1, 6)
+        ] + [
+            ("rust.md", "rust ownership and borrowing", NoteMetadata()),
+            ("both.md", "python bindings for rust", NoteMetadata()),
+        ])
+        return fts
+    
+    @pytest.mark.asyncio
+    async def test_buckets_match_single_searches(self, indexed):
+        """Test each bucket holds what search() returns for its query, in rank order."""
+        queries = ["python", "rust", "nothingmatches"]
+        buckets = await indexed.search_many(queries, limit=50)
+        
+        assert len(buckets) == len(queries)
+        for query, bucket in zip(queries, buckets):
+            assert bucket == await indexed.search(query, limit=50)
+            assert [result["rank"] for result in bucket] == list(range(1, len(bucket) + 1))
+            scores = [result["score"] for result in bucket]
+            assert scores == sorted(scores, reverse=True)
+        
+        assert buckets[2] == []
+        # More occurrences in a note of the same length ranks higher
+        python_paths = [result["path"] for result in buckets[0]]
+        assert python_paths.index("python5.md") < python_paths.index("python1.md")
+    
+    @pytest.mark.asyncio
+    async def test_no_duplicates_within_a_bucket(self, indexed):
+        """Test a note appears once per query, but in every query it matches."""
+        python, rust = await indexed.search_many(["python", "rust"])
+        
+        python_paths = [result["path"] for result in python]
+        rust_paths = [result["path"] for result in rust]
+        assert len(python_paths) == len(set(python_paths)) == 6
+        assert sorted(rust_paths) == ["both.md", "rust.md"]
+        assert "both.md" in python_paths
+    
+    @pytest.mark.asyncio
+    async def test_repeated_query_gets_its_own_bucket(self, indexed):
+        """Test the same query twice yields two identical buckets."""
+        first, second = await indexed.search_many(["rust", "rust"])
+        assert first == second
+        assert len(first) == 2
+    
+    @pytest.mark.asyncio
+    async def test_limit_applies_per_query(self, indexed):
+        """Test the limit caps each bucket separately, keeping the best hits."""
+        python, rust = await indexed.search_many(["python", "rust"], limit=3)
+        
+        assert len(python) == 3
+        assert len(rust) == 2
+        assert python == (await indexed.search("python", limit=50))[:3]
+
+
+class TestRebuildDuringSaves:
+    """Test saves made while the index is being rebuilt."""
+    
+    @pytest_asyncio.fixture
+    async def paused_rebuild(self, vault, monkeypatch):
+        """
+        Start a rebuild over 60 notes that pauses when it reads target.md.
+        
+        Yields (rebuild task, release event) once the rebuild has committed
+        its first batches and read target.md's original content.
+        """
+        for i in range(60):
+            await vault.write_note(f"note{i:02}.md", f"filler note {i}")
+        await vault.write_note("target.md", "stale words")
+        monkeypatch.setattr(fts_search, "REBUILD_BATCH_SIZE", 5)
+        monkeypatch.setattr(fts_search, "REBUILD_READERS", 1)
+        
+        fts = await get_fts_search()
+        await fts.index_file("seed.md", "seed", NoteMetadata())
+        
+        target_read = asyncio.Event()
+        release = asyncio.Event()
+        read_note = vault.read_note
+        
+        async def pausing_read_note(path):
+            note = await read_note(path)
+            if path == "target.md" and not target_read.is_set():
+                target_read.set()
+                await release.wait()
+            return note
+        monkeypatch.setattr(vault, "read_note", pausing_read_note)
+        
+        # The single reader reads in list order, so target.md comes last
+        rebuild = asyncio.create_task(rebuild_fts_index())
+        await asyncio.wait_for(target_read.wait(), timeout=30)
+        yield rebuild, release
+        release.set()
+        await asyncio.gather(rebuild, return_exceptions=True)
+    
+    @pytest.mark.asyncio
+    async def test_no_transaction_held_while_waiting(self, vault, paused_rebuild):
+        """Test another connection can write while the rebuild waits for notes."""
+        rebuild, release = paused_rebuild
+        
+        conn = sqlite3.connect(str(vault.vault_path / ".obsidian" / "fts-search-index.db"), timeout=0)
+        try:
+            # Every note read before target.md gets written and committed
+            # while the rebuild waits on it
+            for _ in range(100):
+                if conn.execute("SELECT COUNT(*) FROM notes_metadata").fetchone()[0] == 60:
+                    break
+                await asyncio.sleep(0.05)
+            assert conn.execute("SELECT COUNT(*) FROM notes_metadata").fetchone()[0] == 60
+            
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("ROLLBACK")
+        finally:
+            conn.close()
+        
+        release.set()
+        assert await rebuild == 61
+    
+    @pytest.mark.asyncio
+    async def test_save_during_rebuild_is_indexed_after_it(self, vault, paused_rebuild, caplog):
+        """Test a note saved mid-rebuild ends up indexed with its new content."""
+        rebuild, release = paused_rebuild
+        fts = await get_fts_search()
+        
+        await vault.write_note("target.md", "fresh words", overwrite=True)
+        await index_updater.update_index_for_file("target.md")
+        flush = asyncio.create_task(index_updater.flush_index_updates())
+        await asyncio.sleep(0.05)
+        assert not flush.done()  # waiting for the rebuild
+        
+        release.set()
+        assert await rebuild == 61
+        await flush
+        
+        assert [result["path"] for result in await fts.search("fresh")] == ["target.md"]
+        assert await fts.search("stale") == []
+        assert (await fts.get_stats())["total_files"] == 61
+        assert "database is locked" not in caplog.text
@@ -0,0 +1,130 @@
+"""Tests for the debounced FTS index updates made after note saves."""
+
+import asyncio
+import pytest
+import pytest_asyncio
+from obsidianpilot.models import NoteMetadata
+from obsidianpilot.utils import index_updater
+from obsidianpilot.utils.fts_search import get_fts_search
+from obsidianpilot.utils.index_updater import update_index_for_file, flush_index_updates
+
+
+@pytest_asyncio.fixture
+async def fts(vault, monkeypatch):
+    """Built (non-empty) index for the test vault, counting its commits."""
+    index = await get_fts_search()
+    await index.index_file("seed.md", "seed", NoteMetadata())
+    
+    index.commits = 0
+    commit = index.db.commit
+    
+    async def counting_commit():
+        index.commits += 1
+        await commit()
+    monkeypatch.setattr(index.db, "commit", counting_commit)
+    return index
+
+
+async def _indexed(fts, word):
+    """Paths the index returns for word, sorted."""
+    return sorted(result["path"] for result in await fts.search(word))
+
+
+class TestDebouncedUpdates:
+    """Test that saves close together are indexed in one commit."""
+    
+    @pytest.mark.asyncio
+    async def test_burst_of_saves_commits_once(self, vault, fts):
+        """Test several saves within INDEX_UPDATE_DELAY produce a single commit."""
+        for name in ("a", "b", "c"):
+            await vault.write_note(f"{name}.md", f"burst {name}")
+            await update_index_for_file(f"{name}.md")
+        # Saving the same note again only queues it once
+        await vault.write_note("a.md", "burst a again", overwrite=True)
+        await update_index_for_file("a.md")
+        
+        assert fts.commits == 0
+        await asyncio.wait_for(index_updater._flush_task, timeout=10)
+        
+        assert fts.commits == 1
+        assert await _indexed(fts, "burst") == ["a.md", "b.md", "c.md"]
+        assert await _indexed(fts, "again") == ["a.md"]
+    
+    @pytest.mark.asyncio
+    async def test_saves_after_flush_start_a_new_batch(self, vault, fts):
+        """Test a save arriving after a flush is indexed by the next one."""
+        await vault.write_note("a.md", "first wave")
+        await update_index_for_file("a.md")
+        await asyncio.wait_for(index_updater._flush_task, timeout=10)
+        
+        await vault.write_note("b.md", "second wave")
+        await update_index_for_file("b.md")
+        await asyncio.wait_for(index_updater._flush_task, timeout=10)
+        
+        assert fts.commits == 2
+        assert await _indexed(fts, "wave") == ["a.md", "b.md"]
+    
+    @pytest.mark.asyncio
+    async def test_flush_writes_immediately(self, vault, fts):
+        """Test flush_index_updates indexes queued saves without waiting for the delay."""
+        await vault.write_note("a.md", "urgent note")
+        await update_index_for_file("a.md")
+        
+        await flush_index_updates()
+        
+        assert index_updater._pending_updates == {}
+        assert fts.commits == 1
+        assert await _indexed(fts, "urgent") == ["a.md"]
+        
+        # The delayed flush then finds nothing left to do
+        await asyncio.wait_for(index_updater._flush_task, timeout=10)
+        assert fts.commits == 1
+    
+    @pytest.mark.asyncio
+    async def test_excluded_folders_are_not_queued(self, vault, fts):
+        """Test saves under .trash and .obsidian are ignored."""
+        await update_index_for_file(".trash/old.md")
+        await update_index_for_file("sub/.obsidian/config.md")
+        
+        assert index_updater._pending_updates == {}
+
+
+class TestFailedFiles:
+    """Test that one bad file doesn't lose the rest of its batch."""
+    
+    @pytest.mark.asyncio
+    async def test_unreadable_file_is_skipped(self, vault, fts, caplog):
+        """Test a note deleted before the flush is skipped and the others indexed."""
+        await vault.write_note("a.md", "survivor a")
+        await vault.write_note("gone.md", "survivor gone")
+        await vault.write_note("b.md", "survivor b")
+        for path in ("a.md", "gone.md", "b.md"):
+            await update_index_for_file(path)
+        await vault.delete_note("gone.md")
+        
+        await flush_index_updates()
+        
+        assert await _indexed(fts, "survivor") == ["a.md", "b.md"]
+        assert fts.commits == 1
+        assert "gone.md" in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_index_failure_is_skipped(self, vault, fts, monkeypatch, caplog):
+        """Test a note that fails to index doesn't stop the others being committed."""
+        index_file_no_commit = fts.index_file_no_commit
+        
+        async def failing_index(filepath, content, metadata):
+            if filepath == "bad.md":
+                raise ValueError("cannot index")
+            return await index_file_no_commit(filepath, content, metadata)
+        monkeypatch.setattr(fts, "index_file_no_commit", failing_index)
+        
+        for path in ("a.md", "bad.md", "b.md"):
+            await vault.write_note(path, f"batch member {path}")
+            await update_index_for_file(path)
+        
+        await flush_index_updates()
+        
+        assert await _indexed(fts, "member") == ["a.md", "b.md"]
+        assert fts.commits == 1
+        assert "bad.md" in caplog.text
@@ -0,0 +1,331 @@
+"""Tests for the search and discovery tools."""
+
+import asyncio
+import gc
+import os
+import re
+import time
+import pytest
+import pytest_asyncio
+from obsidianpilot.tools import search_discovery
+from obsidianpilot.tools.search_discovery import (
+    _search_by_tag, search_by_properties, _search_by_regex_filtered, _ripgrep_candidates,
+    _search_by_regex_pooled, _required_literal, _shutdown_regex_pool
+)
+
+
+async def _tagged(vault, tag):
+    """Paths of the notes a tag search returns, sorted."""
+    return sorted(result["path"] for result in await _search_by_tag(vault, tag, 100))
+
+
+class TestTagSearch:
+    """Test that tag searches follow edits through the tag index."""
+    
+    @pytest.mark.asyncio
+    async def test_hierarchical_matches(self, vault):
+        """Test parent, child and exact matches of nested tags."""
+        await vault.write_note("web.md", "Site work #project/web")
+        await vault.write_note("mobile.md", "---\ntags: [project/mobile]\n---\n\nApp work")
+        await vault.write_note("design.md", "Mockups #design/web")
+        await vault.write_note("plain.md", "No tags here")
+        
+        assert await _tagged(vault, "project") == ["mobile.md", "web.md"]
+        assert await _tagged(vault, "web") == ["design.md", "web.md"]
+        assert await _tagged(vault, "project/web") == ["web.md"]
+        assert await _tagged(vault, "proj") == []
+    
+    @pytest.mark.asyncio
+    async def test_added_tag_is_found(self, vault):
+        """Test a tag added to a note shows up in the next search."""
+        await vault.write_note("a.md", "#alpha")
+        await vault.write_note("b.md", "nothing yet")
+        assert await _tagged(vault, "alpha") == ["a.md"]
+        
+        await vault.write_note("b.md", "now tagged #alpha/child", overwrite=True)
+        assert await _tagged(vault, "alpha") == ["a.md", "b.md"]
+        assert await _tagged(vault, "child") == ["b.md"]
+    
+    @pytest.mark.asyncio
+    async def test_removed_tag_is_dropped(self, vault):
+        """Test a tag removed from a note, or a deleted note, drops out of the next search."""
+        await vault.write_note("a.md", "---\ntags: [alpha/one]\n---\n\nText #beta")
+        await vault.write_note("b.md", "#alpha/two")
+        assert await _tagged(vault, "alpha") == ["a.md", "b.md"]
+        
+        await vault.write_note("a.md", "Text #beta", overwrite=True)
+        assert await _tagged(vault, "alpha") == ["b.md"]
+        assert await _tagged(vault, "beta") == ["a.md"]
+        
+        await vault.delete_note("b.md")
+        assert await _tagged(vault, "alpha") == []
+    
+    @pytest.mark.asyncio
+    async def test_renamed_tag_moves(self, vault):
+        """Test renaming a parent tag updates parent and child searches."""
+        await vault.write_note("a.md", "Plan #project/web")
+        assert await _tagged(vault, "project") == ["a.md"]
+        
+        await vault.write_note("a.md", "Plan #client/web", overwrite=True)
+        assert await _tagged(vault, "project") == []
+        assert await _tagged(vault, "client") == ["a.md"]
+        assert await _tagged(vault, "web") == ["a.md"]
+    
+    @pytest.mark.asyncio
+    async def test_same_size_edit_within_mtime_tick(self, vault):
+        """Test an edit that keeps the size and mtime (coarse timestamps) is still seen."""
+        path = vault.vault_path / "a.md"
+        stamp = time.time_ns()
+        await vault.write_note("a.md", "#aaaa")
+        os.utime(path, ns=(stamp, stamp))
+        assert await _tagged(vault, "aaaa") == ["a.md"]
+        
+        await vault.write_note("a.md", "#bbbb", overwrite=True)
+        os.utime(path, ns=(stamp, stamp))
+        assert await _tagged(vault, "aaaa") == []
+        assert await _tagged(vault, "bbbb") == ["a.md"]
+
+
+@pytest_asyncio.fixture
+async def property_vault(vault):
+    """Vault with notes carrying a mix of frontmatter properties."""
+    await vault.write_note("a.md", "---\nstatus: active\npriority: 5\nauthor: John Smith\ndue: 2024-06-01\n---\n\nAlpha")
+    await vault.write_note("b.md", "---\nstatus: Active\npriority: 2\n---\n\nBeta")
+    await vault.write_note("c.md", "---\nstatus: done\npriority: 4\ndue: 2025-01-15\n---\n\nGamma")
+    await vault.write_note("d.md", "---\npriority: 9\n---\n\nDelta")
+    await vault.write_note("e.md", "No frontmatter")
+    return vault
+
+
+async def _matching(filters):
+    """Paths search_by_properties returns for filters, in result order."""
+    return [result["path"] for result in (await search_by_properties(filters))["results"]]
+
+
+class TestSearchByProperties:
+    """Test combined property filters over the manual scan."""
+    
+    @pytest.mark.asyncio
+    async def test_filters_are_anded(self, property_vault):
+        """Test a note must satisfy every filter, and have every property."""
+        assert await _matching([
+            {"property": "status", "value": "active"},
+            {"property": "priority", "operator": ">", "value": "3"}
+        ]) == ["a.md"]
+        assert await _matching([
+            {"property": "status", "value": "active"},
+            {"property": "priority", "operator": ">", "value": "1"}
+        ]) == ["a.md", "b.md"]
+        # d.md has a priority but no status
+        assert await _matching([
+            {"property": "status", "operator": "exists"},
+            {"property": "priority", "operator": ">=", "value": "4"}
+        ]) == ["a.md", "c.md"]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("property_filter,expected", [
+        ({"property": "status", "value": "ACTIVE"}, ["a.md", "b.md"]),
+        ({"property": "status", "operator": "equals", "value": "done"}, ["c.md"]),
+        ({"property": "status", "operator": "!=", "value": "active"}, ["c.md"]),
+        ({"property": "priority", "operator": ">", "value": "4"}, ["a.md", "d.md"]),
+        ({"property": "priority", "operator": ">=", "value": "4"}, ["a.md", "c.md", "d.md"]),
+        ({"property": "priority", "operator": "<", "value": "4"}, ["b.md"]),
+        ({"property": "priority", "operator": "<=", "value": "4"}, ["b.md", "c.md"]),
+        ({"property": "author", "operator": "contains", "value": "john"}, ["a.md"]),
+        ({"property": "due", "operator": "<", "value": "2024-12-31"}, ["a.md"]),
+        ({"property": "status", "operator": "exists"}, ["a.md", "b.md", "c.md"]),
+    ])
+    async def test_operators(self, property_vault, property_filter, expected):
+        """Test each operator on its own."""
+        assert await _matching([property_filter]) == expected
+    
+    @pytest.mark.asyncio
+    async def test_result_shape(self, property_vault):
+        """Test results carry every filtered property's value."""
+        result = await search_by_properties([
+            {"property": "status", "value": "active"},
+            {"property": "priority", "operator": ">", "value": "3"}
+        ])
+        
+        assert result["count"] == 1
+        assert result["truncated"] is False
+        assert result["query"]["search_method"] == "manual_batch"
+        assert result["results"][0]["property_values"] == {"status": "active", "priority": 5}
+        assert result["results"][0]["matches"] == ["status = active", "priority > 3"]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filters", [
+        [],
+        [{"property": "status", "operator": "~", "value": "active"}],
+        [{"operator": "=", "value": "active"}],
+    ])
+    async def test_invalid_filters(self, property_vault, filters):
+        """Test empty filter lists, unknown operators and missing names are rejected."""
+        with pytest.raises(ValueError):
+            await search_by_properties(filters)
+    
+    @pytest.mark.asyncio
+    async def test_truncated_at_cap(self, vault, monkeypatch):
+        """Test results stop at MANUAL_PROPERTY_MAX_RESULTS and report truncation."""
+        for i in range(7):
+            await vault.write_note(f"note{i}.md", f"---\nstatus: active\n---\n\nNote {i}")
+        monkeypatch.setattr(search_discovery, "MANUAL_PROPERTY_MAX_RESULTS", 3)
+        
+        result = await search_by_properties([{"property": "status", "value": "active"}])
+        
+        paths = [r["path"] for r in result["results"]]
+        assert result["count"] == len(paths) == 3
+        assert result["truncated"] is True
+        assert paths == sorted(paths)
+        
+        monkeypatch.setattr(search_discovery, "MANUAL_PROPERTY_MAX_RESULTS", 10)
+        result = await search_by_properties([{"property": "status", "value": "active"}])
+        assert result["count"] == 7
+        assert result["truncated"] is False
+
+
+class TestRegexReadAhead:
+    """Test the in-process regex scan's read-ahead window."""
+    
+    @staticmethod
+    def _pending_reads():
+        """Read-ahead tasks of the regex scan that haven't finished."""
+        return [
+            task for task in asyncio.all_tasks()
+            if not task.done() and "_search_by_regex_filtered" in task.get_coro().__qualname__
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_no_reads_left_running(self, vault):
+        """Test reads past the max_results cut-off have finished when the search returns."""
+        for i in range(20):
+            await vault.write_note(f"note{i:02}.md", f"match {i}")
+        notes_list = [{"path": f"note{i:02}.md"} for i in range(20)]
+        
+        results = await _search_by_regex_filtered(vault, notes_list, re.compile(r"match \d+"), 50, 1)
+        
+        assert [result["path"] for result in results] == ["note00.md"]
+        assert self._pending_reads() == []
+    
+    @pytest.mark.asyncio
+    async def test_failed_reads_past_cutoff_are_collected(self, vault):
+        """Test reads that fail after max_results is reached don't log unretrieved exceptions."""
+        await vault.write_note("a.md", "match 123")
+        notes_list = [{"path": "a.md"}] + [{"path": f"gone{i}.md"} for i in range(10)]
+        
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        try:
+            results = await _search_by_regex_filtered(vault, notes_list, re.compile(r"\d+"), 50, 1)
+            await asyncio.sleep(0)
+            gc.collect()
+            await asyncio.sleep(0)
+        finally:
+            loop.set_exception_handler(None)
+        
+        assert [result["path"] for result in results] == ["a.md"]
+        assert errors == []
+
+
+@pytest.mark.skipif(search_discovery._RIPGREP is None, reason="ripgrep not installed")
+class TestRipgrepPrefilter:
+    """Test that the ripgrep prefilter doesn't change regex search results."""
+    
+    @pytest_asyncio.fixture
+    async def regex_vault(self, vault):
+        """Vault where some notes contain the literal 'needle' and some don't."""
+        for i in range(30):
+            body = f"needle {i} in a haystack" if i % 3 == 0 else f"plain note {i}"
+            await vault.write_note(f"Notes/Sub{i % 4}/note{i:02}.md", body)
+        await vault.write_note("Notes/needle-only-in-name.md", "nothing here")
+        return vault
+    
+    async def _search(self, vault, monkeypatch, prefilter):
+        """Run the directory-scoped regex search with or without the prefilter."""
+        monkeypatch.setattr(search_discovery, "RIPGREP_MIN_NOTES", 1 if prefilter else 10**9)
+        notes_list = await vault.list_notes("Notes")
+        return await _search_by_regex_filtered(vault, notes_list, re.compile(r"needle \d+"), 50, 100, "Notes")
+    
+    @pytest.mark.asyncio
+    async def test_prefiltered_equals_unfiltered(self, regex_vault, monkeypatch):
+        """Test prefiltered and unfiltered scans return the same results."""
+        unfiltered = await self._search(regex_vault, monkeypatch, prefilter=False)
+        prefiltered = await self._search(regex_vault, monkeypatch, prefilter=True)
+        
+        assert len(unfiltered) == 10
+        key = lambda result: result["path"]
+        assert sorted(prefiltered, key=key) == sorted(unfiltered, key=key)
+    
+    @pytest.mark.asyncio
+    async def test_extension_case_ignored(self, vault):
+        """Test notes with an upper-case .MD extension aren't filtered out."""
+        (vault.vault_path / "Notes").mkdir()
+        (vault.vault_path / "Notes" / "Lower.md").write_text("needle", encoding="utf-8")
+        (vault.vault_path / "Notes" / "Upper.MD").write_text("needle", encoding="utf-8")
+        (vault.vault_path / "Notes" / "Other.txt").write_text("needle", encoding="utf-8")
+        
+        found = await _ripgrep_candidates(vault.vault_path, "Notes", "needle")
+        
+        assert found == {os.path.join("Notes", "Lower.md"), os.path.join("Notes", "Upper.MD")}
+
+
+class TestRegexPool:
+    """Test that the worker-process regex scan matches the in-process one."""
+    
+    @pytest_asyncio.fixture
+    async def pooled_vault(self, vault):
+        """Vault of notes with varying numbers of matches; stops the pool afterwards."""
+        for i in range(150):
+            body = "\n".join(f"line {j}: item-{i * j}" for j in range(i % 7))
+            await vault.write_note(f"Notes/note{i:03}.md", f"# Note {i}\n{body}")
+        yield vault
+        _shutdown_regex_pool()
+    
+    @staticmethod
+    def _by_path(results):
+        """Results keyed by path, for comparing scans that order ties differently."""
+        return {result["path"]: result for result in results}
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pattern", [r"item-(\d*7)\b", r"line \d+: item-1\d"])
+    async def test_pooled_equals_in_process(self, pooled_vault, monkeypatch, pattern):
+        """Test the pooled scan returns the in-process scan's results."""
+        notes_list = await pooled_vault.list_notes("Notes")
+        regex = re.compile(pattern)
+        
+        monkeypatch.setattr(search_discovery, "REGEX_POOL_MIN_NOTES", 10**9)
+        in_process = await _search_by_regex_filtered(pooled_vault, notes_list, regex, 40, 500, "Notes")
+        pooled = await _search_by_regex_pooled(pooled_vault, notes_list, regex, 40, 500, _required_literal(regex))
+        
+        assert in_process
+        assert self._by_path(pooled) == self._by_path(in_process)
+    
+    @pytest.mark.asyncio
+    async def test_pooled_cutoff_picks_same_notes(self, pooled_vault, monkeypatch):
+        """Test max_results keeps the same notes in both scans."""
+        notes_list = await pooled_vault.list_notes("Notes")
+        regex = re.compile(r"item-\d+")
+        
+        monkeypatch.setattr(search_discovery, "REGEX_POOL_MIN_NOTES", 10**9)
+        in_process = await _search_by_regex_filtered(pooled_vault, notes_list, regex, 40, 20, "Notes")
+        pooled = await _search_by_regex_pooled(pooled_vault, notes_list, regex, 40, 20, _required_literal(regex))
+        
+        assert len(pooled) == 20
+        assert self._by_path(pooled) == self._by_path(in_process)
+    
+    @pytest.mark.asyncio
+    async def test_search_uses_pool_above_threshold(self, pooled_vault, monkeypatch):
+        """Test a scope over REGEX_POOL_MIN_NOTES goes through the pool and keeps its results."""
+        notes_list = await pooled_vault.list_notes("Notes")
+        regex = re.compile(r"item-(\d*7)\b")
+        
+        monkeypatch.setattr(search_discovery, "REGEX_POOL_MIN_NOTES", 10**9)
+        in_process = await _search_by_regex_filtered(pooled_vault, notes_list, regex, 40, 500, "Notes")
+        monkeypatch.setattr(search_discovery, "REGEX_POOL_MIN_NOTES", 1)
+        pooled = await _search_by_regex_filtered(pooled_vault, notes_list, regex, 40, 500, "Notes")
+        
+        assert self._by_path(pooled) == self._by_path(in_process)
+        if (os.cpu_count() or 1) > 1:
+            assert search_discovery._REGEX_POOL is not None
+            assert search_discovery._REGEX_POOL._max_workers <= search_discovery.REGEX_POOL_MAX_WORKERS